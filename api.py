@@ -81,9 +81,14 @@ Examples:
         print(f"   GET  /api/departments/{{id}} - Get specific department")
         print(f"   GET  /api/courses/{{id}}     - Get specific course")
         print(f"   GET  /api/offerings/...    - Get course offerings")
+        print(f"   GET  /api/search?q=...     - Full-text search")
+        print(f"   GET  /api/autocomplete?q=... - Course id typeahead")
+        print(f"   POST /api/offerings/{{sem}}/conflicts - Check section conflicts")
         print(f"   POST /api/generate-schedule - Generate class schedule")
+        print(f"   POST /api/build-student-schedule - Conflict-free section search")
         print(f"   POST /api/generate-syllabus - Generate syllabus content")
         print(f"   POST /api/export-syllabus  - Export syllabus file")
+        print(f"   POST /api/admin/reload     - Reload indexes (loopback only)")
         
         # Run the application
         app.run(
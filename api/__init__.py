@@ -7,9 +7,13 @@ from flask_cors import CORS
 from .config import get_config
 from .blueprints import (
     config_bp, departments_bp, courses_bp, offerings_bp,
-    schedule_bp, syllabus_bp, health_bp
+    schedule_bp, syllabus_bp, health_bp, search_bp, admin_bp
 )
 from core.data_loader import DepartmentDataLoader
+from core.search_index import SearchIndex
+from core.autocomplete import build_autocomplete_index
+from core.file_writer import CHANGE_MANIFEST_NAME
+from .services.index_reload_service import IndexReloadService
 
 def create_app(config_name=None):
     """
@@ -33,11 +37,53 @@ def create_app(config_name=None):
     # Initialize data loader and attach to app
     try:
         app.data_loader = DepartmentDataLoader(app.config['DATA_DIR'])
+        app.semester_registry = app.data_loader.semester_registry
         app.logger.info(f"Data loader initialized with directory: {app.config['DATA_DIR']}")
     except Exception as e:
         app.logger.error(f"Failed to initialize data loader: {str(e)}")
         raise
     
+    # Build in-memory search index once at startup
+    try:
+        app.search_index = SearchIndex(
+            app.data_loader,
+            os.path.join(app.config['DATA_DIR'], 'program_overviews.json')
+        ).build()
+        app.logger.info(f"Search index built with {len(app.search_index)} documents")
+    except Exception as e:
+        app.logger.error(f"Failed to build search index: {str(e)}")
+        raise
+    
+    # Build typeahead index from departments and the current semester's sections
+    try:
+        semesters = app.data_loader.get_semesters()
+        current_semester = app.config.get('CURRENT_SEMESTER') or (semesters[-1] if semesters else None)
+        app.autocomplete_semester = current_semester
+        app.autocomplete_index = build_autocomplete_index(app.data_loader, current_semester)
+        app.logger.info(f"Autocomplete index built with {len(app.autocomplete_index)} entries for {current_semester}")
+    except Exception as e:
+        app.logger.error(f"Failed to build autocomplete index: {str(e)}")
+        raise
+    
+    # Follow file changes from scrapers and calendar generators without a restart
+    app.file_watcher = None
+    if app.config.get('WATCH_FILES'):
+        try:
+            app.file_watcher = IndexReloadService(app).watch(
+                {
+                    'departments': os.path.join(app.config['DATA_DIR'], 'departments'),
+                    'semesters': os.path.join(app.config['DATA_DIR'], 'semesters'),
+                    'calendars': app.config['CALENDARS_DIR'],
+                    'templates': app.config['TEMPLATE_DIR']
+                },
+                interval=app.config.get('WATCH_INTERVAL', 1.0),
+                backend=app.config.get('WATCH_BACKEND', 'auto'),
+                manifest_path=os.path.join(app.config['DATA_DIR'], CHANGE_MANIFEST_NAME)
+            )
+            app.logger.info(f"Watching data files with the {app.file_watcher.backend.name} backend")
+        except Exception as e:
+            app.logger.error(f"Failed to start file watcher: {str(e)}")
+    
     # Register blueprints
     app.register_blueprint(config_bp)
     app.register_blueprint(departments_bp)
@@ -46,6 +92,8 @@ def create_app(config_name=None):
     app.register_blueprint(schedule_bp)
     app.register_blueprint(syllabus_bp)
     app.register_blueprint(health_bp)
+    app.register_blueprint(search_bp)
+    app.register_blueprint(admin_bp)
     
     # Register error handlers
     register_error_handlers(app)
@@ -8,6 +8,8 @@ from .offerings_bp import offerings_bp
 from .schedule_bp import schedule_bp
 from .syllabus_bp import syllabus_bp
 from .health_bp import health_bp
+from .search_bp import search_bp
+from .admin_bp import admin_bp
 
 __all__ = [
     'config_bp',
@@ -16,5 +18,7 @@ __all__ = [
     'offerings_bp', 
     'schedule_bp',
     'syllabus_bp',
-    'health_bp'
+    'health_bp',
+    'search_bp',
+    'admin_bp'
 ]
\ No newline at end of file
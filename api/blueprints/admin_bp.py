@@ -0,0 +1,47 @@
+"""
+Admin endpoints blueprint (loopback callers holding the admin token only)
+"""
+import hmac
+from flask import Blueprint, request, current_app
+from ..services.index_reload_service import IndexReloadService
+from ..utils.response_helpers import success_response, error_response
+from ..utils.validators import validate_department_code, validate_semester_format
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
+
+LOOPBACK_ADDRESSES = ('127.0.0.1', '::1')
+ADMIN_TOKEN_HEADER = 'X-Admin-Token'
+
+@admin_bp.before_request
+def require_admin():
+    """Reject admin calls without the configured token or not from this machine"""
+    # Behind a reverse proxy every caller looks local, so the token is what authorizes
+    token = current_app.config.get('ADMIN_TOKEN')
+    if not token:
+        return error_response('Admin endpoints are disabled: ADMIN_TOKEN is not configured', 403)
+    supplied = request.headers.get(ADMIN_TOKEN_HEADER, '')
+    if not hmac.compare_digest(supplied.encode('utf-8'), token.encode('utf-8')):
+        return error_response('Missing or invalid admin token', 401)
+    if request.remote_addr not in LOOPBACK_ADDRESSES:
+        return error_response('Admin endpoints are only available locally', 403)
+
+@admin_bp.route('/reload', methods=['POST'])
+def reload_indexes():
+    """Hot-reload indexes for changed departments or semester files"""
+    try:
+        data = request.get_json(silent=True) or {}
+        semester = data.get('semester')
+        departments = data.get('departments')
+        
+        if semester is not None and not (isinstance(semester, str) and validate_semester_format(semester)):
+            return error_response('Invalid semester format. Expected format: YY_SEASON (e.g., 25_FA)', 400)
+        if departments is not None:
+            if not isinstance(departments, list) or not all(
+                    isinstance(code, str) and validate_department_code(code) for code in departments):
+                return error_response('departments must be a list of department codes', 400)
+        
+        result = IndexReloadService(current_app._get_current_object()).reload(semester, departments)
+        return success_response(result)
+        
+    except Exception as e:
+        return error_response(f'Error reloading indexes: {str(e)}', 500)
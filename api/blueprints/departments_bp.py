@@ -52,16 +52,10 @@ def get_department_stats(dept_code):
         
         dept_service = DepartmentService(current_app.data_loader)
         
-        if not dept_service.department_exists(dept_code.upper()):
+        stats = dept_service.get_department_stats(dept_code.upper())
+        if not stats:
             return error_response('Department not found', 404)
         
-        course_count = dept_service.get_department_course_count(dept_code.upper())
-        
-        stats = {
-            'department_code': dept_code.upper(),
-            'course_count': course_count
-        }
-        
         return success_response(stats)
         
     except Exception as e:
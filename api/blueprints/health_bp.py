@@ -60,16 +60,9 @@ def detailed_health_check():
         
         # Count available semesters
         try:
-            data_dir = current_app.config['DATA_DIR']
-            semesters_dir = os.path.join(data_dir, 'semesters')
-            if os.path.exists(semesters_dir):
-                semester_folders = [f for f in os.listdir(semesters_dir) 
-                                  if os.path.isdir(os.path.join(semesters_dir, f))]
-                detailed_data['semesters_count'] = len(semester_folders)
-                detailed_data['available_semesters'] = semester_folders
-            else:
-                detailed_data['semesters_count'] = 0
-                detailed_data['available_semesters'] = []
+            semester_folders = current_app.semester_registry.semester_codes()
+            detailed_data['semesters_count'] = len(semester_folders)
+            detailed_data['available_semesters'] = semester_folders
         except Exception:
             detailed_data['semesters_count'] = 'error'
             detailed_data['available_semesters'] = 'error'
@@ -1,10 +1,13 @@
 """
 Course offerings endpoints blueprint
 """
-from flask import Blueprint, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app
 from ..services.course_service import CourseService
 from ..utils.response_helpers import success_response, error_response
-from ..utils.validators import validate_semester_format, validate_department_code, validate_course_number
+from ..utils.validators import (
+    validate_semester_format, validate_department_code, validate_course_number,
+    validate_section_code
+)
 
 offerings_bp = Blueprint('offerings', __name__, url_prefix='/api/offerings')
 
@@ -62,4 +65,65 @@ def get_department_offerings(semester, dept_code):
         })
         
     except Exception as e:
-        return error_response(f'Error loading department offerings: {str(e)}', 500)
\ No newline at end of file
+        return error_response(f'Error loading department offerings: {str(e)}', 500)
+
+@offerings_bp.route('/<semester>/sections/<section_code>/overlaps', methods=['GET'])
+def get_overlapping_sections(semester, section_code):
+    """Get all sections whose meeting times overlap a given section"""
+    try:
+        if not validate_semester_format(semester):
+            return error_response('Invalid semester format. Expected: YY_SEASON (e.g., 25_FA)', 400)
+        
+        if not validate_section_code(section_code.upper()):
+            return error_response('Invalid section code format', 400)
+        
+        course_service = CourseService(
+            current_app.data_loader,
+            current_app.config['DATA_DIR']
+        )
+        
+        overlaps = course_service.get_overlapping_offerings(semester, section_code.upper())
+        if overlaps is None:
+            return error_response('Section not found or has no meeting times', 404)
+        
+        return success_response({
+            'section': section_code.upper(),
+            'semester': semester,
+            'overlaps': overlaps,
+            'count': len(overlaps)
+        })
+        
+    except Exception as e:
+        return error_response(f'Error loading overlapping sections: {str(e)}', 500)
+
+@offerings_bp.route('/<semester>/conflicts', methods=['POST'])
+def check_section_conflicts(semester):
+    """Check a student's chosen sections for meeting time conflicts"""
+    try:
+        if not validate_semester_format(semester):
+            return error_response('Invalid semester format. Expected: YY_SEASON (e.g., 25_FA)', 400)
+        
+        data = request.get_json()
+        if not data:
+            return error_response('Request body is required', 400)
+        
+        sections = data.get('sections')
+        if not isinstance(sections, list) or not sections:
+            return error_response('sections must be a non-empty list', 400)
+        
+        section_codes = [str(code).upper() for code in sections]
+        invalid = [code for code in section_codes if not validate_section_code(code)]
+        if invalid:
+            return error_response(f"Invalid section codes: {', '.join(invalid)}", 400)
+        
+        course_service = CourseService(
+            current_app.data_loader,
+            current_app.config['DATA_DIR']
+        )
+        result = course_service.check_schedule_conflicts(semester, section_codes)
+        result['semester'] = semester
+        
+        return success_response(result)
+        
+    except Exception as e:
+        return error_response(f'Error checking section conflicts: {str(e)}', 500)
@@ -1,10 +1,13 @@
 """
 Schedule generation endpoints blueprint
 """
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from ..services.schedule_service import ScheduleService
+from ..services.student_schedule_service import StudentScheduleService
 from ..utils.response_helpers import success_response, error_response, validation_error_response
-from ..utils.validators import validate_schedule_request
+from ..utils.validators import (
+    validate_schedule_request, validate_schedule_export_request, validate_student_schedule_request
+)
 
 schedule_bp = Blueprint('schedule', __name__, url_prefix='/api')
 
@@ -28,6 +31,7 @@ def generate_schedule():
         show_holidays = data.get('show_holidays', True)
         show_breaks = data.get('show_breaks', True)
         show_events = data.get('show_events', True)
+        segments = data.get('segments')
         
         # Generate schedule
         schedule_service = ScheduleService(current_app.config['DATA_DIR'])
@@ -37,7 +41,8 @@ def generate_schedule():
             date_format=date_format,
             show_holidays=show_holidays,
             show_breaks=show_breaks,
-            show_events=show_events
+            show_events=show_events,
+            segments=segments
         )
         
         return success_response(schedule_result, 'Schedule generated successfully')
@@ -45,4 +50,71 @@ def generate_schedule():
     except ValueError as e:
         return error_response(f'Invalid request data: {str(e)}', 400)
     except Exception as e:
-        return error_response(f'Error generating schedule: {str(e)}', 500)
\ No newline at end of file
+        return error_response(f'Error generating schedule: {str(e)}', 500)
+
+@schedule_bp.route('/export-schedule-ics', methods=['POST'])
+def export_schedule_ics():
+    """Export class meeting dates as an iCalendar (.ics) file"""
+    try:
+        data = request.get_json()
+        if not data:
+            return error_response('Request body is required', 400)
+        
+        # Validate request data
+        validation_errors = validate_schedule_export_request(data)
+        if validation_errors:
+            return validation_error_response(validation_errors)
+        
+        schedule_service = ScheduleService(current_app.config['DATA_DIR'])
+        result = schedule_service.export_schedule_ics(
+            semester_year=data['semester_year'],
+            weekdays=data['weekdays'],
+            title=data.get('title', ''),
+            start_time=data.get('start_time', ''),
+            end_time=data.get('end_time', ''),
+            location=data.get('location', '')
+        )
+        
+        # Stream the calendar line by line from the interval model
+        return Response(
+            stream_with_context(result['content']),
+            mimetype='text/calendar',
+            headers={'Content-Disposition': f'attachment; filename="{result["filename"]}"'}
+        )
+        
+    except ValueError as e:
+        return error_response(f'Invalid request data: {str(e)}', 400)
+    except Exception as e:
+        return error_response(f'Error exporting schedule: {str(e)}', 500)
+
+@schedule_bp.route('/build-student-schedule', methods=['POST'])
+def build_student_schedule():
+    """Find conflict-free section combinations for a list of desired courses"""
+    try:
+        data = request.get_json()
+        if not data:
+            return error_response('Request body is required', 400)
+        
+        # Validate request data
+        validation_errors = validate_student_schedule_request(data)
+        if validation_errors:
+            return validation_error_response(validation_errors)
+        
+        student_schedule_service = StudentScheduleService(
+            current_app.data_loader,
+            current_app.config['DATA_DIR']
+        )
+        result = student_schedule_service.build_schedules(
+            semester=data['semester'],
+            courses=data['courses'],
+            max_results=data.get('max_results'),
+            time_limit=data.get('time_limit'),
+            open_only=data.get('open_only', False)
+        )
+        
+        return success_response(result, 'Student schedules built successfully')
+        
+    except ValueError as e:
+        return error_response(f'Invalid request data: {str(e)}', 400)
+    except Exception as e:
+        return error_response(f'Error building student schedules: {str(e)}', 500)
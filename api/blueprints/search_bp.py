@@ -0,0 +1,63 @@
+"""
+Search endpoints blueprint
+"""
+from flask import Blueprint, request, current_app
+from ..utils.response_helpers import success_response, error_response
+
+search_bp = Blueprint('search', __name__, url_prefix='/api')
+
+SEARCH_TYPES = ['course', 'department', 'program']
+
+@search_bp.route('/search', methods=['GET'])
+def search():
+    """Full-text search over courses, department missions and program overviews"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return error_response('Query parameter q is required', 400)
+        
+        doc_type = request.args.get('type')
+        if doc_type and doc_type not in SEARCH_TYPES:
+            return error_response(f"Invalid type. Supported: {', '.join(SEARCH_TYPES)}", 400)
+        
+        try:
+            limit = min(max(int(request.args.get('limit', 10)), 1), 50)
+        except ValueError:
+            return error_response('limit must be an integer', 400)
+        
+        prefix = request.args.get('prefix', 'true').lower() != 'false'
+        
+        # Kept current by the file watcher and /api/admin/reload, not per request
+        results = current_app.search_index.search(request.args.get('q', ''), limit=limit, doc_type=doc_type, prefix=prefix)
+        
+        return success_response({
+            'query': query,
+            'results': results,
+            'count': len(results)
+        })
+        
+    except Exception as e:
+        return error_response(f'Error searching: {str(e)}', 500)
+
+
+@search_bp.route('/autocomplete', methods=['GET'])
+def autocomplete():
+    """Typeahead completion for course ids, titles and section codes"""
+    try:
+        query = request.args.get('q', '')
+        
+        try:
+            limit = min(max(int(request.args.get('limit', 10)), 1), 50)
+        except ValueError:
+            return error_response('limit must be an integer', 400)
+        
+        suggestions = current_app.autocomplete_index.complete(query, limit=limit)
+        
+        return success_response({
+            'query': query,
+            'suggestions': suggestions,
+            'count': len(suggestions)
+        })
+        
+    except Exception as e:
+        return error_response(f'Error loading suggestions: {str(e)}', 500)
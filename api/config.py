@@ -7,6 +7,7 @@ class Config:
     """Base configuration"""
     DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
     TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), '..', 'templates')
+    CALENDARS_DIR = os.path.join(os.path.dirname(__file__), '..', 'calendars')
     DEBUG = False
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     
@@ -14,6 +15,18 @@ class Config:
     API_VERSION = '1.0.0'
     API_TITLE = 'Niagara University Scheduler API'
     
+    # Semester whose section codes feed autocomplete (defaults to the latest available)
+    CURRENT_SEMESTER = os.environ.get('CURRENT_SEMESTER')
+    
+    # Reload indexes when data, calendar or template files change on disk. Every gunicorn
+    # worker runs its own watcher (cheap with inotify) so each keeps its indexes current
+    WATCH_FILES = os.environ.get('WATCH_FILES', 'true').lower() not in ('0', 'false', 'no')
+    WATCH_BACKEND = os.environ.get('WATCH_BACKEND', 'auto')  # 'auto', 'inotify' or 'polling'
+    WATCH_INTERVAL = float(os.environ.get('WATCH_INTERVAL', '1.0'))
+    
+    # Shared secret for /api/admin endpoints (sent as X-Admin-Token); unset disables them
+    ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+    
     # CORS Configuration
     CORS_ORIGINS = ['http://localhost:5173', 'http://localhost:3000']
 
@@ -33,6 +46,7 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     DEBUG = True
+    WATCH_FILES = False
 
 config_map = {
     'development': DevelopmentConfig,
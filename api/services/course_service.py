@@ -4,6 +4,8 @@ Course service for handling course-related business logic
 import os
 import json
 from typing import List, Dict, Optional, Any
+from core.meeting_time import normalize_offering, find_conflicts
+from core.semester_registry import get_semester_registry
 
 class CourseService:
     """Service class for course operations"""
@@ -92,6 +94,7 @@ class CourseService:
                     
                     # Add schedule information if available
                     if 'days' in offering:
+                        normalize_offering(offering)
                         offering_data.update({
                             'days': offering.get('days', ''),
                             'start_time': offering.get('start_time', ''),
@@ -99,7 +102,9 @@ class CourseService:
                             'delivery_type': offering.get('delivery_type', ''),
                             'availability': offering.get('availability', ''),
                             'instructor': offering.get('instructor', ''),
-                            'location': offering.get('location', '')
+                            'location': offering.get('location', ''),
+                            'days_mask': offering['days_mask'],
+                            'meetings': offering['meetings']
                         })
                     
                     matching_offerings.append(offering_data)
@@ -111,6 +116,50 @@ class CourseService:
         except Exception as e:
             raise Exception(f'Error loading offerings from {offerings_file}: {str(e)}')
     
+    def get_overlapping_offerings(self, semester: str, section_code: str) -> Optional[List[str]]:
+        """
+        Get sections whose meeting times overlap a given section
+        
+        Args:
+            semester: Semester code (e.g., '25_FA')
+            section_code: Section code (e.g., 'THR103A')
+        
+        Returns:
+            Sorted list of overlapping section codes, or None if the section
+            has no meeting times in that semester
+        """
+        index = self.data_loader.get_meeting_index(semester)
+        if section_code not in index:
+            return None
+        return sorted(index.overlapping_key(section_code))
+    
+    def check_schedule_conflicts(self, semester: str, section_codes: List[str]) -> Dict[str, Any]:
+        """
+        Check a set of chosen sections for meeting time conflicts
+        
+        Args:
+            semester: Semester code (e.g., '25_FA')
+            section_codes: Section codes chosen by a student
+        
+        Returns:
+            Dictionary with conflicting pairs and sections that have no meeting times
+        """
+        index = self.data_loader.get_meeting_index(semester)
+        sections = {}
+        unscheduled = []
+        for code in section_codes:
+            if code in index:
+                sections[code] = index.meetings_for(code)
+            else:
+                unscheduled.append(code)
+        
+        conflicts = find_conflicts(sections)
+        return {
+            'conflicts': [{'sections': list(pair)} for pair in conflicts],
+            'has_conflicts': bool(conflicts),
+            'unscheduled': unscheduled
+        }
+    
     def get_available_semesters(self) -> List[str]:
         """
         Get list of available semesters from data directory
@@ -118,15 +167,7 @@ class CourseService:
         Returns:
             List of semester codes
         """
-        semesters_dir = os.path.join(self.data_dir, 'semesters')
-        available_semesters = []
-        
-        if os.path.exists(semesters_dir):
-            for semester_folder in os.listdir(semesters_dir):
-                if os.path.isdir(os.path.join(semesters_dir, semester_folder)):
-                    available_semesters.append(semester_folder)
-        
-        return sorted(available_semesters)
+        return sorted(get_semester_registry(self.data_dir).semester_codes())
     
     def course_has_offerings(self, semester: str, dept_code: str, course_number: str) -> bool:
         """
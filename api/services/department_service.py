@@ -22,16 +22,15 @@ class DepartmentService:
         Returns:
             List of department dictionaries
         """
-        departments = self.data_loader.get_all_departments()
         dept_list = []
         
-        for dept_code in departments:
-            dept = self.data_loader.load_department(dept_code)
-            if dept and dept.name:  # Only include departments with valid names
+        # Summaries come from the department manifest, so course bodies are never loaded
+        for summary in self.data_loader.get_department_summaries():
+            if summary['name']:  # Only include departments with valid names
                 dept_list.append({
-                    'code': dept_code,
-                    'name': dept.name,
-                    'mission_statement': dept.mission_statement
+                    'code': summary['code'],
+                    'name': summary['name'],
+                    'mission_statement': summary['mission_statement']
                 })
         
         # Sort departments by name for consistent ordering (handle None values)
@@ -80,7 +79,7 @@ class DepartmentService:
         Returns:
             True if department exists, False otherwise
         """
-        return dept_code in self.data_loader.get_all_departments()
+        return self.data_loader.department_exists(dept_code)
     
     def get_department_course_count(self, dept_code: str) -> int:
         """
@@ -92,5 +91,26 @@ class DepartmentService:
         Returns:
             Number of courses in the department, 0 if department not found
         """
-        dept = self.data_loader.load_department(dept_code)
-        return len(dept.courses) if dept else 0
\ No newline at end of file
+        summary = self.data_loader.get_department_summary(dept_code)
+        return summary['course_count'] if summary else 0
+    
+    def get_department_stats(self, dept_code: str) -> Optional[Dict[str, Any]]:
+        """
+        Get department statistics from the manifest without loading courses
+        
+        Args:
+            dept_code: Department code
+        
+        Returns:
+            Statistics dictionary, or None if department not found
+        """
+        summary = self.data_loader.get_department_summary(dept_code)
+        if not summary:
+            return None
+        
+        return {
+            'department_code': dept_code,
+            'name': summary['name'],
+            'course_count': summary['course_count'],
+            'content_hash': summary['content_hash']
+        }
\ No newline at end of file
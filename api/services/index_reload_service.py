@@ -0,0 +1,199 @@
+"""
+Index reload service for applying data changes to a running API
+"""
+import threading
+from typing import Dict, List, Optional, Any
+from core.autocomplete import build_autocomplete_index, update_autocomplete_index
+from core.data_loader import PROGRAM_OVERVIEWS_FILENAME
+from core.file_watcher import MANIFEST_AREA, FileWatcher
+
+# Serializes read-modify-swap updates of app.autocomplete_index (watcher and admin requests)
+_autocomplete_lock = threading.Lock()
+
+class IndexReloadService:
+    """Service class for hot-reloading in-memory indexes"""
+    
+    def __init__(self, app):
+        """
+        Initialize index reload service
+        
+        Args:
+            app: Flask application holding data_loader, search_index and autocomplete_index
+        """
+        self.app = app
+        self.data_loader = app.data_loader
+    
+    def reload(self, semester: Optional[str] = None, departments: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Reload only the indexes affected by changed files
+        
+        Args:
+            semester: Semester whose section files changed, or None for catalog departments
+            departments: Department codes whose files changed (None means all)
+        
+        Returns:
+            Dictionary describing what was reloaded
+        """
+        try:
+            reloaded = []
+            
+            if semester:
+                # Meeting indexes are rebuilt lazily on next use
+                self.data_loader.invalidate_semester(semester)
+                reloaded.append('meeting_index')
+                if semester == getattr(self.app, 'autocomplete_semester', None):
+                    self._update_autocomplete(departments)
+                    reloaded.append('autocomplete')
+            else:
+                if departments is None:
+                    # Re-index only changed, added or removed files (program overviews included)
+                    self.data_loader.invalidate_department()
+                    self.app.search_index.refresh(force=True)
+                else:
+                    for code in departments:
+                        self.data_loader.invalidate_department(code)
+                        self.app.search_index.index_department(code)
+                reloaded.extend(['department_manifest', 'search'])
+                self._update_autocomplete(departments)
+                reloaded.append('autocomplete')
+            
+            return {
+                'semester': semester,
+                'departments': departments,
+                'reloaded': reloaded
+            }
+        except Exception as e:
+            raise Exception(f'Error reloading indexes: {e}')
+    
+    def apply_changes(self, changes) -> Dict[str, Any]:
+        """
+        Invalidate or rebuild only the entries affected by a batch of file changes
+        
+        Args:
+            changes: core.file_watcher.FileChange events; an empty name stands
+                for "anything in the area changed"
+        
+        Returns:
+            Dictionary describing what was reloaded
+        """
+        try:
+            departments = set()
+            semesters = set()
+            all_departments = False
+            listings_changed = False
+            programs_changed = False
+            autocomplete_semester = getattr(self.app, 'autocomplete_semester', None)
+            # Departments whose files feed autocomplete; None once a whole area changed
+            autocomplete_departments = set()
+            
+            for change in changes:
+                if change.area == 'departments':
+                    if not change.name:
+                        all_departments = True
+                        autocomplete_departments = None
+                    elif change.name.endswith('.json') and '/' not in change.name:
+                        departments.add(change.name[:-5])
+                        if autocomplete_departments is not None:
+                            autocomplete_departments.add(change.name[:-5])
+                elif change.area == 'semesters':
+                    # The registry would only notice on its next directory stat; drop it now
+                    listings_changed = True
+                    semester = change.name.split('/', 1)[0]
+                    if semester:
+                        semesters.add(semester)
+                    else:
+                        semesters.update(self.data_loader.get_semesters())
+                    if semester == autocomplete_semester and change.name.endswith('.json') and not change.is_dir:
+                        if autocomplete_departments is not None:
+                            autocomplete_departments.add(change.name.split('/', 1)[1][:-5])
+                    elif not semester or semester == autocomplete_semester:
+                        autocomplete_departments = None
+                elif change.area == 'calendars':
+                    listings_changed = True
+                elif change.area == MANIFEST_AREA:
+                    # Scraper writes outside the watched areas, reported through the change manifest
+                    programs_changed = programs_changed or change.name == PROGRAM_OVERVIEWS_FILENAME
+                # Templates are read on every request, so they hold no cache
+            
+            reloaded = []
+            if listings_changed:
+                self.data_loader.semester_registry.invalidate()
+                reloaded.append('semester_registry')
+            
+            for semester in sorted(semesters):
+                self.data_loader.invalidate_semester(semester)
+            if semesters:
+                reloaded.append('meeting_index')
+            
+            if all_departments:
+                departments.update(self.data_loader.get_all_departments())
+                self.data_loader.invalidate_department()
+            for code in sorted(departments):
+                self.data_loader.invalidate_department(code)
+                self.app.search_index.index_department(code)
+            if departments:
+                reloaded.extend(['department_manifest', 'search'])
+            if programs_changed:
+                self.app.search_index.index_program_overviews()
+                reloaded.append('program_overviews')
+            
+            if autocomplete_departments is None:
+                self._rebuild_autocomplete()
+                reloaded.append('autocomplete')
+            elif autocomplete_departments:
+                self._update_autocomplete(sorted(autocomplete_departments))
+                reloaded.append('autocomplete')
+            
+            return {
+                'semesters': sorted(semesters),
+                'departments': sorted(departments),
+                'reloaded': reloaded
+            }
+        except Exception as e:
+            raise Exception(f'Error applying file changes: {e}')
+    
+    def watch(self, areas: Dict[str, str], interval: float = 1.0, backend: str = 'auto',
+              manifest_path: Optional[str] = None) -> FileWatcher:
+        """
+        Start a file watcher that applies changes to this application's indexes
+        
+        Args:
+            areas: Mapping of area name ('departments', 'semesters', 'calendars',
+                'templates') to directory
+            interval: Seconds between polls or waits for events
+            backend: 'auto', 'inotify' or 'polling'
+            manifest_path: Change manifest written by the scrapers (data/.changes.jsonl)
+        
+        Returns:
+            The started FileWatcher
+        """
+        watcher = FileWatcher(areas, interval=interval, backend=backend, manifest_path=manifest_path)
+        
+        def on_changes(changes):
+            try:
+                result = self.apply_changes(changes)
+                self.app.logger.info(f"Reloaded {', '.join(result['reloaded']) or 'nothing'} "
+                                     f"after {len(changes)} file change(s)")
+            except Exception as e:
+                self.app.logger.error(str(e))
+        
+        watcher.subscribe(on_changes)
+        return watcher.start()
+    
+    def _rebuild_autocomplete(self):
+        # Building aside and swapping keeps requests served from a complete index
+        with _autocomplete_lock:
+            self.app.autocomplete_index = build_autocomplete_index(
+                self.data_loader, getattr(self.app, 'autocomplete_semester', None)
+            )
+    
+    def _update_autocomplete(self, departments):
+        # Re-read only the changed departments into a copy, then swap it in
+        if departments is None:
+            self._rebuild_autocomplete()
+            return
+        with _autocomplete_lock:
+            self.app.autocomplete_index = update_autocomplete_index(
+                self.app.autocomplete_index, self.data_loader, departments,
+                getattr(self.app, 'autocomplete_semester', None)
+            )
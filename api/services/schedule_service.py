@@ -1,13 +1,18 @@
 """
 Schedule service for handling schedule generation business logic
 """
-import os
-from typing import List, Dict, Any, Tuple
+import datetime
+from typing import List, Dict, Any, Optional, Tuple
 from utilities.scheduler import (
     make_url, sorted_classes, schedule, date_formats,
     parse_registrar_table, fetch_registrar_table,
     discover_available_semesters
 )
+from core.calendar_loader import load_calendar_model
+from core.calendar_model import iter_ics
+from core.meeting_time import WEEKDAY_NAMES, parse_time
+from core.schedule_generator import ScheduleSegment, schedule_segments
+from core.semester_registry import get_semester_registry
 
 class ScheduleService:
     """Service class for schedule generation operations"""
@@ -28,15 +33,12 @@ class ScheduleService:
         Returns:
             List of semester dictionaries with key, semester, year, and display
         """
-        semesters_dir = os.path.join(self.data_dir, 'semesters')
         available_semesters = []
         
-        if os.path.exists(semesters_dir):
-            for semester_folder in os.listdir(semesters_dir):
-                if os.path.isdir(os.path.join(semesters_dir, semester_folder)):
-                    semester_info = self._parse_semester_code(semester_folder)
-                    if semester_info:
-                        available_semesters.append(semester_info)
+        for semester_folder in get_semester_registry(self.data_dir).semester_codes():
+            semester_info = self._parse_semester_code(semester_folder)
+            if semester_info:
+                available_semesters.append(semester_info)
         
         # Sort semesters by year and season
         available_semesters.sort(key=lambda x: (x['year'], x['semester']))
@@ -54,7 +56,8 @@ class ScheduleService:
     
     def generate_schedule(self, semester_year: str, weekdays: List[str], 
                          date_format: str = '', show_holidays: bool = True,
-                         show_breaks: bool = True, show_events: bool = True) -> Dict[str, Any]:
+                         show_breaks: bool = True, show_events: bool = True,
+                         segments: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Generate class schedule for given parameters
         
@@ -65,6 +68,9 @@ class ScheduleService:
             show_holidays: Include holidays in schedule
             show_breaks: Include breaks in schedule  
             show_events: Include other events in schedule
+            segments: Meeting patterns used instead of weekdays, each
+                {'weekdays': [...], 'start': 'YYYY-MM-DD', 'end': 'YYYY-MM-DD',
+                'label': 'Lab'} with start, end and label optional
         
         Returns:
             Dictionary with schedule data and metadata
@@ -79,36 +85,115 @@ class ScheduleService:
             # Get date format
             date_fmt = self._get_date_format(date_format)
             
-            # Generate schedule using scheduler utilities
             url = make_url(semester, year)
-            calendar_data = fetch_registrar_table(url, semester, year)
-            first_day, last_day, no_classes, events = parse_registrar_table(calendar_data)
-            possible_classes, no_classes = sorted_classes(weekdays, first_day, last_day, no_classes)
+            settings = {
+                'show_holidays': show_holidays,
+                'show_breaks': show_breaks,
+                'show_events': show_events
+            }
             
-            course_schedule = schedule(
-                possible_classes, no_classes, show_no=True, fmt=date_fmt, events=events,
-                show_holidays=show_holidays, show_breaks=show_breaks, show_events=show_events
-            )
+            if segments:
+                # Several meeting patterns merged over the shared semester calendar
+                calendar = load_calendar_model(url, semester, year)
+                meeting_segments = [self._parse_segment(segment) for segment in segments]
+                course_schedule = schedule_segments(
+                    calendar, meeting_segments, show_no=True, fmt=date_fmt, **settings
+                )
+                first_day = calendar.first_day.isoformat() if calendar.first_day else None
+                last_day = calendar.last_day.isoformat() if calendar.last_day else None
+                weekdays = [day for day in WEEKDAY_NAMES
+                            if any(day in segment.weekdays for segment in meeting_segments)]
+            else:
+                # Generate schedule using scheduler utilities
+                calendar_data = fetch_registrar_table(url, semester, year)
+                first_days, last_days, no_classes, events = parse_registrar_table(calendar_data)
+                possible_classes, no_classes = sorted_classes(weekdays, first_days, last_days, no_classes)
+                
+                course_schedule = schedule(
+                    possible_classes, no_classes, show_no=True, fmt=date_fmt, events=events, **settings
+                )
+                first_day = first_days[0].format('YYYY-MM-DD') if first_days else None
+                last_day = last_days[0].format('YYYY-MM-DD') if last_days else None
             
-            return {
+            result = {
                 'schedule': course_schedule,
                 'semester': semester,
                 'year': year,
                 'semester_code': semester_year,
-                'first_day': first_day.isoformat() if first_day else None,
-                'last_day': last_day.isoformat() if last_day else None,
+                'first_day': first_day,
+                'last_day': last_day,
                 'weekdays': weekdays,
                 'date_format': date_fmt,
-                'settings': {
-                    'show_holidays': show_holidays,
-                    'show_breaks': show_breaks,
-                    'show_events': show_events
-                }
+                'settings': settings
             }
+            if segments:
+                result['segments'] = [{
+                    'weekdays': list(segment.weekdays),
+                    'start': segment.start.isoformat() if segment.start else None,
+                    'end': segment.end.isoformat() if segment.end else None,
+                    'label': segment.label
+                } for segment in meeting_segments]
+            return result
             
         except Exception as e:
             raise Exception(f'Error generating schedule: {str(e)}')
     
+    def export_schedule_ics(self, semester_year: str, weekdays: List[str], title: str = '',
+                            start_time: str = '', end_time: str = '', location: str = '') -> Dict[str, Any]:
+        """
+        Build an iCalendar (.ics) export of a class's meeting dates
+        
+        Args:
+            semester_year: Semester code (e.g., '25_FA')
+            weekdays: List of weekdays for classes
+            title: Event title, e.g. the course id (defaults to 'Class')
+            start_time: Meeting start like '10:30AM'; all-day events when omitted
+            end_time: Meeting end like '11:20AM'
+            location: Optional meeting location
+        
+        Returns:
+            Dictionary with filename and content, an iterator of ics lines
+            
+        Raises:
+            Exception: If the semester calendar cannot be loaded
+        """
+        try:
+            semester, year = self._parse_semester_year(semester_year)
+            calendar = load_calendar_model(make_url(semester, year), semester, year)
+            summary = title.strip() or 'Class'
+            slug = ''.join(c if c.isalnum() else '-' for c in summary).strip('-').lower() or 'class'
+            
+            return {
+                'filename': f"{slug}_{semester}_{year}.ics",
+                'content': iter_ics(
+                    calendar, weekdays, summary,
+                    start_minutes=parse_time(start_time), end_minutes=parse_time(end_time),
+                    location=location, uid_prefix=f"{slug}-{semester_year.lower()}"
+                )
+            }
+            
+        except Exception as e:
+            raise Exception(f'Error exporting schedule: {str(e)}')
+    
+    def _parse_segment(self, segment: Dict[str, Any]) -> ScheduleSegment:
+        """
+        Convert a request segment into a ScheduleSegment
+        
+        Args:
+            segment: Dictionary with weekdays and optional start, end and label
+        
+        Returns:
+            ScheduleSegment with datetime.date bounds (None for the semester's own)
+        """
+        start = segment.get('start')
+        end = segment.get('end')
+        return ScheduleSegment(
+            weekdays=tuple(segment['weekdays']),
+            start=datetime.date.fromisoformat(start) if start else None,
+            end=datetime.date.fromisoformat(end) if end else None,
+            label=segment.get('label') or None
+        )
+    
     def _parse_semester_code(self, semester_folder: str) -> Dict[str, str]:
         """
         Parse semester folder name into readable format
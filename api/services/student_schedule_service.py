@@ -0,0 +1,111 @@
+"""
+Student schedule service for building conflict-free section combinations
+"""
+import re
+from typing import List, Dict, Any, Tuple
+from core.schedule_builder import find_schedules
+from .course_service import CourseService
+
+class StudentScheduleService:
+    """Service class for student schedule building operations"""
+
+    DEFAULT_MAX_RESULTS = 50
+    MAX_RESULTS_CAP = 500
+    DEFAULT_TIME_LIMIT = 2.0
+    TIME_LIMIT_CAP = 10.0
+
+    def __init__(self, data_loader, data_dir: str):
+        """
+        Initialize student schedule service
+
+        Args:
+            data_loader: DepartmentDataLoader instance
+            data_dir: Path to data directory
+        """
+        self.course_service = CourseService(data_loader, data_dir)
+
+    @staticmethod
+    def parse_course_id(course_id: str) -> Tuple[str, str]:
+        """
+        Split a course id like 'ENG 110' or 'ENG110' into department and number
+
+        Args:
+            course_id: Course identifier
+
+        Returns:
+            Tuple of (dept_code, course_number)
+
+        Raises:
+            ValueError: If the course id is not in a recognized format
+        """
+        match = re.match(r'^([A-Z]{2,4})\s*(\d{3,4})$', course_id.strip().upper())
+        if not match:
+            raise ValueError(f"Invalid course id: {course_id}")
+        return match.group(1), match.group(2)
+
+    def build_schedules(self, semester: str, courses: List[str], max_results: int = None,
+                        time_limit: float = None, open_only: bool = False) -> Dict[str, Any]:
+        """
+        Find conflict-free combinations of sections for the desired courses
+
+        Args:
+            semester: Semester code (e.g., '25_FA')
+            courses: Desired course ids (e.g., ['ENG 110', 'THR 103'])
+            max_results: Maximum number of schedules to return
+            time_limit: Maximum search time in seconds
+            open_only: Skip sections with no seats available
+
+        Returns:
+            Dictionary with schedules and search metadata
+        """
+        max_results = min(max_results or self.DEFAULT_MAX_RESULTS, self.MAX_RESULTS_CAP)
+        time_limit = min(time_limit or self.DEFAULT_TIME_LIMIT, self.TIME_LIMIT_CAP)
+
+        course_sections = {}
+        unavailable = []
+        for course_id in courses:
+            dept_code, course_number = self.parse_course_id(course_id)
+            key = f"{dept_code} {course_number}"
+            sections = self.course_service.get_course_offerings(semester, dept_code, course_number)
+            if open_only:
+                sections = [s for s in sections if self._has_open_seats(s)]
+            if sections:
+                course_sections[key] = sections
+            else:
+                unavailable.append(key)
+
+        if unavailable:
+            result = {'schedules': [], 'truncated': None, 'nodes_explored': 0, 'components': []}
+        else:
+            result = find_schedules(course_sections, max_results=max_results, time_limit=time_limit)
+
+        result['schedules'] = [
+            [self._section_summary(section) for section in schedule]
+            for schedule in result['schedules']
+        ]
+        result.update({
+            'semester': semester,
+            'courses': list(course_sections.keys()) + unavailable,
+            'unavailable_courses': unavailable,
+            'count': len(result['schedules'])
+        })
+        return result
+
+    def _has_open_seats(self, section: Dict[str, Any]) -> bool:
+        """True unless the section reports zero available seats"""
+        availability = str(section.get('availability', '')).strip()
+        return not availability.isdigit() or int(availability) > 0
+
+    def _section_summary(self, section: Dict[str, Any]) -> Dict[str, Any]:
+        """Trim an offering dictionary to the fields a schedule needs"""
+        return {
+            'number': section.get('number'),
+            'name': section.get('name'),
+            'course': f"{section.get('department')} {section.get('course_number')}",
+            'section': section.get('section'),
+            'days': section.get('days', ''),
+            'start_time': section.get('start_time', ''),
+            'end_time': section.get('end_time', ''),
+            'delivery_type': section.get('delivery_type', ''),
+            'availability': section.get('availability', '')
+        }
@@ -1,9 +1,12 @@
 """
 Request validation utilities
 """
+import datetime
 import re
 from typing import Dict, List, Any, Optional
 
+from core.meeting_time import parse_time
+
 def validate_semester_format(semester: str) -> bool:
     """
     Validate semester format (e.g., '25_FA', '26_SP')
@@ -43,6 +46,19 @@ def validate_course_number(course_number: str) -> bool:
     pattern = r'^\d{3,4}$'
     return bool(re.match(pattern, course_number))
 
+def validate_section_code(section_code: str) -> bool:
+    """
+    Validate section code format (e.g., 'THR103A', 'ACC425LA1')
+    
+    Args:
+        section_code: Section code to validate
+        
+    Returns:
+        True if valid format, False otherwise
+    """
+    pattern = r'^[A-Z]{2,4}\d{3,4}[A-Z]*\d*$'
+    return bool(re.match(pattern, section_code))
+
 def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -> Dict[str, str]:
     """
     Validate that required fields are present and not empty
@@ -95,6 +111,133 @@ def validate_schedule_request(data: Dict[str, Any]) -> Dict[str, str]:
         if invalid_days:
             errors['weekdays'] = f"Invalid weekdays: {', '.join(invalid_days)}"
     
+    # Validate meeting segments if provided
+    segments = data.get('segments')
+    if segments is not None:
+        segment_error = validate_schedule_segments(segments)
+        if segment_error:
+            errors['segments'] = segment_error
+    
+    return errors
+
+def validate_schedule_segments(segments: Any) -> Optional[str]:
+    """
+    Validate meeting segments like {"weekdays": ["Thursday"], "start": "2025-09-01", "label": "Lab"}
+    
+    Args:
+        segments: Value of the request's segments field
+        
+    Returns:
+        Error message, or None if valid
+    """
+    valid_days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    if not isinstance(segments, list) or not segments:
+        return "Segments must be a non-empty list"
+    
+    for position, segment in enumerate(segments, 1):
+        if not isinstance(segment, dict):
+            return f"Segment {position} must be an object"
+        weekdays = segment.get('weekdays')
+        if not isinstance(weekdays, list) or not weekdays:
+            return f"Segment {position} needs a non-empty weekdays list"
+        invalid_days = [str(day) for day in weekdays if day not in valid_days]
+        if invalid_days:
+            return f"Segment {position} has invalid weekdays: {', '.join(invalid_days)}"
+        
+        dates = []
+        for field in ('start', 'end'):
+            value = segment.get(field)
+            if value is None:
+                continue
+            try:
+                dates.append(datetime.date.fromisoformat(value) if isinstance(value, str) else None)
+            except ValueError:
+                dates.append(None)
+            if dates[-1] is None:
+                return f"Segment {position} {field} must be a date in YYYY-MM-DD format"
+        if len(dates) == 2 and dates[0] > dates[1]:
+            return f"Segment {position} ends before it starts"
+        
+        label = segment.get('label')
+        if label is not None and not isinstance(label, str):
+            return f"Segment {position} label must be a string"
+    
+    return None
+
+def validate_schedule_export_request(data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Validate iCalendar schedule export request data
+    
+    Args:
+        data: Request data dictionary
+        
+    Returns:
+        Dictionary of validation errors (empty if all valid)
+    """
+    errors = validate_schedule_request(data)
+    
+    if not data.get('weekdays'):
+        errors.setdefault('weekdays', "At least one weekday is required")
+    
+    # Meeting times are optional but must come as a pair like "10:30AM"
+    start_time = data.get('start_time', '')
+    end_time = data.get('end_time', '')
+    time_pattern = r'^(\d{1,2}):(\d{2})\s*[AaPp]\.?[Mm]\.?$'
+    minutes = {}
+    for field, value in (('start_time', start_time), ('end_time', end_time)):
+        if not value:
+            continue
+        match = re.match(time_pattern, value.strip()) if isinstance(value, str) else None
+        if not match or not 1 <= int(match.group(1)) <= 12 or int(match.group(2)) > 59:
+            errors[field] = "Invalid time. Expected format: HH:MMAM or HH:MMPM (e.g., 10:30AM)"
+        else:
+            minutes[field] = parse_time(value)
+    if bool(start_time) != bool(end_time):
+        errors.setdefault('end_time' if start_time else 'start_time', "start_time and end_time must be given together")
+    elif len(minutes) == 2 and minutes['end_time'] <= minutes['start_time']:
+        errors['end_time'] = "end_time must be later than start_time"
+    
+    return errors
+
+def validate_student_schedule_request(data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Validate student schedule builder request data
+    
+    Args:
+        data: Request data dictionary
+        
+    Returns:
+        Dictionary of validation errors (empty if all valid)
+    """
+    errors = {}
+    
+    # Check required fields
+    required_fields = ['semester', 'courses']
+    errors.update(validate_required_fields(data, required_fields))
+    
+    # Validate semester format
+    semester = data.get('semester')
+    if semester and not validate_semester_format(semester):
+        errors['semester'] = "Invalid semester format. Expected format: YY_SEASON (e.g., 25_FA)"
+    
+    # Validate desired courses
+    courses = data.get('courses')
+    if courses and not isinstance(courses, list):
+        errors['courses'] = "Courses must be a list"
+    elif courses:
+        invalid_courses = [str(c) for c in courses
+                           if not isinstance(c, str) or not re.match(r'^[A-Za-z]{2,4}\s*\d{3,4}$', c.strip())]
+        if invalid_courses:
+            errors['courses'] = f"Invalid course ids: {', '.join(invalid_courses)}"
+        elif len(courses) > 10:
+            errors['courses'] = "At most 10 courses can be scheduled at once"
+    
+    # Validate search caps
+    for field in ['max_results', 'time_limit']:
+        value = data.get(field)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0):
+            errors[field] = f"{field} must be a positive number"
+    
     return errors
 
 def validate_syllabus_request(data: Dict[str, Any]) -> Dict[str, str]:
@@ -3,8 +3,12 @@
 import os
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from calendar_json.json_converter import parse_pdf_to_json_with_events
+from calendar_json.provenance import CalendarIndex, merge_calendar_fields
+from core.file_writer import write_atomic
+from pdf.pdf_extractor import EXTRACTION_CACHE, PDF_CACHE_DIRNAME
 
 def discover_available_years():
     ''' Discover available years from PDF files in niagara directory '''
@@ -64,13 +68,92 @@ def generate_active_semester_config(output_dir):
         "_note": "Contains list of available semesters for the interface"
     }
     
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    write_atomic(config_path, json.dumps(config, indent=2))
     
     print(f"Generated active_semester.json with {len(available_semesters)} available semesters")
 
-def generate_calendar_json(niagara_dir=None, output_dir=None):
-    ''' Generate separate JSON files for each semester from all PDFs in niagara directory '''
+def recorded_sources(output_dir, index=None):
+    ''' Map source_file -> set of source_hash values recorded in existing semester JSON files '''
+    return (index or CalendarIndex(output_dir)).sources()
+
+def is_unchanged(pdf_file, content_hash, sources):
+    ''' True when every output recorded for pdf_file was generated from this content '''
+    return content_hash is not None and sources.get(pdf_file) == {content_hash}
+
+def _read_json(path):
+    ''' Parsed JSON file, or None if missing or unreadable '''
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_semester_files(json_data, output_dir):
+    ''' Split parsed academic year data into one atomically written JSON file per semester
+    
+    Fields edited by hand since the last run are kept (see
+    calendar_json.provenance). Returns a list of (filename, preserved fields).
+    '''
+    written = []
+    for semester_key, semester_data in json_data.get('semesters', {}).items():
+        semester_filename = f"{semester_key}.json"
+        semester_path = os.path.join(output_dir, semester_filename)
+        
+        parsed = {
+            "first_day": semester_data.get('first_day'),
+            "last_day": semester_data.get('last_day'),
+            "no_class_dates": semester_data.get('no_class_dates', []),
+            "events": semester_data.get('events', [])
+        }
+        fields, provenance, preserved = merge_calendar_fields(_read_json(semester_path), parsed)
+        
+        # Create individual semester JSON
+        semester_json = {
+            "semester": semester_key,
+            "source_file": json_data.get('source_file'),
+            "source_hash": json_data.get('source_hash'),
+            "generated_at": json_data.get('generated_at'),
+        }
+        semester_json.update(fields)
+        semester_json["provenance"] = provenance
+        
+        write_atomic(semester_path, json.dumps(semester_json, indent=2))
+        written.append((semester_filename, preserved))
+    return written
+
+def generate_pdf_calendars(pdf_path, output_dir):
+    ''' Parse one PDF and write its semester files; returns (filename, preserved fields) pairs '''
+    return write_semester_files(parse_pdf_to_json_with_events(pdf_path), output_dir)
+
+def _init_worker(cache_dir):
+    # Each worker parses whole PDFs, so pages are not split across a second pool
+    EXTRACTION_CACHE.cache_dir = cache_dir
+    EXTRACTION_CACHE.processes = None
+
+def _record(written, calendar_index, preservation_notes):
+    ''' Index freshly written files and note preserved manual edits '''
+    for semester_filename, preserved in written:
+        calendar_index.update(semester_filename)
+        if preserved:
+            preservation_notes.append({
+                'file': semester_filename,
+                'message': 'Kept manual edits over newly parsed values',
+                'preserved_fields': preserved
+            })
+
+def generate_calendar_json(niagara_dir=None, output_dir=None, workers=None, force=False):
+    ''' Generate separate JSON files for each semester from all PDFs in niagara directory
+    
+    Args:
+        niagara_dir: Directory of academic calendar PDFs (default: niagara/)
+        output_dir: Directory for semester JSON files (default: calendars/)
+        workers: Parse PDFs in a pool of this many processes (default: serially)
+        force: Regenerate PDFs whose content hash matches existing outputs
+    
+    Manual edits kept during the run are left in
+    generate_calendar_json._preservation_notes for the TBD report.
+    '''
+    generate_calendar_json._preservation_notes = []
     if not niagara_dir:
         niagara_dir = os.path.join(os.path.dirname(__file__), '..', 'niagara')
     if not output_dir:
@@ -83,40 +166,54 @@ def generate_calendar_json(niagara_dir=None, output_dir=None):
         print(f"Niagara directory not found: {niagara_dir}")
         return
     
-    pdf_files = [f for f in os.listdir(niagara_dir) if f.endswith('.pdf')]
+    pdf_files = sorted(f for f in os.listdir(niagara_dir) if f.endswith('.pdf'))
+    
+    # Keep extracted pages between runs so unchanged PDFs are never re-read
+    if not EXTRACTION_CACHE.cache_dir:
+        EXTRACTION_CACHE.cache_dir = os.path.join(niagara_dir, PDF_CACHE_DIRNAME)
     
+    # Skip PDFs whose outputs already record the same content hash
+    calendar_index = CalendarIndex(output_dir)
+    sources = {} if force else recorded_sources(output_dir, calendar_index)
+    pending = []
     for pdf_file in pdf_files:
         pdf_path = os.path.join(niagara_dir, pdf_file)
-        print(f"Processing {pdf_file}...")
-        
         try:
-            # Parse the full academic year data first
-            json_data = parse_pdf_to_json_with_events(pdf_path)
-            
-            # Split into separate semester files
-            for semester_key, semester_data in json_data.get('semesters', {}).items():
-                semester_filename = f"{semester_key}.json"
-                semester_path = os.path.join(output_dir, semester_filename)
-                
-                # Create individual semester JSON
-                semester_json = {
-                    "semester": semester_key,
-                    "source_file": json_data.get('source_file'),
-                    "generated_at": json_data.get('generated_at'),
-                    "first_day": semester_data.get('first_day'),
-                    "last_day": semester_data.get('last_day'),
-                    "no_class_dates": semester_data.get('no_class_dates', []),
-                    "events": semester_data.get('events', [])
-                }
-                
-                # Write semester JSON file
-                with open(semester_path, 'w') as f:
-                    json.dump(semester_json, f, indent=2)
-                
+            content_hash = EXTRACTION_CACHE.content_hash(pdf_path)
+        except OSError:
+            content_hash = None
+        if is_unchanged(pdf_file, content_hash, sources):
+            print(f"Skipping {pdf_file} (unchanged)")
+        else:
+            pending.append(pdf_file)
+    
+    preservation_notes = generate_calendar_json._preservation_notes
+    if workers and workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending)), initializer=_init_worker,
+                                 initargs=(EXTRACTION_CACHE.cache_dir,)) as executor:
+            futures = {executor.submit(generate_pdf_calendars, os.path.join(niagara_dir, pdf_file), output_dir): pdf_file
+                       for pdf_file in pending}
+            for future in as_completed(futures):
+                pdf_file = futures[future]
+                try:
+                    written = future.result()
+                except Exception as e:
+                    print(f"Error processing {pdf_file}: {e}")
+                    continue
+                print(f"Processed {pdf_file}: generated {', '.join(name for name, _ in written) or 'no semester files'}")
+                _record(written, calendar_index, preservation_notes)
+    else:
+        for pdf_file in pending:
+            print(f"Processing {pdf_file}...")
+            try:
+                written = generate_pdf_calendars(os.path.join(niagara_dir, pdf_file), output_dir)
+            except Exception as e:
+                print(f"Error processing {pdf_file}: {e}")
+                continue
+            for semester_filename, _ in written:
                 print(f"Generated {semester_filename}")
-            
-        except Exception as e:
-            print(f"Error processing {pdf_file}: {e}")
+            _record(written, calendar_index, preservation_notes)
+    calendar_index.save()
     
-    # Generate active_semester.json configuration file
-    generate_active_semester_config(output_dir)
\ No newline at end of file
+    # Generate active_semester.json configuration file once every PDF is done
+    generate_active_semester_config(output_dir)
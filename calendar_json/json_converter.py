@@ -2,19 +2,50 @@
 
 import re
 import arrow
-from pdf.pdf_extractor import extract_text_from_pdf
-from pdf.semester_parser import extract_semester_dates_from_pdf_text
-from pdf.event_parser import extract_semester_events_from_pdf_text
+from pdf.pdf_extractor import extract_pdf
+from pdf.layout import analyze_document
+from pdf.semester_parser import extract_semester_dates_from_pdf_text, extract_semester_dates_from_layout
+from pdf.event_parser import extract_semester_events_from_pdf_text, extract_semester_events_from_layout
 
 def parse_pdf_to_json(pdf_path):
     ''' Convert PDF calendar to JSON format with TBD for missing data '''
     # Use the enhanced version with events
     return parse_pdf_to_json_with_events(pdf_path)
 
+def parse_academic_year_text(text, start_year, end_year, layout=None):
+    ''' Run the semester, no-class and event parsers over one extracted text
+    
+    Semesters with a column in layout (see pdf.layout) are read from it;
+    the line-based text parsers are the fallback.
+    '''
+    def format_date(arrow_date):
+        return arrow_date.format('YYYY-MM-DD') if arrow_date else "TBD"
+    
+    def format_date_list(arrow_list):
+        return [date.format('YYYY-MM-DD') for date in arrow_list] if arrow_list else []
+    
+    semesters = {}
+    for semester, year in (('fall', start_year), ('spring', end_year)):
+        dates = extract_semester_dates_from_layout(layout, semester, year) if layout else None
+        events = extract_semester_events_from_layout(layout, semester, year) if layout else None
+        if dates is None:
+            dates = extract_semester_dates_from_pdf_text(text, semester, str(year))
+        if events is None:
+            events = extract_semester_events_from_pdf_text(text, semester, str(year))
+        
+        first_days, last_days, no_classes = dates
+        semesters[f"{semester}_{year}"] = {
+            "first_day": format_date(first_days[0]) if first_days else "TBD",
+            "last_day": format_date(last_days[0]) if last_days else "TBD",
+            "no_class_dates": format_date_list(no_classes),
+            "events": events
+        }
+    return semesters
+
 def parse_pdf_to_json_with_events(pdf_path):
     ''' Convert PDF calendar to JSON format including events '''
     try:
-        text = extract_text_from_pdf(pdf_path)
+        document = extract_pdf(pdf_path)
         
         # Extract year from filename or content
         filename = pdf_path.split('/')[-1]
@@ -26,37 +57,11 @@ def parse_pdf_to_json_with_events(pdf_path):
             start_year = 2024
             end_year = 2025
         
-        # Parse both semesters for basic dates
-        fall_data = extract_semester_dates_from_pdf_text(text, 'fall', str(start_year))
-        spring_data = extract_semester_dates_from_pdf_text(text, 'spring', str(end_year))
-        
-        # Parse events for both semesters
-        fall_events = extract_semester_events_from_pdf_text(text, 'fall', str(start_year))
-        spring_events = extract_semester_events_from_pdf_text(text, 'spring', str(end_year))
-        
-        def format_date(arrow_date):
-            return arrow_date.format('YYYY-MM-DD') if arrow_date else "TBD"
-        
-        def format_date_list(arrow_list):
-            return [date.format('YYYY-MM-DD') for date in arrow_list] if arrow_list else []
-        
         json_data = {
             "source_file": filename,
+            "source_hash": document.content_hash,
             "generated_at": arrow.now().format('YYYY-MM-DD HH:mm:ss'),
-            "semesters": {
-                f"fall_{start_year}": {
-                    "first_day": format_date(fall_data[0][0]) if fall_data[0] else "TBD",
-                    "last_day": format_date(fall_data[1][0]) if fall_data[1] else "TBD", 
-                    "no_class_dates": format_date_list(fall_data[2]),
-                    "events": fall_events
-                },
-                f"spring_{end_year}": {
-                    "first_day": format_date(spring_data[0][0]) if spring_data[0] else "TBD",
-                    "last_day": format_date(spring_data[1][0]) if spring_data[1] else "TBD",
-                    "no_class_dates": format_date_list(spring_data[2]),
-                    "events": spring_events
-                }
-            }
+            "semesters": parse_academic_year_text(document.text, start_year, end_year, analyze_document(document))
         }
         
         return json_data
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+
+"""
+Field provenance and a maintained index of generated semester calendars
+
+Each semester file carries a "provenance" block recording, per calendar
+field, where its value came from and the hash of the value last written:
+
+    parsed   the generator's value; a new parse of a changed PDF replaces it
+    manual   edited by hand (the stored value no longer matches its hash);
+             kept on every later run
+
+Deleting a field's provenance entry hands it back to the parser. Files
+written before provenance existed are treated as parsed.
+
+The calendar index (.calendar_index beside the semester files; not a .json
+file, so semester scans ignore it) keeps each file's source PDF, source hash
+and TBD items keyed by its mtime and size. The hash-skip check and the TBD
+report re-read only files that changed since they were indexed, and the
+generator indexes the files it writes as it writes them.
+"""
+
+import json
+import os
+
+from core.file_writer import content_hash, write_atomic
+
+PARSED = 'parsed'
+MANUAL = 'manual'
+
+# Fields of a semester file produced by the PDF parser
+CALENDAR_FIELDS = ('first_day', 'last_day', 'no_class_dates', 'events')
+
+CALENDAR_INDEX_NAME = '.calendar_index'
+
+
+def field_hash(value):
+    """Stable hash of a JSON-serializable field value"""
+    return content_hash(json.dumps(value, sort_keys=True))
+
+
+def merge_calendar_fields(existing, parsed):
+    """
+    Combine freshly parsed semester fields with a stored semester file
+
+    Args:
+        existing: Stored semester JSON (or None when there is no file yet)
+        parsed: Dict of field -> newly parsed value
+
+    Returns:
+        (fields, provenance, preserved) where fields maps every calendar
+        field to the value to write, provenance is the new provenance block
+        and preserved lists the fields kept as manual edits.
+    """
+    existing = existing or {}
+    recorded = existing.get('provenance') or {}
+    fields = {}
+    provenance = {}
+    preserved = []
+
+    for field in CALENDAR_FIELDS:
+        entry = recorded.get(field)
+        if isinstance(entry, dict) and field in existing:
+            current_hash = field_hash(existing[field])
+            if entry.get('source') == MANUAL or current_hash != entry.get('hash'):
+                fields[field] = existing[field]
+                provenance[field] = {"source": MANUAL, "hash": current_hash}
+                preserved.append(field)
+                continue
+        fields[field] = parsed.get(field)
+        provenance[field] = {"source": PARSED, "hash": field_hash(fields[field])}
+
+    return fields, provenance, preserved
+
+
+def _semester_tbd_items(semester_key, semester_data):
+    """TBD items of one semester's fields"""
+    items = []
+    if semester_data.get('first_day') == 'TBD':
+        items.append({
+            'field': 'first_day',
+            'location': semester_key,
+            'suggestion': 'Set first day of classes in YYYY-MM-DD format'
+        })
+
+    if semester_data.get('last_day') == 'TBD':
+        items.append({
+            'field': 'last_day',
+            'location': semester_key,
+            'suggestion': 'Set last day of classes in YYYY-MM-DD format'
+        })
+
+    # Check events for TBD dates
+    for event in semester_data.get('events') or []:
+        if event.get('date') == 'TBD':
+            items.append({
+                'field': 'event_date',
+                'location': f"{semester_key}/events",
+                'suggestion': f'Set date for event "{event.get("name", "Unknown")}"'
+            })
+
+        if event.get('date_range') and 'TBD' in str(event.get('date_range')):
+            items.append({
+                'field': 'event_date_range',
+                'location': f"{semester_key}/events",
+                'suggestion': f'Set date range for event "{event.get("name", "Unknown")}"'
+            })
+    return items
+
+
+def tbd_items(data):
+    """TBD items of a semester file or of a multi-semester academic year file"""
+    items = []
+
+    # Check for parsing errors
+    if 'error' in data:
+        items.append({
+            'field': 'parsing_error',
+            'location': 'root',
+            'suggestion': f'Fix PDF parsing error: {data["error"]}'
+        })
+
+    if 'semesters' in data:
+        for semester_key, semester_data in data.get('semesters', {}).items():
+            items.extend(_semester_tbd_items(semester_key, semester_data))
+    elif 'semester' in data:
+        items.extend(_semester_tbd_items(data['semester'], data))
+    return items
+
+
+class CalendarIndex:
+    """Source PDF, source hash and TBD items per calendar file, re-read only when a file changes"""
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, CALENDAR_INDEX_NAME)
+        self._entries = None
+        self._dirty = False
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def update(self, filename):
+        """Re-read one file and record its stat, source and TBD items"""
+        path = os.path.join(self.output_dir, filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if self.entries.pop(filename, None) is not None:
+                self._dirty = True
+            return
+        entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                 "source_file": None, "source_hash": None}
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            entry["items"] = tbd_items(data)
+            if isinstance(data, dict):
+                entry["source_file"] = data.get('source_file')
+                entry["source_hash"] = data.get('source_hash')
+        except Exception as e:
+            entry["items"] = [{
+                'field': 'file_error',
+                'location': 'file',
+                'suggestion': f'Fix JSON file error: {e}'
+            }]
+        self.entries[filename] = entry
+        self._dirty = True
+
+    def sync(self):
+        """Bring the index up to date with the directory; returns the .json filenames"""
+        try:
+            filenames = sorted(f for f in os.listdir(self.output_dir) if f.endswith('.json'))
+        except OSError:
+            return []
+
+        for filename in set(self.entries) - set(filenames):
+            del self.entries[filename]
+            self._dirty = True
+        for filename in filenames:
+            entry = self.entries.get(filename)
+            try:
+                stat = os.stat(os.path.join(self.output_dir, filename))
+            except OSError:
+                continue
+            if not entry or entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size:
+                self.update(filename)
+        return filenames
+
+    def sources(self):
+        """Map source_file -> set of source_hash values recorded by the calendar files"""
+        self.sync()
+        sources = {}
+        for entry in self.entries.values():
+            if entry.get('source_file'):
+                sources.setdefault(entry['source_file'], set()).add(entry.get('source_hash'))
+        return sources
+
+    def tbd_report(self):
+        """
+        TBD items of every calendar file, from the index
+
+        Returns:
+            List of {'file', 'items'} for files with TBD items, by filename
+        """
+        filenames = self.sync()
+        self.save()
+        return [{'file': filename, 'items': self.entries[filename]['items']}
+                for filename in filenames if self.entries.get(filename, {}).get('items')]
+
+    def save(self):
+        """Write the index if anything changed"""
+        if self._dirty:
+            write_atomic(self.path, json.dumps(self.entries, indent=2, sort_keys=True))
+            self._dirty = False
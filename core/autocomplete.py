@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+"""
+Typeahead completion for course ids, titles and section codes
+
+All completion keys are normalized and kept in one sorted array, so a
+prefix lookup is a bisection followed by a short forward scan. The index is
+built once from department files and a semester's offering codes; queries
+never touch the filesystem. When some departments' files change,
+update_autocomplete_index copies the index without their entries and
+re-reads only those departments.
+"""
+
+import re
+from bisect import bisect_left
+
+SECTION_CODE_PATTERN = re.compile(r'^([A-Z]+)(\d+)')
+
+# Lower rank sorts first: course ids beat section codes beat title words
+KIND_RANK = {'course_id': 0, 'section': 1, 'title': 2}
+
+# Upper bound on keys examined per query so very short prefixes stay fast
+MAX_SCAN = 2000
+
+
+def normalize_query(text):
+    """Uppercase and collapse whitespace"""
+    return ' '.join(text.upper().split())
+
+
+class AutocompleteIndex:
+    """Sorted-array prefix index with bisect lookups"""
+
+    def __init__(self):
+        self.entries = []       # entry id -> result dictionary
+        self._keys = []         # sorted completion keys
+        self._refs = []         # parallel to _keys: (kind rank, entry id)
+        self._pending = []
+        self._by_value = {}
+
+    def _add_entry(self, entry):
+        value = entry['value']
+        if value in self._by_value:
+            return self._by_value[value]
+        entry_id = len(self.entries)
+        self.entries.append(entry)
+        self._by_value[value] = entry_id
+        return entry_id
+
+    def _add_key(self, key, kind, entry_id):
+        self._pending.append((normalize_query(key), KIND_RANK[kind], entry_id))
+
+    def add_course(self, dept_code, number, title=None):
+        """Add a course id and its title words"""
+        course_id = f"{dept_code} {number}"
+        entry_id = self._add_entry({
+            'value': course_id,
+            'label': f"{course_id} - {title}" if title else course_id,
+            'type': 'course',
+            'department': dept_code,
+            'number': number
+        })
+        self._add_key(course_id, 'course_id', entry_id)
+        self._add_key(f"{dept_code}{number}", 'course_id', entry_id)
+        if title:
+            words = title.split()
+            for i in range(len(words)):
+                self._add_key(' '.join(words[i:]), 'title', entry_id)
+
+    def add_section(self, section_code, name=None):
+        """Add a semester section code (e.g. 'THR103A')"""
+        match = SECTION_CODE_PATTERN.match(section_code)
+        if not match:
+            return
+        entry_id = self._add_entry({
+            'value': section_code,
+            'label': f"{section_code} - {name}" if name else section_code,
+            'type': 'section',
+            'department': match.group(1),
+            'number': match.group(2)
+        })
+        self._add_key(section_code, 'section', entry_id)
+        self._add_key(f"{match.group(1)} {section_code[len(match.group(1)):]}", 'section', entry_id)
+
+    def build(self):
+        """Sort pending keys into the lookup arrays"""
+        if self._pending:
+            merged = sorted(set(zip(self._keys, self._refs)) | {(k, (r, e)) for k, r, e in self._pending})
+            self._keys = [key for key, _ in merged]
+            self._refs = [ref for _, ref in merged]
+            self._pending = []
+        return self
+
+    def without_departments(self, dept_codes):
+        """Copy of the index without the course and section entries of the given departments"""
+        self.build()
+        index = AutocompleteIndex()
+        new_ids = {}
+        for entry_id, entry in enumerate(self.entries):
+            if entry['department'] not in dept_codes:
+                new_ids[entry_id] = index._add_entry(entry)
+        # Surviving ids keep their relative order, so the filtered keys stay sorted
+        for key, (rank, entry_id) in zip(self._keys, self._refs):
+            if entry_id in new_ids:
+                index._keys.append(key)
+                index._refs.append((rank, new_ids[entry_id]))
+        return index
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, value):
+        return value in self._by_value
+
+    def complete(self, query, limit=10):
+        """
+        Return up to limit entries whose keys start with the query
+
+        Course ids are preferred over section codes, which are preferred over
+        title matches; within a kind results stay in key order.
+        """
+        if self._pending:
+            self.build()
+        prefix = normalize_query(query)
+        if not prefix:
+            return []
+
+        start = bisect_left(self._keys, prefix)
+        best = [[] for _ in KIND_RANK]
+        seen = set()
+        for position in range(start, min(start + MAX_SCAN, len(self._keys))):
+            if not self._keys[position].startswith(prefix):
+                break
+            rank, entry_id = self._refs[position]
+            if entry_id in seen:
+                continue
+            seen.add(entry_id)
+            best[rank].append(entry_id)
+            # Keys are ordered alphabetically, so once the best kind has
+            # enough matches nothing later can displace them
+            if len(best[0]) >= limit:
+                break
+
+        ordered = [entry_id for group in best for entry_id in group][:limit]
+        return [dict(self.entries[entry_id]) for entry_id in ordered]
+
+
+def _add_departments(index, data_loader, dept_codes, semester=None, offerings=None):
+    for dept_code in dept_codes:
+        dept = data_loader.load_department(dept_code)
+        if not dept or not dept.name:
+            continue
+        for course in dept.courses:
+            if course.number:
+                index.add_course(dept_code, course.number, course.title)
+
+    if semester:
+        if offerings is None:
+            offerings = data_loader.load_semester_offerings(semester)
+        for offering in offerings:
+            code = offering.get('number', '')
+            match = SECTION_CODE_PATTERN.match(code)
+            if not match:
+                continue
+            index.add_section(code, offering.get('name'))
+            # Offered courses missing from department files still complete by id
+            if f"{match.group(1)} {match.group(2)}" not in index:
+                index.add_course(match.group(1), match.group(2), offering.get('name'))
+
+
+def build_autocomplete_index(data_loader, semester=None):
+    """
+    Build an AutocompleteIndex from all departments and a semester's offerings
+
+    Args:
+        data_loader: DepartmentDataLoader instance
+        semester: Semester code whose section codes are added (optional)
+    """
+    index = AutocompleteIndex()
+    _add_departments(index, data_loader, data_loader.get_all_departments(), semester)
+    return index.build()
+
+
+def update_autocomplete_index(index, data_loader, dept_codes, semester=None):
+    """
+    Copy of an index with only the given departments' entries re-read
+
+    Args:
+        index: AutocompleteIndex built by build_autocomplete_index
+        data_loader: DepartmentDataLoader instance
+        dept_codes: Departments whose department or semester files changed
+        semester: Semester code the index was built for (optional)
+    """
+    dept_codes = set(dept_codes)
+    updated = index.without_departments(dept_codes)
+    offerings = None
+    if semester:
+        offerings = [offering for code in sorted(dept_codes)
+                     for offering in data_loader.load_semester_offerings(semester, code)]
+    _add_departments(updated, data_loader, sorted(dept_codes), semester, offerings)
+    return updated.build()
@@ -3,24 +3,20 @@
 import os
 import json
 import arrow
+from core.semester_registry import get_semester_registry
 
 def make_url(semester, year): 
     ''' Takes semester and year as strings, returns path to semester-specific JSON calendar '''
     
-    # Look for semester-specific JSON file
-    calendars_dir = os.path.join(os.path.dirname(__file__), '..', 'calendars')
+    # Look for semester-specific JSON file, then any available semester JSON file
+    registry = get_semester_registry()
     semester_filename = f"{semester.lower()}_{year}.json"
-    semester_path = os.path.join(calendars_dir, semester_filename)
+    if registry.has_calendar(semester_filename):
+        return registry.calendar_path(semester_filename)
     
-    if os.path.exists(semester_path):
-        return semester_path
-    
-    # Fallback: look for any available semester JSON file
-    if os.path.exists(calendars_dir):
-        json_files = [f for f in os.listdir(calendars_dir) 
-                     if f.endswith('.json') and f != 'active_semester.json']
-        if json_files:
-            return os.path.join(calendars_dir, sorted(json_files)[0])
+    json_files = registry.calendar_files()
+    if json_files:
+        return registry.calendar_path(json_files[0])
     
     # Ultimate fallback to PDF (legacy)
     pdf_filename = f"Academic-Year-Schedule-Lewiston-{year}-{int(year)+1}.pdf"
@@ -46,6 +42,30 @@ def fetch_registrar_table(file_path, semester=None, year=None):
             first_days, last_days, no_classes = parse_pdf_calendar(file_path)
         return first_days, last_days, no_classes, []
 
+# (file_path, semester, year) -> ((mtime_ns, size), SemesterCalendar)
+_calendar_models = {}
+
+def load_calendar_model(file_path, semester=None, year=None):
+    ''' Load a semester calendar as a core.calendar_model.SemesterCalendar of date intervals
+    
+    Models are shared between callers and rebuilt only when the file changes.
+    '''
+    from core.calendar_model import SemesterCalendar
+    stat = os.stat(file_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = (os.path.realpath(file_path), semester, year)
+    cached = _calendar_models.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    if file_path.endswith('.json'):
+        with open(file_path, 'r') as f:
+            model = SemesterCalendar.from_json(json.load(f))
+    else:
+        model = SemesterCalendar.from_registrar_table(*fetch_registrar_table(file_path, semester, year))
+    _calendar_models[key] = (signature, model)
+    return model
+
 def parse_registrar_table(calendar_data):
     ''' Parse calendar data and return first, last, cancelled days of class as lists '''
     # calendar_data is now the tuple returned by parse_pdf_calendar
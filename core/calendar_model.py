@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+
+"""
+Interval model of a semester calendar and iCalendar export
+
+Calendar files list no-class days and event ranges as expanded ISO dates
+("2025-11-26", "2025-11-27", ...). SemesterCalendar folds them into
+inclusive (start, end) date intervals, so a week-long break is one entry
+instead of five, and answers point queries ("is there class on this day",
+"which events fall on it") through an IntervalIndex: intervals sorted by
+start with a running maximum of their ends, so a lookup is one bisect plus
+a backward walk over only the intervals that can still reach the day.
+
+iter_ics streams an iCalendar (.ics) document of a course's meetings
+straight from the model, one content line at a time.
+"""
+
+import datetime
+from bisect import bisect_right
+from collections import namedtuple
+from core.meeting_time import WEEKDAY_NAMES
+
+# Inclusive range of datetime.date values
+DateInterval = namedtuple('DateInterval', ['start', 'end'])
+
+ONE_DAY = datetime.timedelta(days=1)
+
+# Event types that mean there is no class (see core.schedule_generator.schedule)
+NO_CLASS_EVENT_TYPES = ('holiday', 'break')
+
+
+def as_date(value):
+    """Convert an ISO string, date, datetime or Arrow object to a date, or None for TBD/invalid"""
+    if value is None:
+        return None
+    if hasattr(value, 'date') and callable(value.date):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def compress_dates(dates):
+    """Fold dates into sorted, non-adjacent DateIntervals (TBD and invalid values are dropped)"""
+    days = sorted({day for day in map(as_date, dates) if day})
+    intervals = []
+    for day in days:
+        if intervals and intervals[-1].end + ONE_DAY == day:
+            intervals[-1] = intervals[-1]._replace(end=day)
+        else:
+            intervals.append(DateInterval(day, day))
+    return intervals
+
+
+class IntervalIndex:
+    """Date intervals with attached values, indexed for point queries"""
+
+    def __init__(self, items=()):
+        """
+        Args:
+            items: Iterable of (DateInterval, value) pairs
+        """
+        entries = sorted(items, key=lambda item: (item[0].start, item[0].end))
+        self._starts = [interval.start for interval, _ in entries]
+        self._entries = entries
+        # _reach[i]: latest end among the first i + 1 intervals
+        self._reach = []
+        reach = None
+        for interval, _ in entries:
+            reach = interval.end if reach is None or interval.end > reach else reach
+            self._reach.append(reach)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def _covering(self, day):
+        position = bisect_right(self._starts, day) - 1
+        while position >= 0 and self._reach[position] >= day:
+            interval, value = self._entries[position]
+            if interval.end >= day:
+                yield value
+            position -= 1
+
+    def at(self, day):
+        """Values of the intervals covering day, in order of interval start"""
+        return list(self._covering(day))[::-1]
+
+    def covers(self, day):
+        """Whether any interval covers day"""
+        for _ in self._covering(day):
+            return True
+        return False
+
+
+class SemesterCalendar:
+    """First and last day of classes, no-class intervals and event intervals of one semester"""
+
+    def __init__(self, first_day, last_day, no_class=(), events=()):
+        """
+        Args:
+            first_day: First day of classes (date) or None when TBD
+            last_day: Last day of classes (date) or None when TBD
+            no_class: Iterable of DateInterval without classes
+            events: Iterable of (DateInterval, event dict with 'name' and 'type')
+        """
+        self.first_day = first_day
+        self.last_day = last_day
+        self.no_class = IntervalIndex((interval, None) for interval in no_class)
+        self.events = IntervalIndex(events)
+
+    @classmethod
+    def from_json(cls, data):
+        """Build the model from a semester calendar JSON dict"""
+        events = []
+        for event in data.get('events') or []:
+            days = [event.get('date')] + list(event.get('date_range') or [])
+            info = {'name': event.get('name', ''), 'type': event.get('type', 'other')}
+            events.extend((interval, info) for interval in compress_dates(days))
+        return cls(as_date(data.get('first_day')), as_date(data.get('last_day')),
+                   compress_dates(data.get('no_class_dates') or []), events)
+
+    @classmethod
+    def from_registrar_table(cls, first_days, last_days, no_classes, events):
+        """Build the model from the lists returned by core.calendar_loader.fetch_registrar_table"""
+        intervals = []
+        for event in events or []:
+            days = [event.get('date')] + list(event.get('date_range') or [])
+            info = {'name': event.get('name', ''), 'type': event.get('type', 'other')}
+            intervals.extend((interval, info) for interval in compress_dates(days))
+        return cls(as_date(first_days[0]) if first_days else None,
+                   as_date(last_days[0]) if last_days else None,
+                   compress_dates(no_classes), intervals)
+
+    def events_on(self, day):
+        """Events whose interval covers day"""
+        return self.events.at(day)
+
+    def has_class(self, day):
+        """Whether classes meet on day (inside the semester, not a no-class day, holiday or break)"""
+        if not self.first_day or not self.last_day or not self.first_day <= day <= self.last_day:
+            return False
+        if self.no_class.covers(day):
+            return False
+        return not any(event['type'] in NO_CLASS_EVENT_TYPES for event in self.events_on(day))
+
+    def meeting_days(self, weekdays):
+        """
+        Dates a class meeting on the given weekdays actually meets
+
+        Args:
+            weekdays: Weekday names, e.g. ['Monday', 'Wednesday']
+
+        Yields:
+            datetime.date for every meeting day in the semester, in order
+        """
+        if not self.first_day or not self.last_day:
+            return
+        wanted = {WEEKDAY_NAMES.index(name) for name in weekdays if name in WEEKDAY_NAMES}
+        day = self.first_day
+        while day <= self.last_day:
+            if day.weekday() in wanted and self.has_class(day):
+                yield day
+            day += ONE_DAY
+
+
+def _ics_text(value):
+    """Escape a TEXT property value (RFC 5545 section 3.3.11)"""
+    return (str(value).replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+
+def _ics_line(line):
+    """Fold a content line at 75 octets and terminate it with CRLF"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def iter_ics(calendar, weekdays, summary, start_minutes=None, end_minutes=None,
+             location=None, uid_prefix='class'):
+    """
+    Stream an iCalendar document with one event per class meeting
+
+    Meetings are all-day events unless start and end times are given, in
+    which case they are timed events in the importer's local time.
+
+    Args:
+        calendar: SemesterCalendar
+        weekdays: Weekday names the class meets on
+        summary: Event title (e.g. the course id)
+        start_minutes: Start time in minutes since midnight, or None
+        end_minutes: End time in minutes since midnight, or None
+        location: Optional room or building
+        uid_prefix: Prefix that keeps event UIDs unique per course
+
+    Yields:
+        CRLF-terminated content lines
+    """
+    timed = start_minutes is not None and end_minutes is not None
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    yield _ics_line('BEGIN:VCALENDAR')
+    yield _ics_line('VERSION:2.0')
+    yield _ics_line('PRODID:-//Niagara University//Niagara Scheduler//EN')
+    yield _ics_line('CALSCALE:GREGORIAN')
+    yield _ics_line(f'X-WR-CALNAME:{_ics_text(summary)}')
+
+    for day in calendar.meeting_days(weekdays):
+        yield _ics_line('BEGIN:VEVENT')
+        yield _ics_line(f'UID:{uid_prefix}-{day:%Y%m%d}@niagarascheduler')
+        yield _ics_line(f'DTSTAMP:{stamp}')
+        if timed:
+            yield _ics_line(f'DTSTART:{day:%Y%m%d}T{start_minutes // 60:02d}{start_minutes % 60:02d}00')
+            yield _ics_line(f'DTEND:{day:%Y%m%d}T{end_minutes // 60:02d}{end_minutes % 60:02d}00')
+        else:
+            yield _ics_line(f'DTSTART;VALUE=DATE:{day:%Y%m%d}')
+            yield _ics_line(f'DTEND;VALUE=DATE:{day + ONE_DAY:%Y%m%d}')
+        yield _ics_line(f'SUMMARY:{_ics_text(summary)}')
+        if location:
+            yield _ics_line(f'LOCATION:{_ics_text(location)}')
+        notes = [event['name'] for event in calendar.events_on(day) if event['name']]
+        if notes:
+            yield _ics_line(f'DESCRIPTION:{_ics_text("; ".join(notes))}')
+        yield _ics_line('END:VEVENT')
+
+    yield _ics_line('END:VCALENDAR')
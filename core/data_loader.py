@@ -4,15 +4,31 @@ import json
 import os
 from core.department import Department
 from core.course import Course
+from core.department_manifest import DepartmentManifest
+from core.semester_registry import get_semester_registry
+from core.meeting_time import MeetingIndex, normalize_offering, meetings_from_offering
+from core.program_mapping import ProgramMatcher, department_overviews
+
+PROGRAM_OVERVIEWS_FILENAME = 'program_overviews.json'
 
 
 class DepartmentDataLoader:
-    def __init__(self, data_directory):
-        """Initialize loader with directory containing department JSON files"""
+    def __init__(self, data_directory, program_overviews_path=None):
+        """Initialize loader with directory containing department JSON files
+
+        Departments without a mission statement borrow the overview of the
+        best matching program from program_overviews_path (default
+        <data_directory>/program_overviews.json).
+        """
         self.data_directory = data_directory
+        self.manifest = DepartmentManifest(data_directory)
+        self.semester_registry = get_semester_registry(data_directory)
+        self.program_overviews_path = program_overviews_path or os.path.join(data_directory, PROGRAM_OVERVIEWS_FILENAME)
+        self._meeting_indexes = {}
+        self._program_overviews = (None, {})
     
-    def load_department(self, department_abbreviation):
-        """Load Department object from JSON file"""
+    def department_file_path(self, department_abbreviation):
+        """Path to a department's JSON file, or None if it does not exist"""
         # Try departments/ subfolder first, then legacy location
         dept_file_path = os.path.join(self.data_directory, 'departments', f"{department_abbreviation}.json")
         if not os.path.exists(dept_file_path):
@@ -22,7 +38,18 @@ class DepartmentDataLoader:
         if not os.path.exists(dept_file_path):
             return None
         
-        file_path = dept_file_path
+        return dept_file_path
+    
+    def load_department(self, department_abbreviation, enrich=True):
+        """Load Department object from JSON file
+        
+        With enrich=False the department is returned exactly as stored, without
+        a mission statement borrowed from program overviews; use it for
+        departments that will be written back to disk.
+        """
+        file_path = self.department_file_path(department_abbreviation)
+        if not file_path:
+            return None
         
         with open(file_path, 'r') as f:
             dept_data = json.load(f)
@@ -35,7 +62,8 @@ class DepartmentDataLoader:
         # Create Department object
         return Department(
             name=dept_data.get("name"),
-            mission_statement=dept_data.get("mission_statement"),
+            mission_statement=(dept_data.get("mission_statement")
+                               or (self.program_mission_statement(department_abbreviation) if enrich else None)),
             office=dept_data.get("office"),
             course_listing_url=dept_data.get("course_listing_url"),
             course_descriptions_url=dept_data.get("course_descriptions_url"),
@@ -65,21 +93,149 @@ class DepartmentDataLoader:
     
     def get_all_departments(self):
         """Get list of all available department abbreviations"""
-        departments = []
+        # departments/ subfolder first, then legacy location (see DepartmentManifest)
+        return self.manifest.codes()
+    
+    def department_exists(self, department_abbreviation):
+        """Check whether a department file exists without loading it"""
+        return self.manifest.exists(department_abbreviation)
+    
+    def get_department_summary(self, department_abbreviation):
+        """Get name, mission statement, course count and content hash without loading courses"""
+        entry = self.manifest.get(department_abbreviation)
+        return self._enrich_summary(entry.to_dict()) if entry else None
+    
+    def get_department_summaries(self):
+        """Get summaries for every department file in listing order"""
+        return [self._enrich_summary(entry.to_dict()) for entry in self.manifest.all_entries()]
+    
+    def _enrich_summary(self, summary):
+        if not summary.get("mission_statement"):
+            summary["mission_statement"] = self.program_mission_statement(summary["code"])
+        return summary
+    
+    def get_program_mapping(self):
+        """Department code -> program overview chosen for it (see core.program_mapping)"""
+        return {code: match.to_dict() for code, (match, _) in self._department_program_overviews().items()}
+    
+    def program_mission_statement(self, department_abbreviation):
+        """Overview of the program mapped to a department, or None"""
+        chosen = self._department_program_overviews().get(department_abbreviation)
+        return chosen[1] if chosen else None
+    
+    def _department_program_overviews(self):
+        """Map program overviews to departments once per change of the overviews file"""
+        try:
+            stat = os.stat(self.program_overviews_path)
+        except OSError:
+            self._program_overviews = (None, {})
+            return {}
+        signature = (stat.st_mtime_ns, stat.st_size, tuple(self.manifest.codes()))
+        if self._program_overviews[0] == signature:
+            return self._program_overviews[1]
         
-        # Try departments/ subfolder first
-        dept_dir = os.path.join(self.data_directory, 'departments')
-        if os.path.exists(dept_dir):
-            for filename in os.listdir(dept_dir):
-                if filename.endswith('.json'):
-                    dept_abbrev = filename[:-5]  # Remove .json extension
-                    departments.append(dept_abbrev)
+        try:
+            with open(self.program_overviews_path, 'r') as f:
+                program_overviews = json.load(f)
+        except ValueError:
+            program_overviews = {}
+        if not isinstance(program_overviews, dict):
+            program_overviews = {}
         
-        # Also check legacy location for backward compatibility
-        for filename in os.listdir(self.data_directory):
-            if filename.endswith('.json'):
-                dept_abbrev = filename[:-5]  # Remove .json extension
-                if dept_abbrev not in departments:  # Avoid duplicates
-                    departments.append(dept_abbrev)
-                    
-        return departments
\ No newline at end of file
+        department_names = {entry.code: entry.name for entry in self.manifest.all_entries() if entry.name}
+        mapped = department_overviews(program_overviews, ProgramMatcher(department_names))
+        self._program_overviews = (signature, mapped)
+        return mapped
+    
+    def get_semesters(self):
+        """Get semester codes with offering data, oldest first"""
+        return self.semester_registry.semester_codes()
+    
+    def semester_directory(self, semester):
+        """Path to the offerings directory for a semester code (e.g., '25_FA')"""
+        return os.path.join(self.data_directory, 'semesters', semester)
+
+    def load_semester_offerings(self, semester, department_abbreviation=None):
+        """Load offering rows for a semester with meeting times parsed
+
+        Each row gains "days_mask" and "meetings" fields (see core.meeting_time).
+        Department-style semester files (courses with nested offerings) are
+        flattened into rows keyed by offering code.
+        """
+        semester_dir = self.semester_directory(semester)
+        if not os.path.isdir(semester_dir):
+            return []
+
+        if department_abbreviation:
+            filenames = [f"{department_abbreviation}.json"]
+        else:
+            filenames = sorted(f for f in os.listdir(semester_dir) if f.endswith('.json'))
+
+        offerings = []
+        for filename in filenames:
+            file_path = os.path.join(semester_dir, filename)
+            if not os.path.exists(file_path):
+                continue
+            with open(file_path, 'r') as f:
+                semester_data = json.load(f)
+            for row in self._semester_rows(semester_data, filename[:-5]):
+                offerings.append(normalize_offering(row))
+        return offerings
+
+    def _semester_rows(self, semester_data, department_abbreviation):
+        """Yield flat offering rows from either semester file layout"""
+        if isinstance(semester_data, list):
+            for row in semester_data:
+                yield dict(row)
+            return
+
+        for course_data in semester_data.get("courses", []):
+            for offering_data in course_data.get("offerings", []):
+                yield {
+                    "department": offering_data.get("department") or department_abbreviation,
+                    "number": offering_data.get("code", ""),
+                    "name": course_data.get("title", ""),
+                    "credits": offering_data.get("credits"),
+                    "delivery_type": offering_data.get("delivery_type"),
+                    "designation": offering_data.get("designation")
+                }
+
+    def _semester_signature(self, semester):
+        """Cheap change signature for a semester directory (names, mtimes, sizes)"""
+        semester_dir = self.semester_directory(semester)
+        if not os.path.isdir(semester_dir):
+            return None
+        signature = []
+        for entry in os.scandir(semester_dir):
+            if entry.name.endswith('.json'):
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(signature))
+
+    def invalidate_department(self, department_abbreviation=None):
+        """Forget cached summaries for one department (or all) so they are re-read"""
+        self.manifest.invalidate(department_abbreviation)
+        if department_abbreviation is None:
+            self._program_overviews = (None, {})
+    
+    def invalidate_semester(self, semester=None):
+        """Drop the cached meeting index for one semester (or all)"""
+        if semester is None:
+            self._meeting_indexes = {}
+        else:
+            self._meeting_indexes.pop(semester, None)
+    
+    def get_meeting_index(self, semester):
+        """Get (and cache) a MeetingIndex over all sections offered in a semester"""
+        signature = self._semester_signature(semester)
+        cached = self._meeting_indexes.get(semester)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        index = MeetingIndex()
+        for offering in self.load_semester_offerings(semester):
+            meetings = meetings_from_offering(offering)
+            if meetings:
+                index.add(offering.get('number', ''), meetings)
+        self._meeting_indexes[semester] = (signature, index)
+        return index
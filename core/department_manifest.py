@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+"""
+Lightweight manifest of department files
+
+Holds code, name, mission statement, course count and content hash for
+every department JSON file so listings and existence checks never build
+Course objects. Directory listings are only repeated when a directory's
+mtime changes, and a file is only re-read when its mtime or size changes.
+"""
+
+import hashlib
+import json
+import os
+
+
+class DepartmentManifestEntry:
+    """Summary of one department file"""
+
+    def __init__(self, code, path, name=None, mission_statement=None, course_count=0,
+                 content_hash=None, mtime_ns=None, size=None):
+        self.code = code
+        self.path = path
+        self.name = name
+        self.mission_statement = mission_statement
+        self.course_count = course_count
+        self.content_hash = content_hash
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+    @classmethod
+    def from_file(cls, code, path, stat=None):
+        """Read a department file once and summarize it"""
+        stat = stat or os.stat(path)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            data = {}
+        courses = data.get("courses")
+        return cls(
+            code=code,
+            path=path,
+            name=data.get("name"),
+            mission_statement=data.get("mission_statement"),
+            course_count=len(courses) if isinstance(courses, list) else 0,
+            content_hash=hashlib.sha256(raw).hexdigest(),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size
+        )
+
+    def to_dict(self):
+        """Serialize manifest entry to dictionary"""
+        return {
+            "code": self.code,
+            "name": self.name,
+            "mission_statement": self.mission_statement,
+            "course_count": self.course_count,
+            "content_hash": self.content_hash
+        }
+
+
+class DepartmentManifest:
+    """Manifest of all department files, kept in sync by stat checks"""
+
+    def __init__(self, data_directory):
+        self.data_directory = data_directory
+        self.entries = {}
+        self._paths = {}
+        self._dir_mtimes = None
+
+    def _directories(self):
+        # departments/ subfolder takes precedence over the legacy location
+        return [os.path.join(self.data_directory, 'departments'), self.data_directory]
+
+    def _current_dir_mtimes(self):
+        mtimes = []
+        for directory in self._directories():
+            try:
+                mtimes.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    def _scan(self):
+        """List department files in precedence order"""
+        paths = {}
+        for directory in self._directories():
+            if not os.path.isdir(directory):
+                continue
+            for filename in os.listdir(directory):
+                if filename.endswith('.json') and filename[:-5] not in paths:
+                    paths[filename[:-5]] = os.path.join(directory, filename)
+        return paths
+
+    def refresh_listing(self):
+        """Re-list directories only if one of them changed"""
+        mtimes = self._current_dir_mtimes()
+        if mtimes == self._dir_mtimes:
+            return False
+        self._dir_mtimes = mtimes
+        self._paths = self._scan()
+        for code in list(self.entries):
+            if code not in self._paths or self.entries[code].path != self._paths[code]:
+                del self.entries[code]
+        return True
+
+    def refresh(self):
+        """Bring every entry up to date, re-reading only changed files"""
+        self.refresh_listing()
+        for code, path in self._paths.items():
+            self._refresh_entry(code, path)
+
+    def _refresh_entry(self, code, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.entries.pop(code, None)
+            return None
+        entry = self.entries.get(code)
+        if entry is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            entry = DepartmentManifestEntry.from_file(code, path, stat)
+            self.entries[code] = entry
+        return entry
+
+    def invalidate(self, code=None):
+        """Forget one entry (or everything) so it is re-read on next access"""
+        if code is None:
+            self.entries = {}
+            self._dir_mtimes = None
+        else:
+            self.entries.pop(code, None)
+
+    def codes(self):
+        """Department codes in listing order"""
+        self.refresh_listing()
+        return list(self._paths)
+
+    def exists(self, code):
+        """True if a department file exists for code"""
+        self.refresh_listing()
+        return code in self._paths
+
+    def get(self, code):
+        """Up-to-date manifest entry for code, or None"""
+        self.refresh_listing()
+        path = self._paths.get(code)
+        return self._refresh_entry(code, path) if path else None
+
+    def all_entries(self):
+        """Up-to-date manifest entries in listing order"""
+        self.refresh()
+        return [self.entries[code] for code in self._paths if code in self.entries]
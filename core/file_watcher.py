@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+
+"""
+File watcher for the data, calendar and template directories
+
+A FileWatcher watches named areas (e.g. 'departments' -> data/departments)
+and publishes batches of FileChange events to its subscribers, so caches
+can drop or rebuild only the entries whose files changed. Areas are watched
+one level deep: files in the area directory and files in its immediate
+subdirectories (data/semesters/25_FA/THR.json), plus the subdirectories
+themselves.
+
+Two backends produce the raw changes:
+
+    inotify   Linux kernel notifications through libc (no extra packages);
+              used when available and every area directory exists
+    polling   stat walk of the areas every interval, diffed against the
+              previous walk
+
+Changes arriving close together are coalesced per path before publishing,
+so an atomic write (temp file, then rename) is a single 'modified' event.
+Hidden files (the temp files of core.file_writer.write_atomic and sidecar
+indexes) are ignored.
+
+A watcher can also tail a change manifest (core.file_writer.AtomicWriter):
+its new records are published with the backend's changes. Records for files
+in a watched area join that area; files directly beside the manifest, such
+as data/program_overviews.json, are reported in the MANIFEST_AREA area.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from collections import namedtuple
+from core.file_writer import read_change_manifest
+
+CREATED = 'created'
+MODIFIED = 'modified'
+DELETED = 'deleted'
+
+# area: watched area name; kind: created/modified/deleted; path: absolute path;
+# name: path relative to the area directory with '/' separators; is_dir: directory change
+FileChange = namedtuple('FileChange', ['area', 'kind', 'path', 'name', 'is_dir'])
+
+# Quiet period that ends a batch of changes
+SETTLE_SECONDS = 0.2
+
+# Area of manifest records for files next to the manifest itself
+MANIFEST_AREA = 'data'
+
+
+def _ignored(filename):
+    return filename.startswith('.') or filename.endswith(('.tmp', '~'))
+
+
+def coalesce(changes):
+    """Merge changes to the same path, keeping the net effect, in first-seen order"""
+    merged = {}
+    for change in changes:
+        previous = merged.get(change.path)
+        kind = change.kind
+        if previous is not None:
+            if previous.kind == CREATED and kind == MODIFIED:
+                kind = CREATED
+            elif previous.kind == CREATED and kind == DELETED:
+                del merged[change.path]
+                continue
+            elif previous.kind == DELETED and kind == CREATED:
+                kind = MODIFIED
+        merged[change.path] = change._replace(kind=kind)
+    return list(merged.values())
+
+
+class PollingBackend:
+    """Detects changes by diffing stat walks of the watched areas"""
+
+    name = 'polling'
+
+    def __init__(self, areas, interval=1.0):
+        self.areas = areas
+        self.interval = interval
+        self._snapshot = self._walk()
+
+    def _walk(self):
+        snapshot = {}
+        for area, directory in self.areas.items():
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if _ignored(entry.name):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.is_dir():
+                    snapshot[entry.path] = (area, entry.name, True, None)
+                    try:
+                        children = list(os.scandir(entry.path))
+                    except OSError:
+                        continue
+                    for child in children:
+                        if _ignored(child.name) or not child.is_file():
+                            continue
+                        try:
+                            child_stat = child.stat()
+                        except OSError:
+                            continue
+                        snapshot[child.path] = (area, f"{entry.name}/{child.name}", False,
+                                                (child_stat.st_mtime_ns, child_stat.st_size))
+                else:
+                    snapshot[entry.path] = (area, entry.name, False, (stat.st_mtime_ns, stat.st_size))
+        return snapshot
+
+    def read(self, timeout):
+        """Wait up to timeout seconds, then return the changes since the last read"""
+        if timeout:
+            time.sleep(timeout)
+        previous, current = self._snapshot, self._walk()
+        self._snapshot = current
+        changes = []
+        for path, (area, name, is_dir, signature) in current.items():
+            old = previous.get(path)
+            if old is None:
+                changes.append(FileChange(area, CREATED, path, name, is_dir))
+            elif old[3] != signature:
+                changes.append(FileChange(area, MODIFIED, path, name, is_dir))
+        for path, (area, name, is_dir, _) in previous.items():
+            if path not in current:
+                changes.append(FileChange(area, DELETED, path, name, is_dir))
+        return changes
+
+    def close(self):
+        pass
+
+
+class InotifyBackend:
+    """Linux inotify through libc, one watch per area directory and subdirectory"""
+
+    name = 'inotify'
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+                  | IN_DELETE | IN_DELETE_SELF | IN_ATTRIB)
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, areas):
+        libc_name = ctypes.util.find_library('c')
+        libc = ctypes.CDLL(libc_name, use_errno=True) if libc_name else None
+        if libc is None or not hasattr(libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+        self._libc = libc
+        self.areas = areas
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        # watch descriptor -> (area, directory, prefix of names relative to the area)
+        self._watches = {}
+        # Files being written (IN_CREATE seen, IN_CLOSE_WRITE pending)
+        self._opened = set()
+        try:
+            for area, directory in areas.items():
+                self._add_watch(area, directory, '')
+                for entry in os.scandir(directory):
+                    if entry.is_dir() and not _ignored(entry.name):
+                        self._add_watch(area, entry.path, f"{entry.name}/")
+        except Exception:
+            self.close()
+            raise
+
+    def _add_watch(self, area, directory, prefix):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+        self._watches[wd] = (area, directory, prefix)
+
+    def read(self, timeout):
+        """Wait up to timeout seconds for events and return them as FileChanges"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        changes = []
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self.EVENT_HEADER.size
+            filename = buffer[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+            changes.extend(self._translate(wd, mask, filename))
+        return changes
+
+    def _translate(self, wd, mask, filename):
+        if mask & self.IN_Q_OVERFLOW:
+            raise OSError('inotify event queue overflowed')
+        watch = self._watches.get(wd)
+        if watch is None:
+            return []
+        area, directory, prefix = watch
+        if mask & (self.IN_IGNORED | self.IN_DELETE_SELF):
+            if mask & self.IN_IGNORED:
+                del self._watches[wd]
+            return []
+        if not filename or _ignored(filename):
+            return []
+
+        path = os.path.join(directory, filename)
+        name = prefix + filename
+        is_dir = bool(mask & self.IN_ISDIR)
+        if is_dir:
+            if prefix:
+                return []  # only one level of subdirectories is watched
+            if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._add_watch(area, path, f"{filename}/")
+                return [FileChange(area, CREATED, path, name, True)] + self._existing_files(area, path, name)
+            if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                return [FileChange(area, DELETED, path, name, True)]
+            return []
+
+        if mask & self.IN_CREATE:
+            # Announced when the writer closes the file
+            self._opened.add(path)
+            return []
+        if mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+            kind = CREATED if path in self._opened else MODIFIED
+            self._opened.discard(path)
+            return [FileChange(area, kind, path, name, False)]
+        if mask & self.IN_ATTRIB and path not in self._opened:
+            return [FileChange(area, MODIFIED, path, name, False)]
+        if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+            self._opened.discard(path)
+            return [FileChange(area, DELETED, path, name, False)]
+        return []
+
+    def _existing_files(self, area, directory, name):
+        """Files already inside a directory that appeared (e.g. moved into place whole)"""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return []
+        return [FileChange(area, CREATED, entry.path, f"{name}/{entry.name}", False)
+                for entry in entries if entry.is_file() and not _ignored(entry.name)]
+
+    def close(self):
+        if self.fd is not None and self.fd >= 0:
+            os.close(self.fd)
+        self.fd = None
+
+
+def create_backend(areas, interval=1.0, backend='auto'):
+    """
+    Create a change backend for the watched areas
+
+    Args:
+        areas: Mapping of area name to directory
+        interval: Polling interval in seconds
+        backend: 'inotify', 'polling' or 'auto' (inotify when every area
+            directory exists and the platform supports it)
+    """
+    if backend in ('auto', 'inotify'):
+        try:
+            if not all(os.path.isdir(directory) for directory in areas.values()):
+                raise OSError('inotify needs every watched directory to exist')
+            return InotifyBackend(areas)
+        except (OSError, AttributeError):
+            if backend == 'inotify':
+                raise
+    return PollingBackend(areas, interval)
+
+
+class FileWatcher:
+    """Publishes coalesced batches of FileChange events from a background thread"""
+
+    def __init__(self, areas, interval=1.0, backend='auto', manifest_path=None):
+        """
+        Args:
+            areas: Mapping of area name to directory, e.g. {'calendars': 'calendars/'}
+            interval: Seconds between polls (polling backend) or waits for events
+            backend: 'auto', 'inotify' or 'polling'
+            manifest_path: Optional change manifest whose new records are
+                published too (records written before the watcher started are skipped)
+        """
+        # Absolute directories, so backend and manifest paths coalesce
+        self.areas = {area: os.path.abspath(directory) for area, directory in areas.items()}
+        self.interval = interval
+        self.backend = create_backend(self.areas, interval, backend)
+        self.manifest_path = manifest_path
+        try:
+            self._manifest_offset = os.path.getsize(manifest_path) if manifest_path else 0
+        except OSError:
+            self._manifest_offset = 0
+        self._subscribers = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        """Call callback(changes) with every published batch"""
+        self._subscribers.append(callback)
+        return callback
+
+    def poll(self, timeout=0):
+        """Wait up to timeout seconds for changes, let them settle, publish and return them"""
+        changes = self._read(timeout)
+        if not changes:
+            return []
+        while True:
+            more = self._read(SETTLE_SECONDS if self.backend.name == 'inotify' else 0)
+            if not more:
+                break
+            changes.extend(more)
+        batch = coalesce(changes)
+        for callback in list(self._subscribers):
+            callback(batch)
+        return batch
+
+    def _read(self, timeout):
+        try:
+            changes = self.backend.read(timeout)
+        except OSError:
+            # Lost events (queue overflow): rescan by polling from now on
+            self.backend.close()
+            self.backend = PollingBackend(self.areas, self.interval)
+            changes = [FileChange(area, MODIFIED, directory, '', True) for area, directory in self.areas.items()]
+        if self.manifest_path:
+            changes.extend(self._read_manifest())
+        return changes
+
+    def _read_manifest(self):
+        records, self._manifest_offset = read_change_manifest(self.manifest_path, self._manifest_offset)
+        changes = []
+        for record in records:
+            change = self._manifest_change(record)
+            if change is not None:
+                changes.append(change)
+        return changes
+
+    def _manifest_change(self, record):
+        path = record.get('path')
+        if not path:
+            return None
+        path = os.path.abspath(path)
+        kind = CREATED if record.get('action') == 'created' else MODIFIED
+        # Areas are watched one level deep, so only area/file and area/folder/file count
+        for area, directory in self.areas.items():
+            name = os.path.relpath(path, directory)
+            if not name.startswith(os.pardir) and name.count(os.sep) <= 1:
+                return FileChange(area, kind, path, name.replace(os.sep, '/'), False)
+        if os.path.dirname(path) == os.path.dirname(os.path.abspath(self.manifest_path)):
+            return FileChange(MANIFEST_AREA, kind, path, os.path.basename(path), False)
+        return None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll(self.interval)
+            except Exception:
+                # A failing subscriber must not stop the watcher
+                time.sleep(self.interval)
+
+    def start(self):
+        """Start watching in a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='file-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the watcher thread and release the backend"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.interval + 1)
+            self._thread = None
+        self.backend.close()
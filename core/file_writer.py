@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+
+"""
+Atomic, diff-aware file writes for generated JSON data
+
+Content is written to a temp file in the target directory, fsynced and
+renamed over the target, so readers only ever see the old or the new file.
+A write whose content hash matches the file on disk is skipped entirely.
+Every real change can be appended to a change manifest (JSON lines) that
+caches use to invalidate only what moved. The manifest, like other JSON-lines
+logs written with append_json_line, is compacted to its newest records once
+it grows past MAX_MANIFEST_BYTES.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Not a .json file, so directory scans for departments/semesters ignore it
+CHANGE_MANIFEST_NAME = '.changes.jsonl'
+
+# JSON-lines log size that triggers compaction; compaction keeps the newest half
+MAX_MANIFEST_BYTES = 1024 * 1024
+
+
+def content_hash(data):
+    """SHA-256 hex digest of str or bytes"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except OSError:
+        return None
+
+
+def write_atomic(path, data):
+    """Write str or bytes to path via temp file, fsync and rename"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory):
+    # Persist the rename itself; not supported on every platform
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class AtomicWriter:
+    """Writes files atomically, skips unchanged content and records changes"""
+
+    def __init__(self, manifest_path=None, max_manifest_bytes=MAX_MANIFEST_BYTES):
+        """
+        Args:
+            manifest_path: Optional JSON-lines file to append change records to
+            max_manifest_bytes: Compact the manifest once it grows past this size
+        """
+        self.manifest_path = manifest_path
+        self.max_manifest_bytes = max_manifest_bytes
+        self.changes = []
+        self.unchanged = 0
+        self._lock = threading.Lock()
+
+    def write_text(self, path, text):
+        """
+        Write text to path unless the file already holds identical content
+
+        Returns:
+            True if the file was created or replaced, False if skipped
+        """
+        new_hash = content_hash(text)
+        previous_hash = file_hash(path)
+        if new_hash == previous_hash:
+            with self._lock:
+                self.unchanged += 1
+            return False
+
+        write_atomic(path, text)
+        self._record({
+            "path": os.path.abspath(path),
+            "action": "updated" if previous_hash else "created",
+            "content_hash": new_hash,
+            "previous_hash": previous_hash,
+            "time": time.time()
+        })
+        return True
+
+    def write_json(self, path, data, indent=2):
+        """Serialize data as JSON and write it with write_text"""
+        return self.write_text(path, json.dumps(data, indent=indent))
+
+    def _record(self, change):
+        with self._lock:
+            self.changes.append(change)
+            if self.manifest_path:
+                append_json_line(self.manifest_path, change, self.max_manifest_bytes)
+
+    def changed_paths(self):
+        """Paths written so far"""
+        return [change["path"] for change in self.changes]
+
+
+def append_json_line(path, record, max_bytes=MAX_MANIFEST_BYTES):
+    """Append a record to a JSON-lines log, compacting it once it exceeds max_bytes"""
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+        size = f.tell()
+    if max_bytes and size > max_bytes:
+        compact_json_lines(path, max_bytes // 2)
+
+
+def compact_json_lines(path, keep_bytes):
+    """Rewrite a JSON-lines file keeping only its newest records, up to keep_bytes"""
+    try:
+        with open(path, 'rb') as f:
+            lines = f.readlines()
+    except OSError:
+        return
+    kept = []
+    size = 0
+    for line in reversed(lines):
+        if not line.endswith(b'\n'):
+            continue
+        size += len(line)
+        if size > keep_bytes:
+            break
+        kept.append(line)
+    write_atomic(path, b''.join(reversed(kept)))
+
+
+def read_change_manifest(manifest_path, offset=0):
+    """
+    Read change records appended since a byte offset
+
+    An offset taken before the manifest was compacted may point past its end
+    or into the middle of a record; reading then resumes from the start or
+    from the next whole record.
+
+    Returns:
+        (records, new_offset) so callers can resume where they stopped
+    """
+    try:
+        with open(manifest_path, 'r') as f:
+            f.seek(0, os.SEEK_END)
+            if offset > f.tell():
+                offset = 0
+            if offset:
+                f.seek(offset - 1)
+                if f.read(1) != '\n':
+                    f.readline()
+            else:
+                f.seek(0)
+            lines = f.readlines()
+            new_offset = f.tell()
+    except OSError:
+        return [], offset
+
+    records = []
+    for line in lines:
+        if not line.endswith('\n'):
+            # Partially written record; pick it up next time
+            new_offset -= len(line.encode('utf-8'))
+            break
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records, new_offset
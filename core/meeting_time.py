@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+"""
+Meeting time parsing and overlap indexing for semester offerings
+
+Offering rows store meeting information as raw strings such as
+days="TTH", start_time="12:00PM", end_time="01:20PM". Rows with more than
+one meeting pattern concatenate them ("TTHW" / "10:30AM01:20PM" /
+"11:50AM02:15PM"). This module normalizes those strings into weekday
+bitmasks and minutes-since-midnight, and provides a sorted-sweep index for
+overlap queries.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+
+# Weekday bits, Monday = bit 0 through Sunday = bit 6
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DAY_BITS = {
+    'M': 1 << 0,
+    'T': 1 << 1,
+    'W': 1 << 2,
+    'TH': 1 << 3,
+    'R': 1 << 3,
+    'F': 1 << 4,
+    'S': 1 << 5,
+    'SA': 1 << 5,
+    'SU': 1 << 6,
+    'U': 1 << 6,
+}
+
+DAY_TOKEN_PATTERN = re.compile(r'TH|SA|SU|[MTWRFSU]')
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*([AP])\.?M\.?', re.IGNORECASE)
+
+
+def tokenize_days(days):
+    """Split a days string like "TTH" into weekday bits in order of appearance"""
+    if not days:
+        return []
+    return [DAY_BITS[token] for token in DAY_TOKEN_PATTERN.findall(days.upper())]
+
+
+def parse_days(days):
+    """Convert a days string like "MWF" into a weekday bitmask"""
+    mask = 0
+    for bit in tokenize_days(days):
+        mask |= bit
+    return mask
+
+
+def days_from_mask(mask):
+    """Convert a weekday bitmask into a list of weekday names"""
+    return [name for i, name in enumerate(WEEKDAY_NAMES) if mask & (1 << i)]
+
+
+def parse_times(time_text):
+    """Parse every time in a string like "10:30AM01:30PM" into minutes since midnight"""
+    if not time_text:
+        return []
+    minutes = []
+    for hour, minute, meridiem in TIME_PATTERN.findall(time_text):
+        hour = int(hour) % 12
+        if meridiem.upper() == 'P':
+            hour += 12
+        minutes.append(hour * 60 + int(minute))
+    return minutes
+
+
+def parse_time(time_text):
+    """Parse a single time like "11:10AM" into minutes since midnight, or None"""
+    times = parse_times(time_text)
+    return times[0] if times else None
+
+
+def format_minutes(minutes):
+    """Format minutes since midnight as "HH:MMAM" like the source data"""
+    hour, minute = divmod(minutes, 60)
+    meridiem = 'PM' if hour >= 12 else 'AM'
+    hour = hour % 12 or 12
+    return f"{hour:02d}:{minute:02d}{meridiem}"
+
+
+def split_day_groups(days, group_count):
+    """
+    Split a concatenated days string into one bitmask per meeting pattern
+
+    A new group starts whenever a weekday repeats or goes backwards
+    ("MWFW" -> MWF + W, "TTHTH" -> TTH + TH). If that does not produce the
+    expected number of groups, every meeting is assumed to use all days.
+    """
+    bits = tokenize_days(days)
+    if group_count <= 1:
+        return [parse_days(days)]
+
+    groups = []
+    current = 0
+    last_bit = 0
+    for bit in bits:
+        if current and bit <= last_bit:
+            groups.append(current)
+            current = 0
+        current |= bit
+        last_bit = bit
+    if current:
+        groups.append(current)
+
+    if len(groups) != group_count:
+        return [parse_days(days)] * group_count
+    return groups
+
+
+class MeetingTime:
+    """A single weekly meeting pattern: weekday bitmask plus start/end minutes"""
+
+    def __init__(self, days_mask, start, end):
+        self.days_mask = days_mask
+        self.start = start
+        self.end = end
+
+    def overlaps(self, other):
+        """True if both meetings share a weekday and their times intersect"""
+        return bool(self.days_mask & other.days_mask) and self.start < other.end and other.start < self.end
+
+    def weekdays(self):
+        """Weekday names for this meeting"""
+        return days_from_mask(self.days_mask)
+
+    def to_dict(self):
+        """Serialize meeting to dictionary"""
+        return {
+            "days_mask": self.days_mask,
+            "start_minutes": self.start,
+            "end_minutes": self.end
+        }
+
+    def __eq__(self, other):
+        return (isinstance(other, MeetingTime) and
+                (self.days_mask, self.start, self.end) == (other.days_mask, other.start, other.end))
+
+    def __repr__(self):
+        return f"MeetingTime({self.days_mask:#09b}, {format_minutes(self.start)}-{format_minutes(self.end)})"
+
+
+def parse_meetings(days, start_time, end_time):
+    """Parse raw days/start/end strings into a list of MeetingTime objects"""
+    starts = parse_times(start_time)
+    ends = parse_times(end_time)
+    count = min(len(starts), len(ends))
+    if not days or count == 0:
+        return []
+
+    masks = split_day_groups(days, count)
+    meetings = []
+    for mask, start, end in zip(masks, starts, ends):
+        if mask and end > start:
+            meetings.append(MeetingTime(mask, start, end))
+    return meetings
+
+
+def normalize_offering(offering):
+    """
+    Add parsed meeting fields to an offering row
+
+    Adds "days_mask" (union of all meeting days) and "meetings" (one entry per
+    meeting pattern). Rows without schedule information get an empty list.
+    """
+    meetings = parse_meetings(offering.get('days'), offering.get('start_time'), offering.get('end_time'))
+    days_mask = 0
+    for meeting in meetings:
+        days_mask |= meeting.days_mask
+    offering['days_mask'] = days_mask
+    offering['meetings'] = [meeting.to_dict() for meeting in meetings]
+    return offering
+
+
+def meetings_from_offering(offering):
+    """Rebuild MeetingTime objects from a normalized offering row"""
+    if 'meetings' not in offering:
+        normalize_offering(offering)
+    return [MeetingTime(m['days_mask'], m['start_minutes'], m['end_minutes']) for m in offering['meetings']]
+
+
+class MeetingIndex:
+    """
+    Sorted-sweep overlap index over section meeting times
+
+    Intervals are kept per weekday sorted by start time. Because the longest
+    interval on each day is known, an overlap query only needs to look at
+    intervals starting in (start - longest, end), which is found by bisection.
+    """
+
+    def __init__(self):
+        self._pending = [[] for _ in WEEKDAY_NAMES]
+        self._starts = [[] for _ in WEEKDAY_NAMES]
+        self._entries = [[] for _ in WEEKDAY_NAMES]
+        self._longest = [0 for _ in WEEKDAY_NAMES]
+        self._meetings = {}
+        self._dirty = False
+
+    def add(self, key, meetings):
+        """Add a section's meetings under the given key"""
+        self._meetings.setdefault(key, []).extend(meetings)
+        for meeting in meetings:
+            for day in range(len(WEEKDAY_NAMES)):
+                if meeting.days_mask & (1 << day):
+                    self._pending[day].append((meeting.start, meeting.end, key))
+        self._dirty = True
+
+    def _build(self):
+        for day in range(len(WEEKDAY_NAMES)):
+            if not self._pending[day]:
+                continue
+            entries = sorted(self._entries[day] + self._pending[day])
+            self._entries[day] = entries
+            self._starts[day] = [start for start, _, _ in entries]
+            self._longest[day] = max(end - start for start, end, _ in entries)
+            self._pending[day] = []
+        self._dirty = False
+
+    def meetings_for(self, key):
+        """Meetings indexed under a key"""
+        return self._meetings.get(key, [])
+
+    def __contains__(self, key):
+        return key in self._meetings
+
+    def __len__(self):
+        return len(self._meetings)
+
+    def overlapping(self, meetings, exclude=None):
+        """Return the set of keys whose meetings overlap any of the given meetings"""
+        if self._dirty:
+            self._build()
+
+        found = set()
+        for meeting in meetings:
+            for day in range(len(WEEKDAY_NAMES)):
+                if not meeting.days_mask & (1 << day):
+                    continue
+                starts = self._starts[day]
+                entries = self._entries[day]
+                lo = bisect_right(starts, meeting.start - self._longest[day])
+                hi = bisect_left(starts, meeting.end)
+                for start, end, key in entries[lo:hi]:
+                    if end > meeting.start and key != exclude:
+                        found.add(key)
+        return found
+
+    def overlapping_key(self, key):
+        """Return the set of keys that overlap the section indexed under key"""
+        return self.overlapping(self.meetings_for(key), exclude=key)
+
+
+def find_conflicts(sections):
+    """
+    Find conflicting pairs among a student's chosen sections
+
+    Args:
+        sections: Mapping of section key to list of MeetingTime objects
+
+    Returns:
+        Sorted list of (key_a, key_b) tuples that overlap
+    """
+    conflicts = set()
+    for day in range(len(WEEKDAY_NAMES)):
+        intervals = sorted(
+            (meeting.start, meeting.end, key)
+            for key, meetings in sections.items()
+            for meeting in meetings
+            if meeting.days_mask & (1 << day)
+        )
+        active = []
+        for start, end, key in intervals:
+            active = [item for item in active if item[0] > start]
+            for _, other in active:
+                if other != key:
+                    conflicts.add(tuple(sorted((key, other))))
+            active.append((end, key))
+    return sorted(conflicts)
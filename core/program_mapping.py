@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+
+"""
+Map academic program names to department codes
+
+Three matchers are compiled once from the explicit program table and the
+department names, then applied in order:
+
+    exact       program name is in PROGRAM_DEPARTMENTS
+    normalized  name matches after dropping degree words, "(Minor)",
+                "Online" and punctuation
+    tokens      best token overlap (Dice coefficient) against department
+                names and the known program names, scored through an
+                inverted index
+
+match_all() runs every program through the matchers in one pass, so the
+mapping for the whole program_overviews.json costs one index lookup per
+token rather than a scan of every department per program.
+"""
+
+import re
+
+from core.search_index import stem, tokenize
+
+EXACT = 'exact'
+NORMALIZED = 'normalized'
+TOKENS = 'tokens'
+
+# Matchers in order of confidence
+METHOD_RANK = {EXACT: 0, NORMALIZED: 1, TOKENS: 2}
+
+# Minimum Dice score for a token-overlap match
+MIN_TOKEN_SCORE = 0.5
+
+# Degree and format words that say nothing about the subject
+NOISE_WORDS = frozenset([
+    'master', 'masters', 'bachelor', 'bachelors', 'science', 'arts', 'ms', 'ma', 'bs', 'ba',
+    'mba', 'phd', 'minor', 'online', 'campus', 'program', 'programs', 'degree', 'completion',
+    'advanced', 'certificate', 'studies'
+])
+
+PARENTHETICAL_PATTERN = re.compile(r'\([^)]*\)')
+
+PROGRAM_DEPARTMENTS = {
+    # Accounting programs
+    'Accounting': 'ACC',
+    '3+1 Accounting Program': 'ACC',
+    'Master of Science in Accounting': 'ACC',
+
+    # Business programs
+    'Finance': 'FIN',
+    'Management': 'MGT',
+    'Marketing': 'MKG',
+    'Master of Business Administration': 'BUS',
+    'Marketing Food and Consumer Packaged Goods': 'MKG',
+    'Supply Chain Management': 'BUS',
+    'Food Industry Management': 'MHR',
+
+    # Biology/Science programs
+    'Biology and Biotechnology': 'BIO',
+    'Chemistry and Biochemistry': 'CHE',
+    'Environmental Science': 'ENV',
+    'Mathematics': 'MAT',
+    'Actuarial Science': 'MAT',
+    'Pre-Health Professions': 'BIO',
+
+    # Computer Science
+    'Computer and Information Sciences': 'CIS',
+    'M.S. Information Security and Digital Forensics Online (ISDF)': 'CIS',
+
+    # Education programs
+    'Adolescence Education (Grades 7-12)': 'EDU',
+    'Childhood and Middle Childhood Education': 'EDU',
+    'Early Childhood and Childhood Education': 'EDU',
+    'Middle Childhood and Adolescence Education': 'EDU',
+    'Special Education': 'EDU',
+    'Master of Science in Elementary and Secondary Education Online': 'EDU',
+    'Master of Science in Special Education Online': 'EDU',
+    'Master of Science in Literacy and English Language Learners Online': 'EDU',
+    'Master of Science in Theatre Education Online': 'THR',
+    'Teaching English to Speakers of Other Languages': 'ESL',
+
+    # Liberal Arts programs
+    'English': 'ENG',
+    'History': 'HIS',
+    'Philosophy': 'PHI',
+    'Political Science': 'POL',
+    'Psychology': 'PSY',
+    'Sociology': 'SOC',
+    'Religious Studies': 'REL',
+    'French': 'FRE',
+    'Spanish': 'SPA',
+    'Modern and Classical Languages': 'FRE',  # Could also be SPA, LAT, etc.
+
+    # Communication and Media
+    'Communication and Media Studies': 'CMS',
+    'Social Media, Digital Marketing, and Artificial Intelligence': 'CMS',
+
+    # Criminal Justice
+    'Criminology and Criminal Justice': 'CRJ',
+    'M.S. Criminal Justice Administration': 'CRJ',
+
+    # Nursing
+    'Nursing': 'NUR',
+    'ASDBS Nursing': 'NUR',
+    'Nursing RPN to BS': 'NUR',
+    'RN to BS Completion Program': 'NUR',
+    'Family Nurse Practitioner': 'NUR',
+    'Master of Science in Nursing Education': 'NUR',
+
+    # Theatre
+    'Theatre Studies and Fine Arts': 'THR',
+
+    # Economics
+    'Economics': 'ECO',
+
+    # Fine Arts
+    'Art History with Museum Studies': 'FAA',
+
+    # Hotel/Tourism Management
+    'Hotel and Restaurant Management': 'MHR',
+    'Tourism and Event Management': 'TRM',
+    'Sport and Recreation Management': 'SPM',
+    'Master of Science in Sports Management': 'SPM',
+
+    # Social Work
+    'Social Work': 'SWK',
+
+    # Gerontology
+    'Gerontology': 'GRN',
+
+    # International Studies
+    'International Studies': 'INT',
+
+    # Liberal Arts
+    'Liberal Arts': 'LAM',
+    'General Studies': 'LAM',
+
+    # Pre-professional
+    'Pre-Law': 'POL',  # Often housed in political science
+
+    # Psychology/Counseling
+    'Clinical Mental Health Counseling': 'PSY',
+    'Master of Science in School Psychology': 'PSY',
+
+    # Minor programs - map to related departments
+    'American Sign Language and Deaf Studies (Minor)': 'ASL',
+    'Africana/Black Studies (Minor)': 'SOC',  # Often in sociology
+    'Film Studies (Minor)': 'CMS',  # Often in communication
+    'Women\'s Studies (Minor)': 'SOC',  # Often in sociology
+}
+
+
+def name_tokens(name):
+    """Stemmed subject tokens of a program or department name"""
+    text = PARENTHETICAL_PATTERN.sub(' ', name or '').replace('.', '')
+    return [stem(token) for token in tokenize(text) if token not in NOISE_WORDS]
+
+
+def normalize_name(name):
+    """Canonical form used by the normalized matcher"""
+    return ' '.join(name_tokens(name))
+
+
+class ProgramMatch:
+    """Department chosen for one program and how it was found"""
+
+    def __init__(self, program, department, method, score=1.0):
+        self.program = program
+        self.department = department
+        self.method = method
+        self.score = score
+
+    @property
+    def rank(self):
+        """Sort key: more confident methods and higher scores first"""
+        return (METHOD_RANK[self.method], -self.score)
+
+    def to_dict(self):
+        """Serialize match to dictionary"""
+        return {
+            "program": self.program,
+            "department": self.department,
+            "method": self.method,
+            "score": round(self.score, 3)
+        }
+
+
+class ProgramMatcher:
+    """Precompiled exact, normalized and token-overlap matchers"""
+
+    def __init__(self, department_names=None, explicit=None, min_token_score=MIN_TOKEN_SCORE):
+        """
+        Args:
+            department_names: Dict of department code -> department name
+            explicit: Program name -> department code table (default PROGRAM_DEPARTMENTS)
+            min_token_score: Lowest Dice score accepted by the token matcher
+        """
+        explicit = PROGRAM_DEPARTMENTS if explicit is None else explicit
+        department_names = department_names or {}
+        self.min_token_score = min_token_score
+
+        self._exact = dict(explicit)
+
+        # Explicit entries win over department names for the same normalized key
+        self._normalized = {}
+        for code, name in department_names.items():
+            key = normalize_name(name)
+            if key:
+                self._normalized.setdefault(key, code)
+        for program, code in explicit.items():
+            key = normalize_name(program)
+            if key:
+                self._normalized[key] = code
+
+        # Inverted index over department names and known program names:
+        # token -> ids of documents containing it
+        self._documents = []    # document id -> (department code, token count)
+        self._postings = {}
+        for code, name in list(department_names.items()) + [(code, program) for program, code in explicit.items()]:
+            tokens = set(name_tokens(name))
+            if not tokens:
+                continue
+            for token in tokens:
+                self._postings.setdefault(token, []).append(len(self._documents))
+            self._documents.append((code, len(tokens)))
+
+    def match(self, program):
+        """Best ProgramMatch for one program name, or None"""
+        return self.match_all([program]).get(program)
+
+    def match_all(self, programs):
+        """
+        Match every program in one pass
+
+        Returns:
+            Dict of program name -> ProgramMatch for programs that matched
+        """
+        matches = {}
+        for program in programs:
+            code = self._exact.get(program)
+            if code:
+                matches[program] = ProgramMatch(program, code, EXACT)
+                continue
+
+            tokens = name_tokens(program)
+            code = self._normalized.get(' '.join(tokens))
+            if code:
+                matches[program] = ProgramMatch(program, code, NORMALIZED)
+                continue
+
+            best = self._best_overlap(set(tokens))
+            if best:
+                matches[program] = ProgramMatch(program, best[0], TOKENS, best[1])
+        return matches
+
+    def _best_overlap(self, tokens):
+        """(code, Dice score) of the document sharing the most tokens"""
+        if not tokens:
+            return None
+        overlaps = {}
+        for token in tokens:
+            for doc_id in self._postings.get(token, ()):
+                overlaps[doc_id] = overlaps.get(doc_id, 0) + 1
+        best = None
+        for doc_id, shared in overlaps.items():
+            code, token_count = self._documents[doc_id]
+            score = 2.0 * shared / (len(tokens) + token_count)
+            if score >= self.min_token_score and (best is None or score > best[1]):
+                best = (code, score)
+        return best
+
+
+def department_overviews(program_overviews, matcher):
+    """
+    Pick one program overview per department
+
+    Args:
+        program_overviews: Dict of program name -> {'url', 'overview'}
+        matcher: ProgramMatcher
+
+    Returns:
+        Dict of department code -> (ProgramMatch, overview text). The most
+        confident match wins; ties keep the first program in file order.
+    """
+    best = {}
+    matches = matcher.match_all(program_overviews)
+    for program, program_data in program_overviews.items():
+        match = matches.get(program)
+        overview = (program_data or {}).get('overview')
+        if not match or not overview:
+            continue
+        current = best.get(match.department)
+        if current is None or match.rank < current[0].rank:
+            best[match.department] = (match, overview)
+    return best
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+"""
+Conflict-free section search for student schedules
+
+Each section's weekly meetings are encoded as one bitmask with a bit per
+minute of the week, so two sections conflict exactly when their masks
+share a bit. The search backtracks over required components (a course's
+lecture, its lab, ...), always expanding the component with the fewest
+remaining compatible options, and forward-checks that every other
+component still has at least one option left. Sections with identical
+masks are interchangeable and are searched as a single option.
+"""
+
+import time
+from itertools import product
+from core.meeting_time import WEEKDAY_NAMES, meetings_from_offering
+from core.offering import Offering
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def meetings_mask(meetings):
+    """Encode meetings as a minute-of-week bitmask"""
+    mask = 0
+    for meeting in meetings:
+        width = meeting.end - meeting.start
+        if width <= 0:
+            continue
+        run = (1 << width) - 1
+        for day in range(len(WEEKDAY_NAMES)):
+            if meeting.days_mask & (1 << day):
+                mask |= run << (day * MINUTES_PER_DAY + meeting.start)
+    return mask
+
+
+def section_component(section_code):
+    """Component type of a section code: "" for lecture, "L" for lab, etc."""
+    return Offering(section_code).type or ''
+
+
+class Component:
+    """One required piece of a course (e.g. ENG 110 lecture) and its time options"""
+
+    def __init__(self, course_id, component_type, options):
+        self.course_id = course_id
+        self.component_type = component_type
+        # options: list of (mask, [sections]) with one entry per distinct time pattern
+        self.options = options
+
+
+def build_components(course_sections):
+    """
+    Group each course's sections into components and time options
+
+    Args:
+        course_sections: Mapping of course id to list of offering dictionaries
+
+    Returns:
+        List of Component objects
+    """
+    components = []
+    for course_id, sections in course_sections.items():
+        by_type = {}
+        for section in sections:
+            component_type = section_component(section.get('number', ''))
+            by_type.setdefault(component_type, []).append(section)
+
+        for component_type, typed_sections in sorted(by_type.items()):
+            by_mask = {}
+            for section in typed_sections:
+                mask = meetings_mask(meetings_from_offering(section))
+                by_mask.setdefault(mask, []).append(section)
+            components.append(Component(course_id, component_type, list(by_mask.items())))
+    return components
+
+
+class ScheduleSearch:
+    """Backtracking search for conflict-free combinations of sections"""
+
+    def __init__(self, components, max_results=50, time_limit=2.0):
+        self.components = components
+        self.max_results = max_results
+        self.time_limit = time_limit
+        self.results = []
+        self.truncated = None
+        self.nodes = 0
+        self._deadline = None
+
+    def run(self):
+        """Run the search and return expanded schedules (lists of sections)"""
+        self._deadline = time.monotonic() + self.time_limit
+        domains = [component.options for component in self.components]
+        if all(domains):
+            self._search(domains, [None] * len(domains), 0)
+        return self.results
+
+    def _out_of_budget(self):
+        # The result cap is enforced in _emit, which only flags truncation once
+        # a schedule beyond the cap is actually found
+        if time.monotonic() > self._deadline:
+            self.truncated = self.truncated or 'time_limit'
+            return True
+        return False
+
+    def _search(self, domains, chosen, occupied):
+        self.nodes += 1
+        if self._out_of_budget():
+            return
+
+        remaining = [i for i, choice in enumerate(chosen) if choice is None]
+        if not remaining:
+            self._emit(chosen)
+            return
+
+        # Most constrained component first
+        index = min(remaining, key=lambda i: len(domains[i]))
+        for mask, sections in domains[index]:
+            new_occupied = occupied | mask
+            pruned = list(domains)
+            feasible = True
+            for other in remaining:
+                if other == index:
+                    continue
+                options = [option for option in domains[other] if not option[0] & new_occupied]
+                if not options:
+                    feasible = False
+                    break
+                pruned[other] = options
+            if not feasible:
+                continue
+
+            chosen[index] = sections
+            self._search(pruned, chosen, new_occupied)
+            chosen[index] = None
+            if self.truncated:
+                return
+
+    def _emit(self, chosen):
+        for combination in product(*chosen):
+            if len(self.results) >= self.max_results:
+                # One more schedule exists than fits
+                self.truncated = 'max_results'
+                return
+            self.results.append(list(combination))
+
+
+def find_schedules(course_sections, max_results=50, time_limit=2.0):
+    """
+    Find conflict-free section combinations for a list of desired courses
+
+    Args:
+        course_sections: Mapping of course id to list of offering dictionaries
+        max_results: Stop after this many schedules
+        time_limit: Stop searching after this many seconds
+
+    Returns:
+        Dictionary with schedules, truncation reason and search statistics
+    """
+    components = build_components(course_sections)
+    search = ScheduleSearch(components, max_results=max_results, time_limit=time_limit)
+    schedules = search.run()
+    return {
+        'schedules': schedules,
+        'truncated': search.truncated,
+        'nodes_explored': search.nodes,
+        'components': [
+            {
+                'course': component.course_id,
+                'type': component.component_type or 'LEC',
+                'time_options': len(component.options),
+                'sections': sum(len(sections) for _, sections in component.options)
+            } for component in components
+        ]
+    }
@@ -1,9 +1,19 @@
 #!/usr/bin/env python
 
 import os
-import json
+import heapq
+import datetime
+import arrow
+from collections import namedtuple
+from core.calendar_model import NO_CLASS_EVENT_TYPES
+from core.meeting_time import WEEKDAY_NAMES
+from core.semester_registry import get_semester_registry
 from core.utils import locale, range_of_days
 
+# One meeting pattern of a course: weekday names, optional first/last date
+# (datetime.date, None for the semester's own) and an optional label like "Lab"
+ScheduleSegment = namedtuple('ScheduleSegment', ['weekdays', 'start', 'end', 'label'])
+
 def sorted_classes(weekdays, first_day, last_day, no_classes):
     ''' Take class meetings as list of day names, return lists of Arrow objects '''
     if not first_day or not last_day:
@@ -63,35 +73,108 @@ def schedule(possible_classes, no_classes, show_no=None, fmt=None, events=None,
     
     return course
 
+def _weekly(day, end, index):
+    ''' Every seventh day from day through end, tagged with a segment index '''
+    step = datetime.timedelta(days=7)
+    while day <= end:
+        yield day, index
+        day += step
+
+def merge_segment_meetings(segments, first_day, last_day):
+    ''' Merge the meeting days of several segments into one date-ordered stream
+    
+    Each weekday of each segment is an arithmetic progression of dates, so
+    the streams are merged with a single heap-based k-way merge instead of
+    scanning every day of the semester once per segment. Yields
+    (date, [segment indexes meeting that day]).
+    '''
+    streams = []
+    for index, segment in enumerate(segments):
+        start = max(segment.start or first_day, first_day)
+        end = min(segment.end or last_day, last_day)
+        for weekday in {WEEKDAY_NAMES.index(name) for name in segment.weekdays if name in WEEKDAY_NAMES}:
+            streams.append(_weekly(start + datetime.timedelta(days=(weekday - start.weekday()) % 7), end, index))
+    
+    current, members = None, []
+    for day, index in heapq.merge(*streams):
+        if day != current:
+            if members:
+                yield current, members
+            current, members = day, []
+        members.append(index)
+    if members:
+        yield current, members
+
+def schedule_segments(calendar, segments, show_no=None, fmt=None,
+                      show_holidays=True, show_breaks=True, show_events=True):
+    ''' Take a core.calendar_model.SemesterCalendar and ScheduleSegments, return course meetings as strings
+    
+    Lines follow schedule(); a day met by labelled segments carries their
+    labels, e.g. "Thursday, September 4, 2025 [Lab]". No-class days and
+    events come from the calendar's interval indexes, which are shared by
+    every segment.
+    '''
+    if not calendar.first_day or not calendar.last_day:
+        return []
+    date_format = fmt if fmt else 'dddd, MMMM D, YYYY'
+    
+    def visible(event):
+        if event['type'] == 'holiday':
+            return show_holidays
+        if event['type'] == 'break':
+            return show_breaks
+        return show_events
+    
+    course = []
+    for day, members in merge_segment_meetings(segments, calendar.first_day, calendar.last_day):
+        date_str = arrow.get(day).format(date_format)
+        labels = [segments[index].label for index in members if segments[index].label]
+        if labels:
+            date_str += f" [{', '.join(labels)}]"
+        
+        # Latest-starting visible event on this day
+        events = [event for event in calendar.events_on(day) if visible(event)]
+        event = events[-1] if events else None
+        
+        if not calendar.no_class.covers(day):
+            if event:
+                if event['type'] in NO_CLASS_EVENT_TYPES:
+                    course.append(f"{date_str} - NO CLASS ({event['name']})")
+                else:
+                    course.append(f"{date_str} - {event['name']}")
+            else:
+                course.append(date_str)
+        elif show_no:
+            if event:
+                course.append(f"{date_str} - NO CLASS ({event['name']})")
+            else:
+                course.append(date_str + ' - NO CLASS')
+    
+    return course
+
 def discover_available_semesters():
     ''' Discover available semesters from JSON files in calendars directory '''
-    calendars_dir = os.path.join(os.path.dirname(__file__), '..', 'calendars')
+    registry = get_semester_registry()
     
     # Check if active_semester.json exists
-    active_config_path = os.path.join(calendars_dir, 'active_semester.json')
+    config = registry.active_config()
     
-    if os.path.exists(active_config_path):
-        try:
-            with open(active_config_path, 'r') as f:
-                config = json.load(f)
-            available_semesters = config.get('available_semesters', [])
-            
-            # Convert to (semester, year) tuples
-            semester_tuples = []
-            for semester_key in available_semesters:
-                if '_' in semester_key:
-                    parts = semester_key.split('_')
-                    if len(parts) == 2:
-                        semester_tuples.append((parts[0], parts[1]))
-            
-            return sorted(semester_tuples, key=lambda x: (x[1], x[0]))
-        except:
-            pass
+    if config is not None:
+        available_semesters = config.get('available_semesters', [])
+        
+        # Convert to (semester, year) tuples
+        semester_tuples = []
+        for semester_key in available_semesters:
+            if '_' in semester_key:
+                parts = semester_key.split('_')
+                if len(parts) == 2:
+                    semester_tuples.append((parts[0], parts[1]))
+        
+        return sorted(semester_tuples, key=lambda x: (x[1], x[0]))
     
-    # Fallback: scan directory for semester JSON files
-    if os.path.exists(calendars_dir):
-        json_files = [f for f in os.listdir(calendars_dir) 
-                     if f.endswith('.json') and f != 'active_semester.json']
+    # Fallback: semester JSON files in the calendars directory
+    if os.path.exists(registry.calendars_directory):
+        json_files = registry.calendar_files()
         
         semester_tuples = []
         for filename in json_files:
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+
+"""
+In-process full-text search over courses, departments and program overviews
+
+Documents are tokenized, stemmed and stored in an inverted index ranked
+with BM25. The last query term is also matched as a prefix so the index can
+back typeahead search. Documents are grouped by source file; refresh()
+re-indexes only the sources whose file changed on disk.
+
+One index is shared by every request thread and the file watcher thread, so
+queries and re-indexing take the index lock; department files are read
+before the lock is taken.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+STOP_WORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'their', 'this', 'to',
+    'with', 'will', 'our', 'we', 'you', 'your'
+])
+
+# Suffixes stripped by the light stemmer, longest first
+STEM_SUFFIXES = [
+    ('ational', 'ate'), ('ization', 'ize'), ('fulness', 'ful'), ('iveness', 'ive'),
+    ('ations', 'ate'), ('ation', 'ate'), ('ments', ''), ('ment', ''),
+    ('ness', ''), ('ings', ''), ('ing', ''), ('ies', 'y'), ('ied', 'y'),
+    ('ers', ''), ('er', ''), ('edly', ''), ('ed', ''), ('ly', ''),
+    ('sses', 'ss'), ('es', ''), ('s', ''),
+]
+
+TITLE_WEIGHT = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFIX_WEIGHT = 0.5
+
+
+def stem(word):
+    """Reduce a lowercase word to a crude stem by stripping common suffixes"""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement in STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix == 's' and word.endswith(('ss', 'us', 'is')):
+                return word
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+def tokenize(text):
+    """Split text into lowercase tokens with stop words removed"""
+    if not text:
+        return []
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def analyze(text):
+    """Tokenize and stem text into index terms"""
+    return [stem(token) for token in tokenize(text)]
+
+
+class SearchIndex:
+    """Inverted index with BM25 ranking and prefix matching"""
+
+    REFRESH_INTERVAL = 2.0
+
+    def __init__(self, data_loader=None, program_overviews_path=None):
+        self.data_loader = data_loader
+        self.program_overviews_path = program_overviews_path
+        self.postings = {}          # term -> {doc_id: weighted term frequency}
+        self.documents = {}         # doc_id -> stored fields
+        self.doc_lengths = {}       # doc_id -> weighted length
+        self.doc_terms = {}         # doc_id -> set of terms (for removal)
+        self.sources = {}           # source key -> (signature, [doc_ids])
+        self._total_length = 0
+        self._sorted_terms = None
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+
+    # Document management
+
+    def add_document(self, doc_id, title, body, **fields):
+        """Add or replace a document"""
+        with self._lock:
+            self._add_document(doc_id, title, body, **fields)
+
+    def _add_document(self, doc_id, title, body, **fields):
+        if doc_id in self.documents:
+            self._remove_document(doc_id)
+
+        frequencies = {}
+        for term in analyze(title):
+            frequencies[term] = frequencies.get(term, 0) + TITLE_WEIGHT
+        for term in analyze(body):
+            frequencies[term] = frequencies.get(term, 0) + 1
+
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+        length = sum(frequencies.values())
+        self.documents[doc_id] = dict(fields, id=doc_id, title=title, body=body or '')
+        self.doc_lengths[doc_id] = length
+        self.doc_terms[doc_id] = set(frequencies)
+        self._total_length += length
+        self._sorted_terms = None
+
+    def remove_document(self, doc_id):
+        """Remove a document if present"""
+        with self._lock:
+            self._remove_document(doc_id)
+
+    def _remove_document(self, doc_id):
+        if doc_id not in self.documents:
+            return
+        for term in self.doc_terms.pop(doc_id):
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[term]
+        self._total_length -= self.doc_lengths.pop(doc_id)
+        del self.documents[doc_id]
+        self._sorted_terms = None
+
+    def __len__(self):
+        return len(self.documents)
+
+    # Sources
+
+    def _file_signature(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _replace_source(self, source_key, signature, documents):
+        """Swap all documents for a source with a new set"""
+        with self._lock:
+            _, old_ids = self.sources.get(source_key, (None, []))
+            for doc_id in old_ids:
+                self._remove_document(doc_id)
+            new_ids = []
+            for doc in documents:
+                self._add_document(**doc)
+                new_ids.append(doc['doc_id'])
+            self.sources[source_key] = (signature, new_ids)
+
+    def index_department(self, dept_code):
+        """(Re)index a department's mission statement and courses"""
+        source_key = f"department:{dept_code}"
+        file_path = self.data_loader.department_file_path(dept_code)
+        dept = self.data_loader.load_department(dept_code) if file_path else None
+        if not dept or not dept.name:
+            self._replace_source(source_key, self._file_signature(file_path) if file_path else None, [])
+            return
+
+        documents = [{
+            'doc_id': source_key,
+            'title': dept.name,
+            'body': dept.mission_statement,
+            'type': 'department',
+            'department': dept_code
+        }]
+        for course in dept.courses:
+            course_id = f"{dept_code} {course.number}"
+            documents.append({
+                'doc_id': f"course:{course_id}",
+                'title': f"{course_id} {course.title or ''}".strip(),
+                'body': course.description,
+                'type': 'course',
+                'department': dept_code,
+                'number': course.number
+            })
+        self._replace_source(source_key, self._file_signature(file_path), documents)
+
+    def index_program_overviews(self):
+        """(Re)index program overviews"""
+        source_key = 'programs'
+        path = self.program_overviews_path
+        if not path or not os.path.exists(path):
+            self._replace_source(source_key, None, [])
+            return
+
+        with open(path, 'r') as f:
+            programs = json.load(f)
+
+        documents = [{
+            'doc_id': f"program:{name}",
+            'title': name,
+            'body': program.get('overview'),
+            'type': 'program',
+            'url': program.get('url')
+        } for name, program in programs.items()]
+        self._replace_source(source_key, self._file_signature(path), documents)
+
+    def build(self):
+        """Index every department and the program overviews"""
+        for dept_code in self.data_loader.get_all_departments():
+            self.index_department(dept_code)
+        self.index_program_overviews()
+        self._last_refresh = time.monotonic()
+        return self
+
+    def refresh(self, force=False):
+        """
+        Re-index only sources whose files changed since they were indexed
+
+        Checks are throttled to once every REFRESH_INTERVAL seconds unless forced.
+
+        Returns:
+            List of source keys that were re-indexed
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.REFRESH_INTERVAL:
+            return []
+        self._last_refresh = now
+
+        changed = []
+        current = set()
+        for dept_code in self.data_loader.get_all_departments():
+            source_key = f"department:{dept_code}"
+            current.add(source_key)
+            signature = self._file_signature(self.data_loader.department_file_path(dept_code) or '')
+            if source_key not in self.sources or self.sources[source_key][0] != signature:
+                self.index_department(dept_code)
+                changed.append(source_key)
+
+        with self._lock:
+            for source_key in list(self.sources):
+                if source_key.startswith('department:') and source_key not in current:
+                    self._replace_source(source_key, None, [])
+                    del self.sources[source_key]
+                    changed.append(source_key)
+
+        if self.sources.get('programs', (None,))[0] != self._file_signature(self.program_overviews_path or ''):
+            self.index_program_overviews()
+            changed.append('programs')
+
+        return changed
+
+    # Querying
+
+    def _terms_with_prefix(self, prefix):
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        terms = self._sorted_terms
+        start = bisect_left(terms, prefix)
+        matches = []
+        for term in terms[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def _idf(self, term):
+        document_frequency = len(self.postings.get(term, ()))
+        count = len(self.documents)
+        return math.log(1 + (count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def search(self, query, limit=10, doc_type=None, prefix=True):
+        """
+        Rank documents against a query with BM25
+
+        Args:
+            query: Free text query
+            limit: Maximum number of results
+            doc_type: Optional filter ('course', 'department' or 'program')
+            prefix: Treat the last query token as a prefix (typeahead)
+
+        Returns:
+            List of result dictionaries ordered by descending score
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        with self._lock:
+            return self._search(query, tokens, limit, doc_type, prefix)
+
+    def _search(self, query, tokens, limit, doc_type, prefix):
+        if not self.documents:
+            return []
+
+        weighted_terms = {}
+        for token in tokens:
+            term = stem(token)
+            weighted_terms[term] = max(weighted_terms.get(term, 0), 1.0)
+        if prefix and not query[-1:].isspace():
+            for term in self._terms_with_prefix(tokens[-1]):
+                weighted_terms.setdefault(term, PREFIX_WEIGHT)
+
+        average_length = self._total_length / len(self.documents)
+        scores = {}
+        for term, weight in weighted_terms.items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf(term) * weight
+            for doc_id, frequency in postings.items():
+                if doc_type and self.documents[doc_id]['type'] != doc_type:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [self._result(doc_id, score) for doc_id, score in ranked]
+
+    def _result(self, doc_id, score):
+        document = self.documents[doc_id]
+        result = {key: value for key, value in document.items() if key != 'body'}
+        body = document['body']
+        result['snippet'] = body[:200] + ('...' if len(body) > 200 else '')
+        result['score'] = round(score, 4)
+        return result
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+"""
+Keyed merge of scraped schedule rows into existing semester files
+
+Rows are matched by section code through a dict index, so a merge is linear
+in the number of rows. Each field follows a policy:
+
+    scrape    the scraped value replaces the stored one
+    preserve  a stored value (e.g. a manual edit) wins; scraped fills gaps
+
+Fields without an explicit policy are preserved, so hand-added keys
+survive re-scrapes. Every merge produces a MergeReport of added, removed
+and changed sections.
+"""
+
+SCRAPE = 'scrape'
+PRESERVE = 'preserve'
+
+# Columns read from the course listing page
+SCRAPED_FIELDS = (
+    'department', 'number', 'name', 'credits', 'days', 'start_time', 'end_time',
+    'delivery_type', 'designation', 'availability'
+)
+
+DEFAULT_POLICIES = {field: SCRAPE for field in SCRAPED_FIELDS}
+DEFAULT_POLICIES.update({
+    'description': PRESERVE,
+    'instructors': PRESERVE,
+    'textbooks': PRESERVE,
+    'zoom_link': PRESERVE,
+})
+
+
+class MergeReport:
+    """Sections added, removed and changed by one merge"""
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.changed = {}   # section code -> {field: [old, new]}
+        self.unchanged = 0
+
+    @property
+    def has_changes(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self):
+        """Serialize report to dictionary"""
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+            "unchanged": self.unchanged
+        }
+
+
+def merge_sections(existing_rows, scraped_rows, key='number', policies=None, keep_missing=True):
+    """
+    Merge scraped rows into existing rows by key
+
+    Args:
+        existing_rows: Rows currently stored for a department
+        scraped_rows: Rows from the latest scrape
+        key: Field identifying a section
+        policies: Field -> SCRAPE or PRESERVE overrides for DEFAULT_POLICIES
+        keep_missing: Keep stored rows that no longer appear in the scrape
+
+    Returns:
+        (merged_rows, MergeReport). Scraped sections come first in scrape
+        order, followed by stored sections missing from the scrape.
+    """
+    field_policies = dict(DEFAULT_POLICIES)
+    if policies:
+        field_policies.update(policies)
+
+    existing_index = {}
+    for row in existing_rows:
+        section = row.get(key) if isinstance(row, dict) else None
+        if section is not None and section not in existing_index:
+            existing_index[section] = row
+
+    report = MergeReport()
+    merged_index = {}
+    merged = []
+    for scraped in scraped_rows:
+        section = scraped.get(key)
+        if section in merged_index:
+            # Repeated section in one scrape: the later row refreshes the first
+            merged_index[section].update({f: v for f, v in scraped.items() if field_policies.get(f, PRESERVE) == SCRAPE})
+            continue
+
+        stored = existing_index.get(section)
+        if stored is None:
+            row = dict(scraped)
+            report.added.append(section)
+        else:
+            row, changes = _merge_row(stored, scraped, field_policies)
+            if changes:
+                report.changed[section] = changes
+            else:
+                report.unchanged += 1
+        merged_index[section] = row
+        merged.append(row)
+
+    for row in existing_rows:
+        section = row.get(key) if isinstance(row, dict) else None
+        if section in merged_index:
+            continue
+        if section is not None:
+            report.removed.append(section)
+            merged_index[section] = row
+        if keep_missing:
+            merged.append(row)
+
+    return merged, report
+
+
+def _merge_row(stored, scraped, policies):
+    """Merge one section; returns (row, {field: [old, new]}) for changed fields"""
+    row = {}
+    changes = {}
+    for field, value in scraped.items():
+        old = stored.get(field)
+        if policies.get(field, PRESERVE) == SCRAPE or old in (None, ''):
+            row[field] = value
+            if field in stored and old != value:
+                changes[field] = [old, value]
+        else:
+            row[field] = old
+    for field, value in stored.items():
+        if field not in row:
+            row[field] = value
+    return row, changes
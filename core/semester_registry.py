@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+"""
+Shared registry of available semesters and semester calendars
+
+Semester offering folders (data/semesters/25_FA, ...) and semester calendar
+files (calendars/fall_2025.json, ...) are listed once and cached. Each
+lookup costs one stat of the watched directory: adding, removing or
+renaming an entry changes the directory's mtime, and only then is it
+listed again. The parsed active_semester.json is cached the same way by
+the file's own mtime and size.
+
+One registry exists per pair of directories (see get_semester_registry),
+so the API services, blueprints and scheduler helpers share its listings.
+"""
+
+import json
+import os
+import threading
+from core.utils import semester_sort_key
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+DEFAULT_CALENDARS_DIR = os.path.join(os.path.dirname(__file__), '..', 'calendars')
+
+ACTIVE_SEMESTER_FILE = 'active_semester.json'
+
+
+class DirectoryListing:
+    """Entries of one directory, re-listed only when the directory's mtime changes"""
+
+    def __init__(self, directory, include):
+        """
+        Args:
+            directory: Directory to list
+            include: Predicate taking an os.DirEntry, True for entries to keep
+        """
+        self.directory = directory
+        self.include = include
+        self._mtime_ns = None
+        self._names = ()
+
+    def names(self):
+        """Sorted names of the included entries (empty when the directory is missing)"""
+        try:
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            self._mtime_ns, self._names = None, ()
+            return self._names
+        if mtime_ns != self._mtime_ns:
+            with os.scandir(self.directory) as entries:
+                names = tuple(sorted(entry.name for entry in entries if self.include(entry)))
+            self._mtime_ns, self._names = mtime_ns, names
+        return self._names
+
+    def invalidate(self):
+        """Force the next lookup to list the directory again"""
+        self._mtime_ns = None
+
+
+def _is_semester_folder(entry):
+    return entry.is_dir()
+
+
+def _is_calendar_file(entry):
+    return entry.name.endswith('.json') and entry.name != ACTIVE_SEMESTER_FILE and entry.is_file()
+
+
+class SemesterRegistry:
+    """Semester folders, calendar files and active semester config of one data/calendars pair"""
+
+    def __init__(self, data_directory=DEFAULT_DATA_DIR, calendars_directory=DEFAULT_CALENDARS_DIR):
+        self.data_directory = data_directory
+        self.calendars_directory = calendars_directory
+        self._semesters = DirectoryListing(os.path.join(data_directory, 'semesters'), _is_semester_folder)
+        self._calendars = DirectoryListing(calendars_directory, _is_calendar_file)
+        self._active_config = (None, None)
+
+    def semester_codes(self):
+        """Semester codes with an offerings folder (e.g. '25_FA'), oldest first"""
+        return sorted(self._semesters.names(), key=semester_sort_key)
+
+    def calendar_files(self):
+        """Semester calendar filenames (e.g. 'fall_2025.json'), sorted by name"""
+        return list(self._calendars.names())
+
+    def calendar_path(self, filename):
+        """Path of a calendar file in the calendars directory"""
+        return os.path.join(self.calendars_directory, filename)
+
+    def has_calendar(self, filename):
+        """Whether a semester calendar file exists"""
+        return filename in self._calendars.names()
+
+    def active_config(self):
+        """Parsed active_semester.json, or None when it is missing or unreadable"""
+        path = self.calendar_path(ACTIVE_SEMESTER_FILE)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._active_config = (None, None)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._active_config[0] != signature:
+            try:
+                with open(path, 'r') as f:
+                    config = json.load(f)
+            except (OSError, ValueError):
+                config = None
+            self._active_config = (signature, config if isinstance(config, dict) else None)
+        return self._active_config[1]
+
+    def invalidate(self):
+        """Forget every cached listing so the next lookup re-reads the directories"""
+        self._semesters.invalidate()
+        self._calendars.invalidate()
+        self._active_config = (None, None)
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_semester_registry(data_directory=DEFAULT_DATA_DIR, calendars_directory=DEFAULT_CALENDARS_DIR):
+    """Shared SemesterRegistry for a data directory and calendars directory"""
+    key = (os.path.realpath(data_directory), os.path.realpath(calendars_directory))
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = SemesterRegistry(data_directory, calendars_directory)
+        return registry
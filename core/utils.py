@@ -25,6 +25,14 @@ def date_formats():
             ('2016-01-12', 'YYYY-MM-DD')]
     return date_formats
 
+SEASON_ORDER = {'WI': 0, 'SP': 1, 'SU': 2, 'FA': 3}
+
+def semester_sort_key(semester_code):
+    ''' Chronological sort key for semester codes like "25_FA" '''
+    year_part, _, season_part = semester_code.partition('_')
+    year = int(year_part) if year_part.isdigit() else 0
+    return (year, SEASON_ORDER.get(season_part.upper(), len(SEASON_ORDER)), semester_code)
+
 def range_of_days(start, end):
     return arrow.Arrow.range('day', start, end)
 
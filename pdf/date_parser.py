@@ -1,79 +1,110 @@
 #!/usr/bin/env python
 
-import re
 import arrow
+from pdf.date_tokens import (
+    MONTH_DAY, RANGE, find_keyword, has_keyword, is_date, token_dates, token_interval, tokenize, tokenize_line
+)
 
 def extract_date_range_from_text(text):
     ''' Extract date range from text like "November 28-29, 2024" '''
-    pattern = r'([A-Za-z]+) (\d{1,2})-(\d{1,2}), (\d{4})'
-    match = re.search(pattern, text)
-    if match:
-        try:
-            month_name = match.group(1)
-            start_day = int(match.group(2))
-            end_day = int(match.group(3))
-            year = int(match.group(4))
-            
-            months = ['January', 'February', 'March', 'April', 'May',
-                    'June', 'July', 'August', 'September', 'October', 'November', 'December']
-            month_num = months.index(month_name) + 1
-            dates = []
-            for day in range(start_day, end_day + 1):
-                dates.append(arrow.get(year, month_num, day))
-            return dates
-        except:
-            return []
-    
-    # Try single date format
-    pattern = r'([A-Za-z]+ \d{1,2}, \d{4})'
-    match = re.search(pattern, text)
-    if match:
-        try:
-            date_str = match.group(1)
-            return [arrow.get(date_str, 'MMMM D, YYYY')]
-        except:
-            return []
+    for token in tokenize_line(text):
+        if is_date(token) and token.year:
+            return [arrow.get(date) for date in token_dates(token)]
     return []
 
 def parse_single_date_from_text(date_text, year):
     ''' Parse single date like "September 02" into YYYY-MM-DD format '''
-    try:
-        months = ['January', 'February', 'March', 'April', 'May',
-                'June', 'July', 'August', 'September', 'October', 'November', 'December']
-        
-        parts = date_text.strip().split()
-        if len(parts) >= 2:
-            month_name = parts[0]
-            day = int(parts[1])
-            month_num = months.index(month_name) + 1
-            
-            date_obj = arrow.get(year, month_num, day)
-            return date_obj.format('YYYY-MM-DD')
-    except:
-        pass
+    for token in tokenize_line(date_text):
+        if token.kind == MONTH_DAY:
+            dates = token_dates(token, year)
+            return dates[0].isoformat() if dates else "TBD"
     return "TBD"
 
 def parse_date_range_from_text(date_text, year):
     ''' Parse date range like "November 27-29" into list of YYYY-MM-DD dates '''
-    try:
-        months = ['January', 'February', 'March', 'April', 'May',
-                'June', 'July', 'August', 'September', 'October', 'November', 'December']
-        
-        # Look for pattern like "November 27-29"
-        match = re.search(r'([A-Za-z]+)\s+(\d+)-(\d+)', date_text)
-        if match:
-            month_name = match.group(1)
-            start_day = int(match.group(2))
-            end_day = int(match.group(3))
-            
-            month_num = months.index(month_name) + 1
-            
-            dates = []
-            for day in range(start_day, end_day + 1):
-                date_obj = arrow.get(year, month_num, day)
-                dates.append(date_obj.format('YYYY-MM-DD'))
-            
-            return dates
-    except:
-        pass
-    return []
\ No newline at end of file
+    for token in tokenize_line(date_text):
+        if token.kind == RANGE:
+            return [date.isoformat() for date in token_dates(token, year)]
+    return []
+
+def parse_date_interval_from_text(date_text, year):
+    ''' Parse date range like "November 27-29" into a (start, end) pair of YYYY-MM-DD dates, or None '''
+    for token in tokenize_line(date_text):
+        if token.kind == RANGE:
+            interval = token_interval(token, year)
+            return (interval[0].isoformat(), interval[1].isoformat()) if interval else None
+    return None
+
+def _document_year(lines):
+    ''' First year printed anywhere in the document, or None '''
+    for line in lines:
+        for token in line.tokens:
+            if token.year:
+                return token.year
+    return None
+
+def _dated_keyword(line, name):
+    ''' Dates of the first "Month D, YYYY" that precedes a keyword on the same line '''
+    for index, token in enumerate(line.tokens):
+        if is_date(token) and token.year and has_keyword(line.tokens[index + 1:], name):
+            return token_dates(token)
+    return None
+
+def extract_first_day_from_pdf_text(text):
+    ''' Extract first day of classes from PDF text '''
+    lines = tokenize(text)
+    for line in lines:
+        dates = _dated_keyword(line, 'first_day')
+        if dates is not None:
+            return arrow.get(dates[0]) if dates else None
+
+    # "Classes Begin" labels sit on or below the line holding their date
+    year = _document_year(lines)
+    previous_dates = []
+    for line in lines:
+        dates = [token for token in line.tokens if is_date(token)]
+        graduate = find_keyword(line.tokens, 'graduate')
+        begin = graduate and find_keyword(line.tokens, 'classes_begin', after=graduate.start)
+        if begin:
+            candidates = [token for token in dates if token.start < begin.start] or previous_dates
+            if candidates and year:
+                found = token_dates(candidates[0], year)
+                if found:
+                    return arrow.get(found[0])
+        if dates:
+            previous_dates = dates
+
+    return None
+
+def extract_last_day_from_pdf_text(text):
+    ''' Extract last day of classes from PDF text '''
+    lines = tokenize(text)
+    for line in lines:
+        dates = _dated_keyword(line, 'last_day')
+        if dates is not None:
+            return arrow.get(dates[0]) if dates else None
+
+    # For this PDF format, look for "Final Examinations" or similar end indicators
+    year = _document_year(lines)
+    for line in lines:
+        lower = line.text.lower()
+        if 'final' in lower and ('exam' in lower or 'week' in lower):
+            dates = [token for token in line.tokens if is_date(token)]
+            if dates and year:
+                found = token_dates(dates[0], year)
+                if found:
+                    return arrow.get(found[0])
+
+    # Fallback: assume semester ends in December for fall semester
+    if year:
+        return arrow.get(year, 12, 15)
+
+    return None
+
+def extract_no_class_dates_from_pdf_text(text):
+    ''' Extract all no class dates from PDF text '''
+    no_class_dates = []
+    for line in tokenize(text):
+        if has_keyword(line.tokens, 'no_classes'):
+            no_class_dates.extend(extract_date_range_from_text(line.text))
+    return no_class_dates
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+
+"""
+Single-pass date tokenizer shared by the calendar text parsers
+
+Each line is scanned once by one precompiled pattern that recognises, in
+order of precedence:
+
+    semester    "FALL 2025" column headings
+    month_day   "September 02", "Aug 22", "May 15, 2026"
+    range       "Oct 13-14", "November 27-29", "April 28-May 2"
+    year        a bare four digit year
+    keyword     phrases the parsers act on ("classes begin", "holiday", ...)
+
+Every match becomes a DateToken carrying its line number and character
+offsets, so the parsers work from typed tokens instead of running their own
+re.findall/re.search calls and month-list lookups on every line.
+"""
+
+import datetime
+import functools
+import re
+from collections import namedtuple
+
+MONTHS = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+          'august', 'september', 'october', 'november', 'december']
+MONTH_PREFIXES = {month[:3]: number for number, month in enumerate(MONTHS, 1)}
+# Every spelling TOKEN_PATTERN accepts -> month number
+MONTH_SPELLINGS = dict([(month, number) for number, month in enumerate(MONTHS, 1)] +
+                       list(MONTH_PREFIXES.items()) + [('sept', 9)])
+
+SEMESTER = 'semester'
+MONTH_DAY = 'month_day'
+RANGE = 'range'
+YEAR = 'year'
+KEYWORD = 'keyword'
+DATE_KINDS = (MONTH_DAY, RANGE)
+
+# Keyword name -> phrase, longest phrases first where they overlap
+KEYWORDS = [
+    ('first_day', r'first\s+day\s+of\s+classes'),
+    ('last_day', r'last\s+day\s+of\s+(?:the\s+)?(?:\w+\s+)?(?:semester|classes)'),
+    ('classes_begin', r'classes\s+begins?'),
+    ('no_classes', r'no\s+classes?'),
+    ('holiday', r'holidays?'),
+    ('break', r'break'),
+    ('recess', r'recess'),
+    ('exam', r'final\s+exam\w*|final|exam\w*'),
+    ('graduate', r'(?:under)?graduate'),
+]
+
+# Keywords that mark a date without classes
+NO_CLASS_KEYWORDS = frozenset(['no_classes', 'holiday', 'break', 'recess'])
+
+_MONTH = r'jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?'
+
+TOKEN_PATTERN = re.compile(
+    r'\b(?:'
+    r'(?P<semester>(?P<semester_name>fall|spring|summer|winter)\s+(?P<semester_year>\d{4}))(?!\d)'
+    r'|(?P<date>(?P<month>' + _MONTH + r')\.?\s+(?P<day>\d{1,2})(?!\d)'
+    r'(?:\s*-\s*(?:(?P<end_month>' + _MONTH + r')\.?\s+)?(?P<end_day>\d{1,2})(?!\d))?'
+    r'(?:,\s*(?P<date_year>\d{4})(?!\d))?)'
+    r'|(?P<year>\d{4})(?!\d)'
+    r'|(?P<keyword>' + '|'.join(f'(?P<kw_{name}>{phrase})' for name, phrase in KEYWORDS) + r')\b'
+    r')',
+    re.IGNORECASE
+)
+
+KEYWORD_GROUPS = {f'kw_{name}': name for name, _ in KEYWORDS}
+
+# One recognised span of a line; fields that do not apply to the kind are None
+DateToken = namedtuple('DateToken', ['kind', 'text', 'line', 'start', 'end', 'month', 'day',
+                                     'end_month', 'end_day', 'year', 'name'],
+                       defaults=(None, None, None, None, None, None))
+
+# A line of text with its tokens in left-to-right order and its date tokens alone
+TokenizedLine = namedtuple('TokenizedLine', ['number', 'text', 'tokens', 'dates'])
+
+
+def month_number(token):
+    """Month number for a full or abbreviated month name, or None"""
+    token = token.strip('.,').lower()
+    if len(token) < 3:
+        return None
+    number = MONTH_PREFIXES.get(token[:3])
+    if number and MONTHS[number - 1].startswith(token):
+        return number
+    return None
+
+
+def _token(match, number):
+    """DateToken for one TOKEN_PATTERN match"""
+    # The kind's group encloses the others, so it is always the last to close
+    kind = match.lastgroup
+    text, start, end = match.group(0), match.start(), match.end()
+    if kind == 'date':
+        month, day, end_month, end_day, year = match.group('month', 'day', 'end_month', 'end_day', 'date_year')
+        month = MONTH_SPELLINGS[month.lower()]
+        return DateToken(RANGE if end_day else MONTH_DAY, text, number, start, end,
+                         month=month, day=int(day),
+                         end_month=MONTH_SPELLINGS[end_month.lower()] if end_month else (month if end_day else None),
+                         end_day=int(end_day) if end_day else None,
+                         year=int(year) if year else None)
+    if kind == 'keyword':
+        for name in KEYWORD_GROUPS:
+            if match.group(name):
+                return DateToken(KEYWORD, text, number, start, end, name=KEYWORD_GROUPS[name])
+    if kind == 'year':
+        return DateToken(YEAR, text, number, start, end, year=int(text))
+    return DateToken(SEMESTER, text, number, start, end,
+                     year=int(match.group('semester_year')), name=match.group('semester_name').lower())
+
+
+def tokenize_line(text, number=0):
+    """Tokens of one line in left-to-right order"""
+    return tuple(_token(match, number) for match in TOKEN_PATTERN.finditer(text))
+
+
+@functools.lru_cache(maxsize=16)
+def tokenize(text):
+    """
+    Tokenize every line of a document
+
+    Results are cached by text, so the fall and spring parsers and the event
+    parser share one scan of the same calendar.
+
+    Returns:
+        Tuple of TokenizedLine, one per line of the text
+    """
+    lines = []
+    for number, line in enumerate(text.split('\n')):
+        tokens = tokenize_line(line, number)
+        lines.append(TokenizedLine(number, line, tokens, tuple(token for token in tokens if token.kind in DATE_KINDS)))
+    return tuple(lines)
+
+
+def is_date(token):
+    """True for month_day and range tokens"""
+    return token.kind in DATE_KINDS
+
+
+def has_keyword(tokens, *names):
+    """True when any keyword token has one of the names"""
+    return any(token.kind == KEYWORD and token.name in names for token in tokens)
+
+
+def label_keywords(text):
+    """Set of keyword names found in a label"""
+    return {token.name for token in tokenize_line(text) if token.kind == KEYWORD}
+
+
+def find_keyword(tokens, name, after=-1):
+    """First keyword token with the name starting after a character offset, or None"""
+    for token in tokens:
+        if token.kind == KEYWORD and token.name == name and token.start > after:
+            return token
+    return None
+
+
+def token_interval(token, year=None):
+    """
+    (start, end) datetime.date pair a date token covers, or None
+
+    Args:
+        token: month_day or range DateToken
+        year: Year of the first date when the token has none of its own
+
+    Returns:
+        None when the day does not exist in the month. A range ending in an
+        earlier month rolls into the following year.
+    """
+    year = token.year or year
+    try:
+        start = datetime.date(year, token.month, token.day)
+        if token.kind != RANGE:
+            return start, start
+        end = datetime.date(year, token.end_month, token.end_day)
+        if end < start:
+            end = datetime.date(year + 1, token.end_month, token.end_day)
+    except (TypeError, ValueError):
+        return None
+    return start, end
+
+
+def token_dates(token, year=None):
+    """Every datetime.date a date token covers (see token_interval)"""
+    interval = token_interval(token, year)
+    if interval is None:
+        return []
+    start, end = interval
+    return [start + datetime.timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def academic_years(semester, year):
+    """(start_year, end_year) of the academic year holding a fall or spring semester, or None"""
+    if semester == 'fall':
+        return year, year + 1
+    if semester == 'spring':
+        return year - 1, year
+    return None
+
+
+def semester_date_year(semester, start_year, end_year, month):
+    """Calendar year of a month within a fall (Aug-Dec) or spring (Jan-Jun) semester, or None"""
+    if semester == 'fall' and month >= 8:
+        return start_year
+    if semester == 'spring' and month <= 6:
+        return end_year
+    return None
@@ -1,132 +1,71 @@
 #!/usr/bin/env python
 
 import re
-from pdf.date_parser import parse_single_date_from_text, parse_date_range_from_text
+from pdf.date_tokens import RANGE, academic_years, is_date, semester_date_year, token_dates, tokenize, tokenize_line
 
-def extract_date_event_pairs(line, semester, start_year, end_year):
+# Weekday prefixes ("Tue, May 27") and summer session names from neighbouring columns
+WEEKDAY_PATTERN = re.compile(r'\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*,\s*')
+SESSION_PATTERN = re.compile(r'\bSession\s+[IVX]+\b')
+
+def extract_date_event_pairs(line, semester, start_year, end_year, label_line=None):
     ''' Extract date-event pairs from a line, handling multi-column layout '''
-    events = []
-    
-    # Find all date patterns (both single dates and ranges)
-    date_patterns = re.findall(r'([A-Za-z]+ \d{1,2}(?:-\d{1,2})?)', line)
-    
-    if not date_patterns:
-        return events
+    label = label_line if label_line and not any(is_date(token) for token in tokenize_line(label_line)) else None
+    dates = [token for token in tokenize_line(line) if is_date(token)]
+    return _date_event_pairs(line, dates, semester, start_year, end_year, label)
+
+def _date_event_pairs(line, dates, semester, start_year, end_year, label=None):
+    ''' Events for the date tokens of one line
     
-    # For each date pattern, try to find the associated event text
-    for date_text in date_patterns:
-        try:
-            # Extract month for semester assignment
-            month_name = date_text.split()[0]
-            months = ['January', 'February', 'March', 'April', 'May',
-                     'June', 'July', 'August', 'September', 'October', 'November', 'December']
-            
-            if month_name not in months:
-                continue
-                
-            month_num = months.index(month_name) + 1
-            
-            # Check if this date belongs to the requested semester
-            belongs_to_semester = False
-            if semester == 'fall' and month_num >= 8:  # Aug-Dec
-                date_year = start_year
-                belongs_to_semester = True
-            elif semester == 'spring' and month_num <= 6:  # Jan-Jun
-                date_year = end_year
-                belongs_to_semester = True
-            
-            if not belongs_to_semester:
-                continue
-            
-            # Find the event description near this date
-            event_name = extract_event_name_near_date(line, date_text)
-            
-            if event_name and len(event_name.strip()) > 2:
-                # Check if it's a date range or single date
-                if '-' in date_text and len(date_text.split()) == 2:
-                    # Date range
-                    date_range = parse_date_range_from_text(date_text, date_year)
-                    if date_range:
-                        events.append({
-                            "name": event_name.strip(),
-                            "date": None,
-                            "date_range": date_range,
-                            "type": classify_event_type(event_name)
-                        })
-                else:
-                    # Single date
-                    single_date = parse_single_date_from_text(date_text, date_year)
-                    if single_date != "TBD":
-                        events.append({
-                            "name": event_name.strip(),
-                            "date": single_date,
-                            "date_range": None,
-                            "type": classify_event_type(event_name)
-                        })
-        except Exception:
+    A line holding a single date and no label of its own takes its name from
+    the label line printed under it, when there is one.
+    '''
+    events = []
+    for index, token in enumerate(dates):
+        # Check if this date belongs to the requested semester
+        date_year = semester_date_year(semester, start_year, end_year, token.month)
+        if date_year is None or (token.year and token.year != date_year):
+            continue
+        days = token_dates(token, date_year)
+        if not days:
             continue
+        
+        # Find the event description near this date
+        event_name = extract_event_name_near_date(line, dates, index)
+        if not event_name and len(dates) == 1 and label:
+            event_name = ' '.join(label.split())
+        
+        if len(event_name) > 2 and any(char.isalpha() for char in event_name):
+            events.append({
+                "name": event_name,
+                "date": None if token.kind == RANGE else days[0].isoformat(),
+                "date_range": [day.isoformat() for day in days] if token.kind == RANGE else None,
+                "type": classify_event_type(event_name)
+            })
     
     return events
 
-def extract_event_name_near_date(line, date_text):
-    ''' Extract event name that appears near a specific date in the line '''
-    # Find the position of the date in the line
-    date_pos = line.find(date_text)
-    if date_pos == -1:
-        return ""
-    
-    # Get text before the date (potential event name)
-    before_date = line[:date_pos].strip()
-    # Get text after the date (potential event name continuation)
-    after_date = line[date_pos + len(date_text):].strip()
-    
-    # Look for event text patterns
-    # Priority 1: Text immediately before the date
-    before_words = before_date.split()
-    event_words = []
-    
-    # Take words from the end moving backwards until we hit another date
-    for word in reversed(before_words):
-        # Stop if we hit a date pattern
-        if re.match(r'[A-Za-z]+ \d{1,2}', word):
-            break  # Hit another date, stop
-        if re.match(r'\d{1,2}-\d{1,2}', word):
-            break  # Hit a date range, stop
-        # Stop if we hit certain stop words that indicate column boundaries
-        if word.lower() in ['session', 'tue,', 'wed,', 'thu,', 'fri,', 'sat,', 'sun,', 'mon,']:
-            # These indicate we're hitting data from another column
-            break
-        event_words.insert(0, word)
-        if len(event_words) >= 5:  # Limit event name length to avoid cross-column contamination
-            break
-    
-    # Only add words from after the date if we have very few words and they look like continuations
-    if len(event_words) < 2:
-        after_words = after_date.split()
-        for word in after_words:
-            if re.match(r'[A-Za-z]+ \d{1,2}', word):
-                break  # Hit another date, stop
-            if re.match(r'\d{1,2}-\d{1,2}', word):
-                break  # Hit a date range, stop
-            # Stop on common academic terms that might be from another column
-            if word.lower() in ['session', 'classes', 'begin', 'ends', 'holiday']:
-                break
-            event_words.append(word)
-            if len(event_words) >= 3:  # Keep it short for after-date additions
-                break
-    
-    # Clean up common artifacts from multi-column parsing
-    event_name = ' '.join(event_words)
-    
-    # Remove common PDF parsing artifacts
-    event_name = re.sub(r'\b(Tue,|Wed,|Thu,|Fri,|Sat,|Sun,|Mon,)\s*', '', event_name)
-    event_name = re.sub(r'\b(May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\b', '', event_name)
-    event_name = re.sub(r'\bSession\s+[IVX]+\b', '', event_name)
-    
-    # Clean up extra whitespace
-    event_name = ' '.join(event_name.split())
-    
-    return event_name
+def _clean_event_text(text):
+    ''' Strip weekday prefixes, session names and separators from label text '''
+    text = WEEKDAY_PATTERN.sub('', text)
+    text = SESSION_PATTERN.sub('', text)
+    return ' '.join(text.split()).strip(' -,:')
+
+def extract_event_name_near_date(line, dates, index):
+    ''' Extract event name that appears next to the index-th date token of the line
+    
+    Text between this date and the next one is the label ("December 13, 2024 -
+    Last Day of Classes"); failing that, up to five words between the previous
+    date and this one.
+    '''
+    token = dates[index]
+    after_end = dates[index + 1].start if index + 1 < len(dates) else len(line)
+    event_name = _clean_event_text(line[token.end:after_end])
+    if event_name:
+        return event_name
+    
+    before_start = dates[index - 1].end if index else 0
+    before_words = _clean_event_text(line[before_start:token.start]).split()
+    return ' '.join(before_words[-5:])
 
 def classify_event_type(event_name):
     ''' Classify event type based on name '''
@@ -155,27 +94,23 @@ def extract_semester_events_from_pdf_text(text, semester, year):
     year = int(year)
     
     # Determine the academic year range
-    if semester == 'fall':
-        start_year = year
-        end_year = year + 1
-    elif semester == 'spring':
-        start_year = year - 1
-        end_year = year
-    else:
+    years = academic_years(semester, year)
+    if not years:
         return []
+    start_year, end_year = years
     
     events = []
-    lines = text.split('\n')
+    lines = tokenize(text)
     
     # Parse line by line looking for events
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
+    for index, line in enumerate(lines):
+        if not line.dates:
             continue
+        label_line = lines[index + 1] if index + 1 < len(lines) else None
+        label = label_line.text if label_line and not label_line.dates else None
         
         # Extract dates with their surrounding context
-        processed_events = extract_date_event_pairs(line, semester, start_year, end_year)
-        events.extend(processed_events)
+        events.extend(_date_event_pairs(line.text, line.dates, semester, start_year, end_year, label))
     
     # Remove duplicates and clean up
     seen_events = set()
@@ -188,4 +123,36 @@ def extract_semester_events_from_pdf_text(text, semester, year):
             seen_events.add(key)
             unique_events.append(event)
     
-    return unique_events
\ No newline at end of file
+    return unique_events
+
+def extract_semester_events_from_layout(layout, semester, year):
+    ''' Build events from a semester's layout column; None if the column is missing '''
+    entries = layout.entries_for(semester, year)
+    if not entries:
+        return None
+    
+    events = []
+    seen_events = set()
+    for entry in entries:
+        name = ' '.join(entry.label.split())
+        if len(name) <= 2:
+            continue
+        if entry.end:
+            event = {
+                "name": name,
+                "date": None,
+                "date_range": [date.isoformat() for date in entry.dates()],
+                "type": classify_event_type(name)
+            }
+        else:
+            event = {
+                "name": name,
+                "date": entry.start.isoformat(),
+                "date_range": None,
+                "type": classify_event_type(name)
+            }
+        key = (event['name'], event['date'], str(event['date_range']))
+        if key not in seen_events:
+            seen_events.add(key)
+            events.append(event)
+    return events
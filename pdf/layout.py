@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+
+"""
+Layout analysis of academic calendar pages from pdfplumber word boxes
+
+The calendar prints each semester as a column. Every entry starts with a
+date ("August 25", "Oct 13-14") at the column's left edge, the event label
+sits to its right a few points lower, and a weekday line follows under the
+date. Columns are found from the x positions shared by those date anchors,
+rows from their y positions, so every word is assigned once and parsers get
+a (column, date, label) table instead of re-scanning flattened text.
+"""
+
+import datetime
+import re
+
+from pdf.date_tokens import RANGE, is_date, month_number, token_dates, tokenize_line
+
+DAY_PATTERN = re.compile(r'^(\d{1,2})(?:-(\d{1,2}))?,?$')
+HEADER_PATTERN = re.compile(r'^(FALL|SPRING|SUMMER|WINTER)$', re.IGNORECASE)
+YEAR_PATTERN = re.compile(r'^(\d{4})$')
+
+# Words within this many points share a line / a column edge
+LINE_TOLERANCE = 2.0
+COLUMN_TOLERANCE = 1.5
+# A date anchor has no word closer than this on its left
+ANCHOR_GAP = 15.0
+# Anchors needed at one x position before it counts as a column
+MIN_COLUMN_ANCHORS = 3
+# Words taller than this multiple of the median height are rotated decoration
+TALL_WORD_FACTOR = 2.0
+
+
+class LayoutEntry:
+    """One dated row of a calendar column"""
+
+    def __init__(self, column, semester, year, date_text, start, end=None, label='', weekday=None, page=1, top=0.0):
+        self.column = column        # e.g. 'fall_2025'
+        self.semester = semester    # e.g. 'fall'
+        self.year = year
+        self.date_text = date_text
+        self.start = start          # datetime.date
+        self.end = end              # datetime.date for ranges, else None
+        self.label = label
+        self.weekday = weekday
+        self.page = page
+        self.top = top
+
+    def dates(self):
+        """Every date the entry covers"""
+        if not self.end:
+            return [self.start]
+        days = (self.end - self.start).days
+        return [self.start + datetime.timedelta(days=offset) for offset in range(days + 1)]
+
+    def to_dict(self):
+        """Serialize entry to dictionary"""
+        return {
+            "column": self.column,
+            "date_text": self.date_text,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat() if self.end else None,
+            "label": self.label,
+            "weekday": self.weekday
+        }
+
+
+class CalendarLayout:
+    """All layout entries of a calendar document"""
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def columns(self):
+        """Column keys in first-seen order"""
+        return list(dict.fromkeys(entry.column for entry in self.entries))
+
+    def entries_for(self, semester, year):
+        """Entries of one semester column (e.g. 'fall', 2025)"""
+        column = f"{semester.lower()}_{int(year)}"
+        return [entry for entry in self.entries if entry.column == column]
+
+    def find(self, semester, year, pattern):
+        """Entries of a column whose label matches a regex (case-insensitive)"""
+        regex = re.compile(pattern, re.IGNORECASE)
+        return [entry for entry in self.entries_for(semester, year) if regex.search(entry.label)]
+
+
+def _lines(words):
+    """Group words into lines by top coordinate, each sorted left to right"""
+    lines = []
+    for word in sorted(words, key=lambda w: (w.top, w.x0)):
+        if lines and abs(lines[-1][0].top - word.top) <= LINE_TOLERANCE:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+    return [sorted(line, key=lambda w: w.x0) for line in lines]
+
+
+def _date_anchors(lines):
+    """(line, index) of words that start a 'Month D[-D]' date with open space to the left"""
+    anchors = []
+    for line in lines:
+        for index, word in enumerate(line[:-1]):
+            if month_number(word.text) is None or not DAY_PATTERN.match(line[index + 1].text):
+                continue
+            if index and word.x0 - line[index - 1].x1 < ANCHOR_GAP:
+                continue
+            anchors.append((line, index))
+    return anchors
+
+
+def _column_edges(anchors):
+    """Left x of every column, from clusters of anchor x positions"""
+    clusters = []
+    for x0 in sorted(line[index].x0 for line, index in anchors):
+        if clusters and x0 - clusters[-1][-1] <= COLUMN_TOLERANCE:
+            clusters[-1].append(x0)
+        else:
+            clusters.append([x0])
+    return [min(cluster) for cluster in clusters if len(cluster) >= MIN_COLUMN_ANCHORS]
+
+
+def _column_header(words, left, right, below):
+    """('fall', 2025) from a 'FALL 2025 ...' heading above the column, or None"""
+    heading = [w for w in words if w.bottom <= below and left <= (w.x0 + w.x1) / 2 < right]
+    for line in _lines(heading):
+        for index, word in enumerate(line[:-1]):
+            year = YEAR_PATTERN.match(line[index + 1].text)
+            if HEADER_PATTERN.match(word.text) and year:
+                return word.text.lower(), int(year.group(1))
+    return None
+
+
+def _resolve_year(semester, year, month):
+    """Calendar year of a month printed in a semester column"""
+    if semester == 'fall' and month < 7:
+        return year + 1
+    if semester == 'spring' and month > 7:
+        return year - 1
+    return year
+
+
+def _parse_date(text, semester, year):
+    """(start, end) dates for 'Month D', 'Mon D-D' or 'Mon D-Month D'"""
+    tokens = tokenize_line(text.strip())
+    if len(tokens) != 1 or not is_date(tokens[0]) or tokens[0].text != text.strip():
+        return None
+    token = tokens[0]
+    dates = token_dates(token, _resolve_year(semester, year, token.month))
+    if not dates:
+        return None
+    return dates[0], (dates[-1] if token.kind == RANGE else None)
+
+
+def analyze_page(page):
+    """LayoutEntry rows for every semester column found on a PageContent"""
+    words = page.words
+    if not words:
+        return []
+    heights = sorted(w.bottom - w.top for w in words)
+    median = heights[len(heights) // 2]
+    words = [w for w in words if (w.bottom - w.top) <= median * TALL_WORD_FACTOR]
+    page_right = max(w.x1 for w in words)
+    decoration = [w.x0 for w in page.words if (w.bottom - w.top) > median * TALL_WORD_FACTOR]
+
+    lines = _lines(words)
+    anchors = _date_anchors(lines)
+    edges = _column_edges(anchors)
+
+    entries = []
+    for number, left in enumerate(edges):
+        if number + 1 < len(edges):
+            right = edges[number + 1]
+        else:
+            right = min([x0 for x0 in decoration if x0 > left] + [page_right + 1])
+        column_anchors = [(line, index) for line, index in anchors if abs(line[index].x0 - left) <= COLUMN_TOLERANCE]
+        first_top = min(line[index].top for line, index in column_anchors)
+        header = _column_header(words, left, right, first_top)
+        if not header:
+            continue
+        semester, year = header
+        column = f"{semester}_{year}"
+
+        rows = []
+        for line, index in sorted(column_anchors, key=lambda anchor: anchor[0][anchor[1]].top):
+            date_text = f"{line[index].text} {line[index + 1].text}".rstrip(',')
+            parsed = _parse_date(date_text, semester, year)
+            if parsed:
+                rows.append({'top': line[index].top, 'date_text': date_text, 'dates': parsed,
+                             'anchor': {id(line[index]), id(line[index + 1])}, 'label': [], 'weekday': None})
+        if not rows:
+            continue
+        row_tops = [row['top'] for row in rows]
+
+        for line in lines:
+            in_column = [w for w in line if left - COLUMN_TOLERANCE <= w.x0 < right]
+            if not in_column or in_column[0].top < row_tops[0] - LINE_TOLERANCE:
+                continue
+            owner = max(i for i, top in enumerate(row_tops) if top <= in_column[0].top + LINE_TOLERANCE)
+            row = rows[owner]
+            remaining = [w for w in in_column if id(w) not in row['anchor']]
+            if not remaining:
+                continue
+            if abs(remaining[0].x0 - left) <= COLUMN_TOLERANCE:
+                # Text at the column edge under a date is its weekday; a
+                # label continuation may share the line further right
+                split = 1
+                while split < len(remaining) and remaining[split].x0 - remaining[split - 1].x1 < ANCHOR_GAP:
+                    split += 1
+                row['weekday'] = row['weekday'] or ' '.join(w.text for w in remaining[:split])
+                remaining = remaining[split:]
+            if remaining:
+                row['label'].append(' '.join(w.text for w in remaining))
+
+        for row in rows:
+            start, end = row['dates']
+            entries.append(LayoutEntry(column, semester, year, row['date_text'], start, end,
+                                       label=' '.join(row['label']), weekday=row['weekday'],
+                                       page=page.number, top=row['top']))
+    return entries
+
+
+def analyze_document(document):
+    """CalendarLayout for an ExtractedPDF, computed once per document"""
+    layout = getattr(document, '_layout', None)
+    if layout is None:
+        entries = []
+        for page in document.pages:
+            entries.extend(analyze_page(page))
+        layout = CalendarLayout(entries)
+        document._layout = layout
+    return layout
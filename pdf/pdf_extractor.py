@@ -1,107 +1,230 @@
 #!/usr/bin/env python
 
-import re
-import arrow
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 import pdfplumber
+from pdf.date_parser import (
+    extract_first_day_from_pdf_text, extract_last_day_from_pdf_text, extract_no_class_dates_from_pdf_text
+)
 
-def extract_text_from_pdf(pdf_path):
-    ''' Extract text from PDF file '''
-    text = ""
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
-    return text
-
-def extract_first_day_from_pdf_text(text):
-    ''' Extract first day of classes from PDF text '''
-    # Try original pattern first
-    pattern = r'([A-Za-z]+ \d{1,2}, \d{4}).*?first day of classes'
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        try:
-            date_str = match.group(1)
-            return arrow.get(date_str, 'MMMM D, YYYY')
-        except:
-            return None
+PDF_CACHE_DIRNAME = '.pdf_cache'
+
+# One word box from pdfplumber, in PDF points from the page's top-left corner
+Word = namedtuple('Word', ['text', 'x0', 'x1', 'top', 'bottom'])
+
+class PageContent:
+    ''' Text and word boxes of one PDF page '''
     
-    # Try pattern for "Classes Begin" with date before it
-    pattern = r'([A-Za-z]+ \d{1,2})\s+.*?(?:undergraduate|graduate).*?classes begin'
-    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-    if match:
-        try:
-            month_day = match.group(1)
-            # Extract year from context - look for 4-digit year in text
-            year_match = re.search(r'20\d{2}', text)
-            if year_match:
-                year = year_match.group(0)
-                date_str = f"{month_day}, {year}"
-                return arrow.get(date_str, 'MMMM D, YYYY')
-        except:
-            pass
-    
-    return None
-
-def extract_last_day_from_pdf_text(text):
-    ''' Extract last day of classes from PDF text '''
-    # Try original pattern first
-    pattern = r'([A-Za-z]+ \d{1,2}, \d{4}).*?last day of classes'
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        try:
-            date_str = match.group(1)
-            return arrow.get(date_str, 'MMMM D, YYYY')
-        except:
-            return None
+    def __init__(self, number, text, words, width=None):
+        self.number = number
+        self.text = text or ""
+        self.words = words
+        self.width = width
+    
+    def to_dict(self):
+        return {
+            "number": self.number,
+            "text": self.text,
+            "width": self.width,
+            "words": [list(word) for word in self.words]
+        }
     
-    # For this PDF format, look for patterns like "Final Examinations" or similar end indicators
-    # Try to find a reasonable semester end date
-    lines = text.split('\n')
-    for line in lines:
-        if 'final' in line.lower() and ('exam' in line.lower() or 'week' in line.lower()):
-            # Look for dates in this line or nearby lines
-            date_match = re.search(r'([A-Za-z]+ \d{1,2})', line)
-            if date_match:
-                try:
-                    month_day = date_match.group(1)
-                    year_match = re.search(r'20\d{2}', text)
-                    if year_match:
-                        year = year_match.group(0)
-                        date_str = f"{month_day}, {year}"
-                        return arrow.get(date_str, 'MMMM D, YYYY')
-                except:
-                    pass
-    
-    # Fallback: assume semester ends in December for fall semester
-    year_match = re.search(r'20\d{2}', text)
-    if year_match:
-        year = year_match.group(0)
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["number"], data["text"], [Word(*word) for word in data["words"]], data.get("width"))
+
+class ExtractedPDF:
+    ''' Everything parsers need from one PDF, extracted in a single pass '''
+    
+    def __init__(self, content_hash, pages):
+        self.content_hash = content_hash
+        self.pages = pages
+        self._text = None
+    
+    @property
+    def text(self):
+        ''' Page texts joined the way extract_text_from_pdf always returned them '''
+        if self._text is None:
+            self._text = "".join(page.text + "\n" for page in self.pages if page.text)
+        return self._text
+
+def pdf_content_hash(pdf_path):
+    ''' SHA-256 of the PDF bytes '''
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def extract_page(page, number):
+    ''' Read text and word boxes from an open pdfplumber page '''
+    words = []
+    for word in page.extract_words() or []:
         try:
-            return arrow.get(f"December 15, {year}", 'MMMM D, YYYY')
-        except:
-            pass
+            words.append(Word(word['text'], float(word['x0']), float(word['x1']),
+                              float(word['top']), float(word['bottom'])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    width = getattr(page, 'width', None)
+    return PageContent(number, page.extract_text(), words,
+                       float(width) if isinstance(width, (int, float)) else None)
+
+def page_count(pdf_path):
+    ''' Number of pages in a PDF '''
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+def _extract_page_range(task):
+    ''' Worker: extract pages [start, stop) from its own handle on the PDF '''
+    pdf_path, start, stop = task
+    with pdfplumber.open(pdf_path) as pdf:
+        return [extract_page(pdf.pages[index], index + 1) for index in range(start, stop)]
+
+def extract_pages(pdf_path, processes=None):
+    ''' Extract every page, optionally splitting pages across worker processes
     
-    return None
+    With processes > 1 and more than one page, contiguous page ranges are
+    handed to a process pool and reassembled in page order. Otherwise the
+    PDF is opened once and read serially.
+    '''
+    if processes and processes > 1:
+        count = page_count(pdf_path)
+        if count > 1:
+            workers = min(processes, count)
+            bounds = [count * i // workers for i in range(workers + 1)]
+            tasks = [(pdf_path, bounds[i], bounds[i + 1]) for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return [page for chunk in executor.map(_extract_page_range, tasks) for page in chunk]
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        return [extract_page(page, number) for number, page in enumerate(pdf.pages, 1)]
+
+def iter_pages(pdf_path, cache=None):
+    ''' Yield PageContent one page at a time
+    
+    Parsers that only need the first pages can stop iterating early and the
+    remaining pages are never extracted. Already cached PDFs are served from
+    the cache.
+    '''
+    cache = cache or EXTRACTION_CACHE
+    try:
+        document = cache.get(cache.content_hash(pdf_path))
+    except OSError:
+        document = None
+    if document is not None:
+        yield from document.pages
+        return
+    with pdfplumber.open(pdf_path) as pdf:
+        for number, page in enumerate(pdf.pages, 1):
+            yield extract_page(page, number)
+
+def extract_text_until(pdf_path, done, cache=None):
+    ''' Accumulate page text lazily until done(text) is true or pages run out '''
+    parts = []
+    for page in iter_pages(pdf_path, cache):
+        if page.text:
+            parts.append(page.text + "\n")
+            text = "".join(parts)
+            if done(text):
+                return text
+    return "".join(parts)
 
-def extract_no_class_dates_from_pdf_text(text):
-    ''' Extract all no class dates from PDF text '''
-    from pdf.date_parser import extract_date_range_from_text
+class PDFExtractionCache:
+    ''' Extracted PDFs keyed by content hash, in memory and optionally on disk
     
-    no_class_dates = []
-    lines = text.split('\n')
+    A PDF is hashed again only when its path, mtime or size changes, and
+    pdfplumber only runs for content that has never been extracted. On-disk
+    entries live in cache_dir as <hash>.pages files.
+    '''
     
-    for line in lines:
-        if re.search(r'no classes?', line, re.IGNORECASE):
-            dates = extract_date_range_from_text(line)
-            no_class_dates.extend(dates)
+    def __init__(self, cache_dir=None, processes=None):
+        self.cache_dir = cache_dir
+        self.processes = processes
+        self._documents = {}
+        self._hashes = {}
+        self._lock = threading.Lock()
+    
+    def content_hash(self, pdf_path):
+        stat = os.stat(pdf_path)
+        key = (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+        digest = self._hashes.get(key)
+        if digest is None:
+            digest = pdf_content_hash(pdf_path)
+            self._hashes[key] = digest
+        return digest
+    
+    def _entry_path(self, content_hash):
+        return os.path.join(self.cache_dir, f"{content_hash}.pages")
+    
+    def get(self, content_hash):
+        document = self._documents.get(content_hash)
+        if document is not None or not self.cache_dir:
+            return document
+        try:
+            with open(self._entry_path(content_hash), 'r') as f:
+                pages = [PageContent.from_dict(page) for page in json.load(f)]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        document = ExtractedPDF(content_hash, pages)
+        self._documents[content_hash] = document
+        return document
     
-    return no_class_dates
+    def put(self, document):
+        self._documents[document.content_hash] = document
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump([page.to_dict() for page in document.pages], f)
+            os.replace(tmp_path, self._entry_path(document.content_hash))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def extract(self, pdf_path, processes=None):
+        ''' Cached ExtractedPDF for pdf_path (processes: see extract_pages) '''
+        processes = processes or self.processes
+        try:
+            content_hash = self.content_hash(pdf_path)
+        except OSError:
+            # Unreadable for hashing (e.g. not a local file): extract uncached
+            return ExtractedPDF(None, extract_pages(pdf_path, processes))
+        
+        document = self.get(content_hash)
+        if document is None:
+            document = ExtractedPDF(content_hash, extract_pages(pdf_path, processes))
+            with self._lock:
+                self.put(document)
+        return document
+
+# Process-wide cache shared by every parser and request; calendar generation
+# also persists it next to the PDFs (see calendar_json.calendar_manager)
+EXTRACTION_CACHE = PDFExtractionCache()
+
+def extract_pdf(pdf_path, cache=None, processes=None):
+    ''' Extract (or reuse) text and word boxes for every page of a PDF '''
+    return (cache or EXTRACTION_CACHE).extract(pdf_path, processes)
+
+def extract_text_from_pdf(pdf_path):
+    ''' Extract text from PDF file '''
+    return extract_pdf(pdf_path).text
 
 def parse_pdf_calendar(pdf_path):
     ''' Parse PDF calendar and return first, last, cancelled days of class as lists '''
-    text = extract_text_from_pdf(pdf_path)
-    
+    return parse_calendar_text(extract_text_from_pdf(pdf_path))
+
+def parse_calendar_text(text):
+    ''' Parse first, last and cancelled days of class from already extracted text '''
     first_day = extract_first_day_from_pdf_text(text)
     last_day = extract_last_day_from_pdf_text(text)
     no_classes = extract_no_class_dates_from_pdf_text(text)
@@ -1,8 +1,41 @@
 #!/usr/bin/env python
 
-import re
 import arrow
-from pdf.pdf_extractor import extract_text_from_pdf
+from pdf.date_tokens import (
+    KEYWORD, NO_CLASS_KEYWORDS, SEMESTER, academic_years, label_keywords, semester_date_year,
+    token_dates, tokenize
+)
+from pdf.pdf_extractor import extract_pdf
+from pdf.layout import analyze_document
+
+def column_keywords(line, label_line=None):
+    ''' Date tokens of a line and the keyword names describing each one
+    
+    Keywords after a date and before the next one on the same line belong to
+    it ("December 13, 2024 - Last Day of Classes"). Keywords on a following
+    label line without dates of its own are spread over the dates by their
+    position in the line's words, the way the PDF prints one label under each
+    column.
+    '''
+    dates = line.dates
+    keywords = [set() for _ in dates]
+    if not dates:
+        return dates, keywords
+    
+    for token in line.tokens:
+        if token.kind == KEYWORD:
+            owners = [index for index, date in enumerate(dates) if date.start < token.start]
+            if owners:
+                keywords[owners[-1]].add(token.name)
+    
+    if label_line is not None and not label_line.dates:
+        words = len(label_line.text.split())
+        for token in label_line.tokens:
+            if token.kind == KEYWORD:
+                centre = len(label_line.text[:token.start].split()) + len(token.text.split()) / 2
+                keywords[min(int(len(dates) * centre / words), len(dates) - 1)].add(token.name)
+    
+    return dates, keywords
 
 def extract_semester_dates_from_pdf_text(text, semester, year):
     ''' Extract dates for specific semester from PDF text '''
@@ -10,154 +43,90 @@ def extract_semester_dates_from_pdf_text(text, semester, year):
     year = int(year)
     
     # Determine the academic year range
-    if semester == 'fall':
-        start_year = year
-        end_year = year + 1
-    elif semester == 'spring':
-        start_year = year - 1
-        end_year = year
-    else:
+    years = academic_years(semester, year)
+    if not years:
+        return [], [], []
+    start_year, end_year = years
+    
+    lines = tokenize(text)
+    
+    # A calendar that names its semesters but not this one has nothing for it
+    headings = [token for line in lines for token in line.tokens if token.kind == SEMESTER]
+    if headings and not any(token.name == semester and token.year == year for token in headings):
         return [], [], []
     
-    # Look for semester-specific dates in text
-    lines = text.split('\n')
     first_day = None
     last_day = None
     no_classes = []
     
-    # Find semester section boundaries
-    semester_section = []
-    in_semester_section = False
-    
-    for line in lines:
-        line_upper = line.upper()
-        if semester.upper() in line_upper and str(year) in line:
-            in_semester_section = True
-        elif any(other_sem in line_upper for other_sem in ['FALL', 'SPRING', 'SUMMER']) and str(year) not in line and in_semester_section:
-            break
-        if in_semester_section:
-            semester_section.append(line)
-    
-    # If no specific section found, try to extract dates by year filtering
-    if not semester_section:
-        semester_section = lines
-    
-    semester_text = '\n'.join(semester_section)
-    
-    # For this specific PDF format, parse by looking at column structure
-    # Find the main data lines with dates - look for "August 26 January 25" pattern
-    for i, line in enumerate(lines):
-        if 'August 26' in line and 'January 25' in line:
-            # This is the actual class start dates line
-            dates = re.findall(r'([A-Za-z]+ \d{1,2})', line)
-            if len(dates) >= 2:
-                aug_date = dates[0]  # Fall date (August 26)
-                jan_date = dates[1]  # Spring date (January 25)
-                
-                # Look at next line for context
-                next_line = lines[i+1] if i+1 < len(lines) else ""
-                if 'classes begin' in next_line.lower():
-                    if semester == 'fall':
-                        try:
-                            first_day = arrow.get(f"{aug_date}, {start_year}", 'MMMM D, YYYY')
-                        except:
-                            pass
-                    elif semester == 'spring':
-                        try:
-                            first_day = arrow.get(f"{jan_date}, {end_year}", 'MMMM D, YYYY')
-                        except:
-                            pass
+    for index, line in enumerate(lines):
+        if not line.dates:
+            continue
+        label_line = lines[index + 1] if index + 1 < len(lines) else None
+        dates, keywords = column_keywords(line, label_line)
         
-        # Look for "Last Day of Classes" pattern
-        if 'December' in line and 'April' in line:
-            dates = re.findall(r'([A-Za-z]+ \d{1,2})', line)
-            if len(dates) >= 2:
-                dec_date = dates[0]  # Fall end
-                apr_date = dates[1]  # Spring end
-                
-                # Check if this is about last day of classes
-                next_line = lines[i+1] if i+1 < len(lines) else ""
-                if 'last day of classes' in next_line.lower():
-                    if semester == 'fall':
-                        try:
-                            last_day = arrow.get(f"{dec_date}, {start_year}", 'MMMM D, YYYY')
-                        except:
-                            pass
-                    elif semester == 'spring':
-                        try:
-                            last_day = arrow.get(f"{apr_date}, {end_year}", 'MMMM D, YYYY')
-                        except:
-                            pass
-        
-        # Look for holidays and breaks
-        if re.search(r'holiday|break', line, re.IGNORECASE) and not re.search(r'final|exam', line, re.IGNORECASE):
-            # Extract dates from holiday lines
-            date_matches = re.findall(r'([A-Za-z]+ \d{1,2})', line)
-            date_range_match = re.search(r'([A-Za-z]+ \d{1,2})-(\d{1,2})', line)
+        for token, names in zip(dates, keywords):
+            date_year = semester_date_year(semester, start_year, end_year, token.month)
+            if date_year is None or (token.year and token.year != date_year):
+                continue
+            days = token_dates(token, date_year)
+            if not days:
+                continue
             
-            if date_range_match:
-                # Handle date ranges like "November 27-29"
-                try:
-                    start_month_day = date_range_match.group(1)
-                    end_day = int(date_range_match.group(2))
-                    
-                    month_name = start_month_day.split()[0]
-                    start_day = int(start_month_day.split()[1])
-                    
-                    months = ['January', 'February', 'March', 'April', 'May',
-                            'June', 'July', 'August', 'September', 'October', 'November', 'December']
-                    month_num = months.index(month_name) + 1
-                    
-                    # Determine year based on semester and month
-                    if semester == 'fall' and month_num >= 8:
-                        date_year = start_year
-                    elif semester == 'spring' and month_num <= 6:
-                        date_year = end_year
-                    else:
-                        continue
-                    
-                    for day in range(start_day, end_day + 1):
-                        no_classes.append(arrow.get(date_year, month_num, day))
-                except:
-                    pass
-            else:
-                # Handle single dates
-                for date_match in date_matches:
-                    try:
-                        month_name = date_match.split()[0]
-                        months = ['January', 'February', 'March', 'April', 'May',
-                                'June', 'July', 'August', 'September', 'October', 'November', 'December']
-                        month_num = months.index(month_name) + 1
-                        
-                        # Determine year based on semester and month
-                        if semester == 'fall' and month_num >= 8:
-                            date_year = start_year
-                        elif semester == 'spring' and month_num <= 6:
-                            date_year = end_year
-                        else:
-                            continue
-                            
-                        date_str = f"{date_match}, {date_year}"
-                        no_classes.append(arrow.get(date_str, 'MMMM D, YYYY'))
-                    except:
-                        pass
+            if 'classes_begin' in names or 'first_day' in names:
+                first_day = first_day or arrow.get(days[0])
+            if 'last_day' in names:
+                last_day = arrow.get(days[0])
+            if names & NO_CLASS_KEYWORDS and 'exam' not in names:
+                no_classes.extend(arrow.get(day) for day in days)
     
     # Fallback for last day if not found - use reasonable semester end dates
     if not last_day:
         if semester == 'fall':
-            try:
-                last_day = arrow.get(f"December 15, {start_year}", 'MMMM D, YYYY')
-            except:
-                pass
+            last_day = arrow.get(start_year, 12, 15)
         elif semester == 'spring':
-            try:
-                last_day = arrow.get(f"May 15, {end_year}", 'MMMM D, YYYY')
-            except:
-                pass
+            last_day = arrow.get(end_year, 5, 15)
     
     return ([first_day] if first_day else []), ([last_day] if last_day else []), no_classes
 
+def extract_semester_dates_from_layout(layout, semester, year):
+    ''' Extract first, last and no-class dates from a semester's layout column
+    
+    Returns None when the layout has no column for the semester so callers
+    can fall back to the text parser.
+    '''
+    semester = semester.lower()
+    year = int(year)
+    entries = layout.entries_for(semester, year)
+    if not entries:
+        return None
+    
+    keywords = {id(entry): label_keywords(entry.label) for entry in entries}
+    
+    starts = [entry for entry in entries if 'classes_begin' in keywords[id(entry)]]
+    starts.sort(key=lambda entry: ('undergraduate' not in entry.label.lower(), entry.start))
+    first_day = arrow.get(starts[0].start) if starts else None
+    
+    ends = [entry for entry in entries if 'last_day' in keywords[id(entry)]]
+    if ends:
+        last_day = arrow.get(ends[-1].start)
+    elif semester == 'fall':
+        last_day = arrow.get(year, 12, 15)
+    else:
+        last_day = arrow.get(year, 5, 15)
+    
+    no_classes = []
+    for entry in entries:
+        names = keywords[id(entry)]
+        if names & NO_CLASS_KEYWORDS and 'exam' not in names:
+            no_classes.extend(arrow.get(date) for date in entry.dates())
+    
+    return ([first_day] if first_day else []), [last_day], no_classes
+
 def parse_pdf_calendar_for_semester(pdf_path, semester, year):
     ''' Parse PDF calendar for specific semester and year '''
-    text = extract_text_from_pdf(pdf_path)
-    return extract_semester_dates_from_pdf_text(text, semester, year)
\ No newline at end of file
+    document = extract_pdf(pdf_path)
+    from_layout = extract_semester_dates_from_layout(analyze_document(document), semester, year)
+    if from_layout is not None:
+        return from_layout
+    return extract_semester_dates_from_pdf_text(document.text, semester, year)
\ No newline at end of file
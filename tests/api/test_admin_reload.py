@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import sys
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from api import create_app
+
+
+class TestAdminReload(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.app.config['ADMIN_TOKEN'] = 'test-token'
+        self.client = self.app.test_client()
+        self.headers = {'X-Admin-Token': 'test-token'}
+
+    def test_reload_from_loopback(self):
+        """Loopback callers can reload a semester's departments"""
+        # Act
+        with patch('api.blueprints.admin_bp.IndexReloadService.reload',
+                   return_value={'reloaded': ['meeting_index']}) as mock_reload:
+            response = self.client.post('/api/admin/reload', headers=self.headers,
+                                        json={'semester': '25_FA', 'departments': ['THR']})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        mock_reload.assert_called_once_with('25_FA', ['THR'])
+        self.assertEqual(json.loads(response.data)['data']['reloaded'], ['meeting_index'])
+
+    def test_reload_rejects_remote_callers(self):
+        """Requests from other hosts are refused"""
+        response = self.client.post('/api/admin/reload', json={'departments': ['THR']}, headers=self.headers,
+                                    environ_base={'REMOTE_ADDR': '10.1.2.3'})
+        self.assertEqual(response.status_code, 403)
+
+    def test_reload_requires_token(self):
+        """Loopback callers without the token are refused, e.g. requests forwarded by a local proxy"""
+        # Act
+        with patch('api.blueprints.admin_bp.IndexReloadService.reload') as mock_reload:
+            missing = self.client.post('/api/admin/reload', json={'departments': ['THR']})
+            wrong = self.client.post('/api/admin/reload', json={'departments': ['THR']},
+                                     headers={'X-Admin-Token': 'guess'})
+
+        # Assert
+        self.assertEqual(missing.status_code, 401)
+        self.assertEqual(wrong.status_code, 401)
+        mock_reload.assert_not_called()
+
+    def test_reload_disabled_without_configured_token(self):
+        """With no ADMIN_TOKEN configured the admin endpoints are off"""
+        self.app.config['ADMIN_TOKEN'] = None
+        response = self.client.post('/api/admin/reload', json={'departments': ['THR']}, headers=self.headers)
+        self.assertEqual(response.status_code, 403)
+
+    def test_reload_validates_departments(self):
+        """Malformed department codes are rejected"""
+        response = self.client.post('/api/admin/reload', json={'departments': ['thr']}, headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from api.utils.validators import validate_schedule_export_request
+
+
+class TestScheduleExportValidation(unittest.TestCase):
+
+    def export_errors(self, start_time, end_time):
+        return validate_schedule_export_request({
+            'semester_year': '25_FA',
+            'weekdays': ['Monday', 'Wednesday'],
+            'start_time': start_time,
+            'end_time': end_time,
+        })
+
+    def test_valid_meeting_time(self):
+        # Act
+        errors = self.export_errors('10:30AM', '11:45 a.m.')
+
+        # Assert
+        self.assertEqual(errors, {})
+
+    def test_noon_to_afternoon_is_valid(self):
+        # Act
+        errors = self.export_errors('12:00PM', '01:15PM')
+
+        # Assert
+        self.assertEqual(errors, {})
+
+    def test_out_of_range_times_are_rejected(self):
+        for value in ('99:99AM', '13:00PM', '00:30AM', '10:60AM'):
+            with self.subTest(value=value):
+                # Act
+                errors = self.export_errors(value, '11:00PM')
+
+                # Assert
+                self.assertIn('start_time', errors)
+
+    def test_end_must_follow_start(self):
+        for start_time, end_time in (('11:00AM', '10:00AM'), ('10:00AM', '10:00AM'), ('01:00PM', '12:30PM')):
+            with self.subTest(start_time=start_time, end_time=end_time):
+                # Act
+                errors = self.export_errors(start_time, end_time)
+
+                # Assert
+                self.assertEqual(list(errors), ['end_time'])
+
+    def test_times_must_be_paired(self):
+        # Act
+        errors = self.export_errors('10:00AM', '')
+
+        # Assert
+        self.assertIn('end_time', errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
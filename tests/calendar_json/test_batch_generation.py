@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from calendar_json.calendar_manager import generate_calendar_json, recorded_sources
+from pdf.pdf_extractor import EXTRACTION_CACHE, pdf_content_hash
+
+CALENDAR_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'niagara', '2025-2026-academic-calendar.pdf')
+
+
+class TestBatchCalendarGeneration(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_dir = os.path.join(self.temp_dir, 'pdfs')
+        self.output_dir = os.path.join(self.temp_dir, 'calendars')
+        os.makedirs(self.pdf_dir)
+        for year in (2023, 2024):
+            shutil.copy(CALENDAR_PDF, os.path.join(self.pdf_dir, f'{year}-{year + 1}-academic-calendar.pdf'))
+        self.previous_cache_dir = EXTRACTION_CACHE.cache_dir
+        EXTRACTION_CACHE.cache_dir = os.path.join(self.temp_dir, '.pdf_cache')
+
+    def tearDown(self):
+        EXTRACTION_CACHE.cache_dir = self.previous_cache_dir
+        shutil.rmtree(self.temp_dir)
+
+    def read_output(self, filename):
+        with open(os.path.join(self.output_dir, filename), 'r') as f:
+            return json.load(f)
+
+    def test_outputs_record_source_hash(self):
+        """Every semester file records the hash of the PDF it came from"""
+        # Act
+        generate_calendar_json(self.pdf_dir, self.output_dir)
+
+        # Assert
+        fall = self.read_output('fall_2023.json')
+        self.assertEqual(fall['source_file'], '2023-2024-academic-calendar.pdf')
+        self.assertEqual(fall['source_hash'], pdf_content_hash(CALENDAR_PDF))
+        self.assertEqual(self.read_output('active_semester.json')['available_semesters'],
+                         ['fall_2023', 'fall_2024', 'spring_2024', 'spring_2025'])
+
+    def test_unchanged_pdfs_are_skipped(self):
+        """A second run parses nothing when every recorded hash matches"""
+        # Arrange
+        generate_calendar_json(self.pdf_dir, self.output_dir)
+
+        # Act
+        with patch('calendar_json.calendar_manager.parse_pdf_to_json_with_events') as mock_parse:
+            generate_calendar_json(self.pdf_dir, self.output_dir)
+
+        # Assert
+        mock_parse.assert_not_called()
+
+    def test_changed_hash_is_regenerated(self):
+        """Only the PDF whose recorded hash differs is parsed again"""
+        # Arrange
+        generate_calendar_json(self.pdf_dir, self.output_dir)
+        for filename in ('fall_2024.json', 'spring_2025.json'):
+            data = self.read_output(filename)
+            data['source_hash'] = 'stale'
+            with open(os.path.join(self.output_dir, filename), 'w') as f:
+                json.dump(data, f)
+
+        # Act
+        generate_calendar_json(self.pdf_dir, self.output_dir)
+
+        # Assert
+        self.assertEqual(recorded_sources(self.output_dir)['2024-2025-academic-calendar.pdf'],
+                         {pdf_content_hash(CALENDAR_PDF)})
+
+    def test_process_pool_matches_serial_output(self):
+        """Pooled generation writes the same semester data as the serial run"""
+        # Arrange
+        generate_calendar_json(self.pdf_dir, self.output_dir)
+        serial = self.read_output('spring_2025.json')
+
+        # Act
+        generate_calendar_json(self.pdf_dir, self.output_dir, workers=2, force=True)
+
+        # Assert
+        pooled = self.read_output('spring_2025.json')
+        serial.pop('generated_at')
+        pooled.pop('generated_at')
+        self.assertEqual(pooled, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from calendar_json import provenance
+from calendar_json.calendar_manager import generate_calendar_json
+from calendar_json.provenance import MANUAL, PARSED, CalendarIndex, merge_calendar_fields
+from pdf.pdf_extractor import EXTRACTION_CACHE
+
+CALENDAR_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'niagara', '2025-2026-academic-calendar.pdf')
+
+PARSED_FIELDS = {'first_day': '2025-08-25', 'last_day': '2025-12-11', 'no_class_dates': [], 'events': []}
+
+
+class TestMergeCalendarFields(unittest.TestCase):
+
+    def setUp(self):
+        fields, self.provenance, _ = merge_calendar_fields(None, PARSED_FIELDS)
+        self.stored = dict(fields, provenance=self.provenance)
+
+    def test_parsed_fields_follow_new_parse(self):
+        """Untouched parsed values are replaced by the new parse"""
+        # Act
+        fields, recorded, preserved = merge_calendar_fields(self.stored, dict(PARSED_FIELDS, last_day='2025-12-12'))
+
+        # Assert
+        self.assertEqual(fields['last_day'], '2025-12-12')
+        self.assertEqual(recorded['last_day']['source'], PARSED)
+        self.assertEqual(preserved, [])
+
+    def test_manual_edit_is_kept_on_every_run(self):
+        """A hand-edited value survives this and later merges"""
+        # Arrange
+        self.stored['first_day'] = '2025-08-26'
+
+        # Act
+        fields, recorded, preserved = merge_calendar_fields(self.stored, PARSED_FIELDS)
+        again, _, _ = merge_calendar_fields(dict(fields, provenance=recorded), PARSED_FIELDS)
+
+        # Assert
+        self.assertEqual(preserved, ['first_day'])
+        self.assertEqual(recorded['first_day']['source'], MANUAL)
+        self.assertEqual(again['first_day'], '2025-08-26')
+
+    def test_files_without_provenance_are_parsed(self):
+        """Files written before provenance existed take the new parse"""
+        fields, _, preserved = merge_calendar_fields({'first_day': 'TBD'}, PARSED_FIELDS)
+
+        self.assertEqual(fields['first_day'], '2025-08-25')
+        self.assertEqual(preserved, [])
+
+
+class TestCalendarIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for semester, first_day in (('fall_2025', 'TBD'), ('spring_2026', '2026-01-20')):
+            self.write(semester, first_day)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, semester, first_day):
+        with open(os.path.join(self.temp_dir, f'{semester}.json'), 'w') as f:
+            json.dump({'semester': semester, 'source_file': 'calendar.pdf', 'source_hash': 'abc',
+                       'first_day': first_day, 'last_day': '2026-05-12', 'events': []}, f)
+
+    def test_report_reads_flat_semester_files(self):
+        """TBD fields of semester files are reported"""
+        # Act
+        report = CalendarIndex(self.temp_dir).tbd_report()
+
+        # Assert
+        self.assertEqual([entry['file'] for entry in report], ['fall_2025.json'])
+        self.assertEqual(report[0]['items'][0]['field'], 'first_day')
+
+    def test_only_changed_files_are_reread(self):
+        """A saved index re-reads just the files modified since"""
+        # Arrange
+        CalendarIndex(self.temp_dir).tbd_report()
+        self.write('spring_2026', 'TBD')
+        os.utime(os.path.join(self.temp_dir, 'spring_2026.json'), ns=(1, 1))
+
+        # Act
+        with patch('calendar_json.provenance.tbd_items', wraps=provenance.tbd_items) as mock_items:
+            report = CalendarIndex(self.temp_dir).tbd_report()
+
+        # Assert
+        self.assertEqual(mock_items.call_count, 1)
+        self.assertEqual([entry['file'] for entry in report], ['fall_2025.json', 'spring_2026.json'])
+
+    def test_sources_come_from_index(self):
+        """Recorded source hashes are served from the index"""
+        self.assertEqual(CalendarIndex(self.temp_dir).sources(), {'calendar.pdf': {'abc'}})
+
+
+class TestIncrementalRegeneration(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_dir = os.path.join(self.temp_dir, 'pdfs')
+        self.output_dir = os.path.join(self.temp_dir, 'calendars')
+        os.makedirs(self.pdf_dir)
+        shutil.copy(CALENDAR_PDF, self.pdf_dir)
+        self.previous_cache_dir = EXTRACTION_CACHE.cache_dir
+        EXTRACTION_CACHE.cache_dir = os.path.join(self.temp_dir, '.pdf_cache')
+
+    def tearDown(self):
+        EXTRACTION_CACHE.cache_dir = self.previous_cache_dir
+        shutil.rmtree(self.temp_dir)
+
+    def test_manual_edit_survives_regeneration(self):
+        """Regenerating a PDF keeps hand-edited fields and reports them"""
+        # Arrange
+        generate_calendar_json(self.pdf_dir, self.output_dir)
+        path = os.path.join(self.output_dir, 'fall_2025.json')
+        with open(path, 'r') as f:
+            data = json.load(f)
+        data['last_day'] = '2025-12-12'
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+        # Act
+        generate_calendar_json(self.pdf_dir, self.output_dir, force=True)
+
+        # Assert
+        with open(path, 'r') as f:
+            data = json.load(f)
+        self.assertEqual(data['last_day'], '2025-12-12')
+        self.assertEqual(data['first_day'], '2025-08-25')
+        self.assertEqual(generate_calendar_json._preservation_notes[0]['preserved_fields'], ['last_day'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.autocomplete import AutocompleteIndex, build_autocomplete_index, update_autocomplete_index
+from core.data_loader import DepartmentDataLoader
+
+
+class TestAutocompleteIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = AutocompleteIndex()
+        self.index.add_course('THR', '101', 'Introduction to Theater')
+        self.index.add_course('THR', '102', 'Performance Techniques II')
+        self.index.add_course('THR', '220', 'Stage Lighting')
+        self.index.add_course('ACC', '111', 'Financial Accounting')
+        self.index.add_section('THR101A', 'Introduction to Theater')
+        self.index.build()
+
+    def test_course_id_prefix(self):
+        """Course id prefixes complete in course order"""
+        # Act
+        results = self.index.complete('THR 1')
+
+        # Assert
+        self.assertEqual([r['value'] for r in results], ['THR 101', 'THR 102', 'THR101A'])
+
+    def test_compact_and_lowercase_queries(self):
+        """Queries without spaces and in lowercase still match"""
+        self.assertEqual(self.index.complete('thr10', limit=2)[0]['value'], 'THR 101')
+
+    def test_title_word_prefix(self):
+        """Any word in a course title can start a completion"""
+        results = self.index.complete('light')
+        self.assertEqual([r['value'] for r in results], ['THR 220'])
+
+    def test_limit(self):
+        """No more than limit suggestions are returned"""
+        self.assertEqual(len(self.index.complete('T', limit=2)), 2)
+
+    def test_empty_query(self):
+        """Empty queries return nothing"""
+        self.assertEqual(self.index.complete('  '), [])
+
+
+class TestBuildAutocompleteIndex(unittest.TestCase):
+
+    def test_build_from_departments_and_semester(self):
+        """Index includes department courses and semester section codes"""
+        # Arrange
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, 'departments'))
+            os.makedirs(os.path.join(temp_dir, 'semesters', '25_FA'))
+            with open(os.path.join(temp_dir, 'departments', 'THR.json'), 'w') as f:
+                json.dump({"name": "Theater Arts", "courses": [{"number": "101", "title": "Intro"}]}, f)
+            with open(os.path.join(temp_dir, 'semesters', '25_FA', 'THR.json'), 'w') as f:
+                json.dump([{"number": "THR101A", "name": "Intro"}, {"number": "THR305A", "name": "Directing"}], f)
+
+            # Act
+            index = build_autocomplete_index(DepartmentDataLoader(temp_dir), '25_FA')
+
+        # Assert
+        values = [r['value'] for r in index.complete('THR')]
+        self.assertEqual(values, ['THR 101', 'THR 305', 'THR101A', 'THR305A'])
+
+    def test_update_rereads_only_changed_departments(self):
+        """Updating one department re-reads its files and keeps every other entry"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            os.makedirs(os.path.join(temp_dir, 'departments'))
+            os.makedirs(os.path.join(temp_dir, 'semesters', '25_FA'))
+            for code, title in (('THR', 'Intro'), ('ACC', 'Financial Accounting')):
+                with open(os.path.join(temp_dir, 'departments', f'{code}.json'), 'w') as f:
+                    json.dump({"name": code, "courses": [{"number": "101", "title": title}]}, f)
+            with open(os.path.join(temp_dir, 'semesters', '25_FA', 'THR.json'), 'w') as f:
+                json.dump([{"number": "THR101A", "name": "Intro"}], f)
+            with open(os.path.join(temp_dir, 'semesters', '25_FA', 'ACC.json'), 'w') as f:
+                json.dump([{"number": "ACC101A", "name": "Financial Accounting"}], f)
+            loader = DepartmentDataLoader(temp_dir)
+            index = build_autocomplete_index(loader, '25_FA')
+            with open(os.path.join(temp_dir, 'semesters', '25_FA', 'THR.json'), 'w') as f:
+                json.dump([{"number": "THR101B", "name": "Intro"}], f)
+
+            # Act
+            with patch.object(loader, 'load_department', wraps=loader.load_department) as mock_load:
+                updated = update_autocomplete_index(index, loader, ['THR'], '25_FA')
+
+        # Assert
+        mock_load.assert_called_once_with('THR')
+        self.assertEqual([r['value'] for r in updated.complete('THR')], ['THR 101', 'THR101B'])
+        self.assertEqual([r['value'] for r in updated.complete('ACC')], ['ACC 101', 'ACC101A'])
+        self.assertEqual([r['value'] for r in updated.complete('financ')], ['ACC 101'])
+        self.assertIn('THR101A', index)
+
+
+if __name__ == '__main__':
+    unittest.main()
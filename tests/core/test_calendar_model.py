@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+import unittest
+import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from api import create_app
+from core.calendar_model import DateInterval, IntervalIndex, SemesterCalendar, compress_dates, iter_ics
+from pdf.date_parser import parse_date_interval_from_text
+
+D = datetime.date
+
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def test_compress_dates_merges_consecutive_days(self):
+        """Runs of days become one interval; TBD and duplicates are dropped"""
+        intervals = compress_dates(['2025-11-28', '2025-11-26', '2025-11-27', 'TBD', '2025-12-01', '2025-11-27'])
+
+        self.assertEqual(intervals, [DateInterval(D(2025, 11, 26), D(2025, 11, 28)),
+                                     DateInterval(D(2025, 12, 1), D(2025, 12, 1))])
+
+    def test_point_query_finds_overlapping_intervals(self):
+        """A long interval starting earlier still covers later days"""
+        # Arrange
+        index = IntervalIndex([
+            (DateInterval(D(2025, 12, 8), D(2025, 12, 19)), 'exams'),
+            (DateInterval(D(2025, 12, 10), D(2025, 12, 10)), 'reading day'),
+            (DateInterval(D(2025, 12, 12), D(2025, 12, 13)), 'commencement'),
+        ])
+
+        # Act / Assert
+        self.assertEqual(index.at(D(2025, 12, 12)), ['exams', 'commencement'])
+        self.assertEqual(index.at(D(2025, 12, 11)), ['exams'])
+        self.assertEqual(index.at(D(2025, 12, 20)), [])
+        self.assertFalse(index.covers(D(2025, 12, 7)))
+
+    def test_parse_date_interval(self):
+        """Ranges parse to their endpoints without listing every day"""
+        self.assertEqual(parse_date_interval_from_text("November 27-29", 2024), ('2024-11-27', '2024-11-29'))
+        self.assertIsNone(parse_date_interval_from_text("November 27", 2024))
+
+
+class TestSemesterCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = SemesterCalendar.from_json({
+            "first_day": "2025-09-01",
+            "last_day": "2025-09-19",
+            "no_class_dates": ["2025-09-03"],
+            "events": [
+                {"name": "Fall Break", "date": None, "date_range": ["2025-09-10", "2025-09-11", "2025-09-12"],
+                 "type": "break"},
+                {"name": "Mid-term Grades Due", "date": "2025-09-15", "date_range": None, "type": "academic"},
+            ]
+        })
+
+    def test_ranges_are_stored_as_intervals(self):
+        """A three-day break is a single interval"""
+        intervals = [interval for interval, _ in self.calendar.events]
+
+        self.assertIn(DateInterval(D(2025, 9, 10), D(2025, 9, 12)), intervals)
+
+    def test_meeting_days_skip_no_class_days(self):
+        """No-class days and breaks are not meeting days"""
+        days = list(self.calendar.meeting_days(['Monday', 'Wednesday', 'Friday']))
+
+        self.assertEqual(days, [D(2025, 9, 1), D(2025, 9, 5), D(2025, 9, 8), D(2025, 9, 15),
+                                D(2025, 9, 17), D(2025, 9, 19)])
+
+    def test_ics_export(self):
+        """The export has one event per meeting with times and event notes"""
+        # Act
+        lines = list(iter_ics(self.calendar, ['Monday'], 'THR 103', start_minutes=630, end_minutes=680))
+
+        # Assert
+        text = ''.join(lines)
+        self.assertTrue(all(line.endswith('\r\n') for line in lines))
+        self.assertEqual(text.count('BEGIN:VEVENT'), 3)
+        self.assertIn('DTSTART:20250915T103000\r\n', text)
+        self.assertIn('DTEND:20250915T112000\r\n', text)
+        self.assertIn('DESCRIPTION:Mid-term Grades Due\r\n', text)
+        self.assertTrue(text.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertTrue(text.endswith('END:VCALENDAR\r\n'))
+
+    def test_long_lines_are_folded(self):
+        """Content lines longer than 75 octets continue on indented lines"""
+        lines = list(iter_ics(self.calendar, ['Monday'], 'A' * 120))
+
+        folded = [line for line in lines if line.startswith('SUMMARY:')][0]
+        self.assertTrue(all(len(part.encode('utf-8')) <= 75 for part in folded.split('\r\n')))
+        self.assertEqual(folded.replace('\r\n ', ''), 'SUMMARY:' + 'A' * 120 + '\r\n')
+
+
+class TestScheduleIcsEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app('testing').test_client()
+
+    def test_export_streams_calendar(self):
+        """The endpoint returns an .ics attachment built from the semester calendar"""
+        # Act
+        response = self.client.post('/api/export-schedule-ics', json={
+            'semester_year': '25_FA', 'weekdays': ['Tuesday', 'Thursday'], 'title': 'ENG 110'
+        })
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/calendar')
+        self.assertIn('eng-110_fall_2025.ics', response.headers['Content-Disposition'])
+        self.assertIn(b'SUMMARY:ENG 110', response.data)
+
+    def test_export_rejects_unpaired_times(self):
+        """A start time without an end time is a validation error"""
+        response = self.client.post('/api/export-schedule-ics', json={
+            'semester_year': '25_FA', 'weekdays': ['Monday'], 'start_time': '10:30AM'
+        })
+
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == '__main__':
+    unittest.main()
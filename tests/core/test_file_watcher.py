@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import MagicMock, patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.file_watcher import CREATED, DELETED, MODIFIED, FileChange, FileWatcher, coalesce
+from core.file_writer import AtomicWriter, write_atomic
+from api.config import DevelopmentConfig, ProductionConfig, TestingConfig
+from api.services.index_reload_service import IndexReloadService
+
+
+class FileWatcherCases:
+    """Behaviour shared by both backends"""
+
+    backend = None
+    wait = 1.0
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.departments = os.path.join(self.temp_dir, 'departments')
+        self.semesters = os.path.join(self.temp_dir, 'semesters')
+        os.makedirs(self.departments)
+        os.makedirs(os.path.join(self.semesters, '25_FA'))
+        write_atomic(os.path.join(self.departments, 'ACC.json'), '{}')
+        self.watcher = FileWatcher({'departments': self.departments, 'semesters': self.semesters},
+                                   interval=0.05, backend=self.backend)
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def changes(self):
+        return {(change.area, change.kind, change.name) for change in self.watcher.poll(self.wait)}
+
+    def test_atomic_write_is_one_change(self):
+        """Rewriting a file through a temp file reports only the file itself"""
+        write_atomic(os.path.join(self.departments, 'ACC.json'), '{"name": "Accounting"}')
+
+        self.assertEqual(self.changes(), {('departments', MODIFIED, 'ACC.json')})
+
+    def test_semester_files_and_folders(self):
+        """Files in semester folders and new folders are reported with their area-relative names"""
+        # Act
+        with open(os.path.join(self.semesters, '25_FA', 'THR.json'), 'w') as f:
+            f.write('[]')
+        os.makedirs(os.path.join(self.semesters, '26_SP'))
+
+        # Assert
+        self.assertEqual(self.changes(), {('semesters', CREATED, '25_FA/THR.json'),
+                                          ('semesters', CREATED, '26_SP')})
+
+    def test_deletes_and_subscribers(self):
+        """Subscribers receive each published batch"""
+        # Arrange
+        received = []
+        self.watcher.subscribe(received.append)
+
+        # Act
+        os.remove(os.path.join(self.departments, 'ACC.json'))
+        self.watcher.poll(self.wait)
+
+        # Assert
+        self.assertEqual([(change.kind, change.name) for change in received[0]], [(DELETED, 'ACC.json')])
+
+
+class TestPollingWatcher(FileWatcherCases, unittest.TestCase):
+    backend = 'polling'
+    wait = 0.05
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'inotify is Linux only')
+class TestInotifyWatcher(FileWatcherCases, unittest.TestCase):
+    backend = 'inotify'
+
+
+class TestManifestWatching(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.departments = os.path.join(self.temp_dir, 'departments')
+        os.makedirs(self.departments)
+        self.manifest = os.path.join(self.temp_dir, '.changes.jsonl')
+        self.writer = AtomicWriter(manifest_path=self.manifest)
+        self.writer.write_text(os.path.join(self.temp_dir, 'program_overviews.json'), '{}')
+        self.watcher = FileWatcher({'departments': self.departments}, interval=0.05,
+                                   backend='polling', manifest_path=self.manifest)
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_manifest_records_are_published(self):
+        """Scraper writes outside the watched areas arrive through the manifest, once per path"""
+        # Act
+        self.writer.write_text(os.path.join(self.temp_dir, 'program_overviews.json'), '{"Nursing": {}}')
+        self.writer.write_text(os.path.join(self.departments, 'THR.json'), '{}')
+        changes = self.watcher.poll(0.05)
+
+        # Assert
+        self.assertCountEqual([(change.area, change.kind, change.name) for change in changes],
+                              [('data', MODIFIED, 'program_overviews.json'),
+                               ('departments', CREATED, 'THR.json')])
+
+
+class TestCoalesce(unittest.TestCase):
+
+    def test_net_effect_per_path(self):
+        """Create+modify is a create; create+delete disappears; delete+create is a modify"""
+        def change(kind, path):
+            return FileChange('departments', kind, path, path, False)
+
+        merged = coalesce([change(CREATED, 'a'), change(MODIFIED, 'a'), change(CREATED, 'b'),
+                           change(DELETED, 'b'), change(DELETED, 'c'), change(CREATED, 'c')])
+
+        self.assertEqual([(c.path, c.kind) for c in merged], [('a', CREATED), ('c', MODIFIED)])
+
+
+class TestApplyChanges(unittest.TestCase):
+
+    def setUp(self):
+        self.app = MagicMock()
+        self.app.autocomplete_semester = '25_FA'
+        self.service = IndexReloadService(self.app)
+
+    def test_department_change_reindexes_only_that_department(self):
+        """A department file change touches just its manifest entry and search documents"""
+        # Act
+        result = self.service.apply_changes([
+            FileChange('departments', MODIFIED, '/data/departments/THR.json', 'THR.json', False)
+        ])
+
+        # Assert
+        self.app.data_loader.invalidate_department.assert_called_once_with('THR')
+        self.app.search_index.index_department.assert_called_once_with('THR')
+        self.app.data_loader.invalidate_semester.assert_not_called()
+        self.assertEqual(result['departments'], ['THR'])
+
+    def test_semester_change_drops_only_that_meeting_index(self):
+        """Section file changes invalidate their semester; other semesters keep their caches"""
+        # Act
+        result = self.service.apply_changes([
+            FileChange('semesters', MODIFIED, '/data/semesters/24_SP/ACC.json', '24_SP/ACC.json', False),
+            FileChange('templates', MODIFIED, '/templates/syllabus_master.md', 'syllabus_master.md', False)
+        ])
+
+        # Assert
+        self.app.data_loader.invalidate_semester.assert_called_once_with('24_SP')
+        self.app.search_index.index_department.assert_not_called()
+        self.assertEqual(result['reloaded'], ['semester_registry', 'meeting_index'])
+
+    def test_autocomplete_semester_file_updates_only_its_department(self):
+        """A section file in the autocomplete semester re-reads just that department"""
+        # Act
+        with patch('api.services.index_reload_service.update_autocomplete_index') as mock_update, \
+                patch('api.services.index_reload_service.build_autocomplete_index') as mock_build:
+            self.service.apply_changes([
+                FileChange('semesters', MODIFIED, '/data/semesters/25_FA/THR.json', '25_FA/THR.json', False)
+            ])
+
+        # Assert
+        mock_build.assert_not_called()
+        self.assertEqual(mock_update.call_args.args[2], ['THR'])
+        self.assertIs(self.app.autocomplete_index, mock_update.return_value)
+
+    def test_program_overviews_change_reindexes_programs(self):
+        """A program overviews rewrite reported by the manifest re-indexes the programs"""
+        result = self.service.apply_changes([
+            FileChange('data', MODIFIED, '/data/program_overviews.json', 'program_overviews.json', False)
+        ])
+
+        self.app.search_index.index_program_overviews.assert_called_once_with()
+        self.assertEqual(result['reloaded'], ['program_overviews'])
+
+    def test_new_folder_refreshes_semester_registry(self):
+        """A new semester folder refreshes the semester listings"""
+        self.service.apply_changes([FileChange('semesters', CREATED, '/data/semesters/26_SP', '26_SP', True)])
+
+        self.app.data_loader.semester_registry.invalidate.assert_called_once_with()
+
+    def test_section_file_change_refreshes_semester_registry(self):
+        """Changes inside a semester folder also drop the cached listings"""
+        self.service.apply_changes([
+            FileChange('semesters', CREATED, '/data/semesters/26_SP/ACC.json', '26_SP/ACC.json', False)
+        ])
+
+        self.app.data_loader.semester_registry.invalidate.assert_called_once_with()
+
+
+class TestWatchConfig(unittest.TestCase):
+
+    @unittest.skipIf('WATCH_FILES' in os.environ, 'WATCH_FILES is set in the environment')
+    def test_every_process_watches_by_default(self):
+        """Each production worker watches files itself; admin reloads reach only one worker"""
+        self.assertTrue(ProductionConfig.WATCH_FILES)
+        self.assertTrue(DevelopmentConfig.WATCH_FILES)
+        self.assertFalse(TestingConfig.WATCH_FILES)
+
+
+if __name__ == '__main__':
+    unittest.main()
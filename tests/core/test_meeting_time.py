@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.meeting_time import (
+    parse_days, parse_time, parse_meetings, days_from_mask, normalize_offering,
+    MeetingTime, MeetingIndex, find_conflicts
+)
+from core.data_loader import DepartmentDataLoader
+
+
+class TestMeetingTimeParsing(unittest.TestCase):
+
+    def test_parse_days_handles_thursday_token(self):
+        """TTH is Tuesday and Thursday, not Tuesday twice"""
+        # Act
+        mask = parse_days("TTH")
+
+        # Assert
+        self.assertEqual(days_from_mask(mask), ['Tuesday', 'Thursday'])
+
+    def test_parse_days_mwf(self):
+        """MWF maps to Monday, Wednesday, Friday"""
+        self.assertEqual(days_from_mask(parse_days("MWF")), ['Monday', 'Wednesday', 'Friday'])
+
+    def test_parse_time_to_minutes(self):
+        """Times are converted to minutes since midnight"""
+        self.assertEqual(parse_time("11:10AM"), 11 * 60 + 10)
+        self.assertEqual(parse_time("12:00PM"), 12 * 60)
+        self.assertEqual(parse_time("12:15AM"), 15)
+        self.assertEqual(parse_time("01:20PM"), 13 * 60 + 20)
+        self.assertIsNone(parse_time(""))
+
+    def test_parse_meetings_splits_concatenated_patterns(self):
+        """Rows with two meeting patterns produce two meetings"""
+        # Act
+        meetings = parse_meetings("TTHW", "10:30AM01:20PM", "11:50AM02:15PM")
+
+        # Assert
+        self.assertEqual(len(meetings), 2)
+        self.assertEqual(meetings[0], MeetingTime(parse_days("TTH"), 630, 710))
+        self.assertEqual(meetings[1], MeetingTime(parse_days("W"), 800, 855))
+
+    def test_parse_meetings_repeated_day(self):
+        """THTH with two times is two Thursday meetings"""
+        meetings = parse_meetings("THTH", "02:00PM02:00PM", "05:00PM05:00PM")
+        self.assertEqual([m.weekdays() for m in meetings], [['Thursday'], ['Thursday']])
+
+    def test_normalize_offering_without_schedule(self):
+        """Rows without days get an empty meeting list"""
+        offering = normalize_offering({"number": "THR999A", "days": None})
+        self.assertEqual(offering['days_mask'], 0)
+        self.assertEqual(offering['meetings'], [])
+
+
+class TestMeetingIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = MeetingIndex()
+        self.index.add("A", parse_meetings("MW", "10:30AM", "11:50AM"))
+        self.index.add("B", parse_meetings("MW", "11:00AM", "12:20PM"))
+        self.index.add("C", parse_meetings("TTH", "10:30AM", "11:50AM"))
+        self.index.add("D", parse_meetings("MWF", "11:50AM", "12:45PM"))
+        self.index.add("E", parse_meetings("F", "08:00AM", "05:00PM"))
+
+    def test_overlapping_key_finds_same_day_overlaps(self):
+        """Overlap query returns sections sharing a day and time"""
+        self.assertEqual(self.index.overlapping_key("A"), {"B"})
+
+    def test_back_to_back_sections_do_not_overlap(self):
+        """A section ending when another starts is not a conflict"""
+        self.assertNotIn("D", self.index.overlapping_key("A"))
+
+    def test_long_interval_is_found(self):
+        """Long meetings starting well before the query are still found"""
+        self.assertEqual(self.index.overlapping_key("D"), {"B", "E"})
+
+    def test_index_matches_pairwise_scan(self):
+        """Index results agree with a brute force pairwise scan"""
+        for key in "ABCDE":
+            expected = {
+                other for other in "ABCDE" if other != key and any(
+                    m.overlaps(n) for m in self.index.meetings_for(key) for n in self.index.meetings_for(other))
+            }
+            self.assertEqual(self.index.overlapping_key(key), expected)
+
+    def test_find_conflicts_returns_pairs(self):
+        """Conflict check reports each overlapping pair once"""
+        sections = {key: self.index.meetings_for(key) for key in ("A", "B", "C")}
+        self.assertEqual(find_conflicts(sections), [("A", "B")])
+
+
+class TestSemesterOfferingLoading(unittest.TestCase):
+
+    def test_meeting_index_built_from_semester_files(self):
+        """Data loader parses semester rows and indexes them"""
+        # Arrange
+        with tempfile.TemporaryDirectory() as temp_dir:
+            semester_dir = os.path.join(temp_dir, 'semesters', '25_FA')
+            os.makedirs(semester_dir)
+            rows = [
+                {"number": "THR103A", "name": "Intro", "days": "TTH", "start_time": "12:00PM", "end_time": "01:20PM"},
+                {"number": "THR105A", "name": "Theory", "days": "TH", "start_time": "01:00PM", "end_time": "02:00PM"},
+                {"number": "THR199A", "name": "Online", "days": None, "start_time": None, "end_time": None}
+            ]
+            with open(os.path.join(semester_dir, 'THR.json'), 'w') as f:
+                json.dump(rows, f)
+            loader = DepartmentDataLoader(temp_dir)
+
+            # Act
+            offerings = loader.load_semester_offerings('25_FA')
+            index = loader.get_meeting_index('25_FA')
+
+            # Assert
+            self.assertEqual(len(offerings), 3)
+            self.assertEqual(offerings[0]['meetings'][0]['start_minutes'], 720)
+            self.assertEqual(index.overlapping_key("THR103A"), {"THR105A"})
+            self.assertNotIn("THR199A", index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.data_loader import DepartmentDataLoader
+from core.program_mapping import (
+    EXACT, NORMALIZED, TOKENS, ProgramMatcher, department_overviews, normalize_name
+)
+
+
+class TestProgramMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = ProgramMatcher(
+            {'EDU': 'Education', 'THR': 'Theatre', 'FIN': 'Finance'},
+            explicit={'Special Education': 'EDU', 'Theatre Studies and Fine Arts': 'THR'}
+        )
+
+    def test_normalize_drops_degree_words(self):
+        """Degree, format and punctuation noise is removed"""
+        self.assertEqual(normalize_name('M.S. Finance Online (Evening)'), normalize_name('Finance'))
+
+    def test_match_methods_in_order(self):
+        """Exact beats normalized beats token overlap"""
+        # Act
+        matches = self.matcher.match_all([
+            'Special Education',
+            'Master of Science in Special Education Online',
+            'Secondary Education',
+            'Underwater Basket Weaving',
+        ])
+
+        # Assert
+        self.assertEqual(matches['Special Education'].method, EXACT)
+        self.assertEqual(matches['Master of Science in Special Education Online'].method, NORMALIZED)
+        self.assertEqual(matches['Secondary Education'].method, TOKENS)
+        self.assertEqual(matches['Secondary Education'].department, 'EDU')
+        self.assertNotIn('Underwater Basket Weaving', matches)
+
+    def test_department_overviews_prefers_confident_match(self):
+        """A department takes the overview from its most confident program"""
+        # Arrange
+        overviews = {
+            'Secondary Education': {'overview': 'Token match'},
+            'Special Education': {'overview': 'Exact match'},
+            'Finance Online': {'overview': None},
+        }
+
+        # Act
+        chosen = department_overviews(overviews, self.matcher)
+
+        # Assert
+        self.assertEqual(chosen['EDU'][1], 'Exact match')
+        self.assertNotIn('FIN', chosen)
+
+
+class TestLoaderEnrichment(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'departments'))
+        for code, name, mission in (('THR', 'Theatre', None), ('ACC', 'Accounting', 'Own mission')):
+            with open(os.path.join(self.temp_dir, 'departments', f'{code}.json'), 'w') as f:
+                json.dump({'name': name, 'mission_statement': mission, 'courses': []}, f)
+        with open(os.path.join(self.temp_dir, 'program_overviews.json'), 'w') as f:
+            json.dump({
+                'Theatre Studies and Fine Arts': {'url': 'u1', 'overview': 'Stage work.'},
+                'Accounting': {'url': 'u2', 'overview': 'Ledger work.'},
+            }, f)
+        self.loader = DepartmentDataLoader(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_missing_mission_statement_is_filled(self):
+        """Departments without a mission statement borrow the program overview"""
+        self.assertEqual(self.loader.load_department('THR').mission_statement, 'Stage work.')
+        self.assertEqual(self.loader.get_department_summary('THR')['mission_statement'], 'Stage work.')
+
+    def test_existing_mission_statement_wins(self):
+        """A stored mission statement is never replaced"""
+        self.assertEqual(self.loader.load_department('ACC').mission_statement, 'Own mission')
+
+    def test_mapping_reflects_overview_changes(self):
+        """Editing the overviews file rebuilds the mapping"""
+        # Arrange
+        self.loader.load_department('THR')
+        path = os.path.join(self.temp_dir, 'program_overviews.json')
+        with open(path, 'w') as f:
+            json.dump({'Theatre Studies and Fine Arts': {'url': 'u1', 'overview': 'New stage work.'}}, f)
+        os.utime(path, ns=(1, 1))
+
+        # Act
+        department = self.loader.load_department('THR')
+
+        # Assert
+        self.assertEqual(department.mission_statement, 'New stage work.')
+
+
+if __name__ == '__main__':
+    unittest.main()
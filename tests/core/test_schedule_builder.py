@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.schedule_builder import find_schedules, meetings_mask, build_components
+from core.meeting_time import parse_meetings
+
+
+def section(number, days, start, end):
+    return {"number": number, "days": days, "start_time": start, "end_time": end}
+
+
+class TestScheduleBuilder(unittest.TestCase):
+
+    def test_masks_conflict_only_when_times_intersect(self):
+        """Minute-of-week masks share bits only for real overlaps"""
+        # Arrange
+        a = meetings_mask(parse_meetings("MW", "10:30AM", "11:50AM"))
+        b = meetings_mask(parse_meetings("MW", "11:50AM", "01:10PM"))
+        c = meetings_mask(parse_meetings("M", "11:49AM", "12:00PM"))
+
+        # Assert
+        self.assertEqual(a & b, 0)
+        self.assertNotEqual(a & c, 0)
+
+    def test_finds_only_conflict_free_combinations(self):
+        """Every returned schedule is free of conflicts"""
+        # Arrange
+        course_sections = {
+            "ENG 110": [
+                section("ENG110A", "MW", "10:30AM", "11:50AM"),
+                section("ENG110B", "TTH", "10:30AM", "11:50AM"),
+            ],
+            "THR 103": [
+                section("THR103A", "TTH", "10:30AM", "11:50AM"),
+            ],
+        }
+
+        # Act
+        result = find_schedules(course_sections)
+
+        # Assert
+        numbers = [[s["number"] for s in schedule] for schedule in result["schedules"]]
+        self.assertEqual(len(numbers), 1)
+        self.assertCountEqual(numbers[0], ["ENG110A", "THR103A"])
+        self.assertIsNone(result["truncated"])
+
+    def test_lab_component_is_required_separately(self):
+        """Lecture and lab sections of one course are both scheduled"""
+        # Arrange
+        course_sections = {
+            "BIO 101": [
+                section("BIO101A", "MWF", "09:00AM", "09:50AM"),
+                section("BIO101LA", "T", "01:00PM", "03:50PM"),
+                section("BIO101LB", "TH", "01:00PM", "03:50PM"),
+            ],
+        }
+
+        # Act
+        components = build_components(course_sections)
+        result = find_schedules(course_sections)
+
+        # Assert
+        self.assertEqual(len(components), 2)
+        self.assertEqual(len(result["schedules"]), 2)
+        for schedule in result["schedules"]:
+            self.assertEqual(len(schedule), 2)
+
+    def test_identical_time_sections_share_one_option(self):
+        """Sections at the same times are searched once and expanded"""
+        # Arrange
+        course_sections = {
+            "ENG 110": [section(f"ENG110{letter}", "MW", "09:00AM", "10:20AM") for letter in "ABCDEF"],
+        }
+
+        # Act
+        components = build_components(course_sections)
+        result = find_schedules(course_sections)
+
+        # Assert
+        self.assertEqual(len(components[0].options), 1)
+        self.assertEqual(len(result["schedules"]), 6)
+
+    def test_max_results_cap(self):
+        """Search stops once the result cap is reached"""
+        # Arrange
+        course_sections = {
+            "ENG 110": [section(f"ENG110{letter}", "MW", "09:00AM", "10:20AM") for letter in "ABCDEF"],
+            "THR 103": [section(f"THR103{letter}", "TTH", "09:00AM", "10:20AM") for letter in "ABCDEF"],
+        }
+
+        # Act
+        result = find_schedules(course_sections, max_results=5)
+
+        # Assert
+        self.assertEqual(len(result["schedules"]), 5)
+        self.assertEqual(result["truncated"], "max_results")
+
+    def test_truncation_at_exact_cap(self):
+        """Hitting the cap is truncation only when more schedules exist"""
+        # Arrange: after the second schedule a branch still looks feasible but has no solution
+        def course_sections():
+            return {
+                "ENG 110": [
+                    section("ENG110A", "TTH", "09:00AM", "10:20AM"),
+                    section("ENG110B", "MW", "11:30AM", "12:50PM"),
+                ],
+                "THR 103": [
+                    section("THR103A", "MWF", "10:00AM", "11:20AM"),
+                    section("THR103B", "MW", "11:30AM", "12:50PM"),
+                ],
+                "ACC 111": [
+                    section("ACC111A", "MW", "10:00AM", "11:20AM"),
+                    section("ACC111B", "MWF", "09:00AM", "10:20AM"),
+                ],
+            }
+
+        # Act
+        exact = find_schedules(course_sections(), max_results=2)
+        short = find_schedules(course_sections(), max_results=1)
+
+        # Assert
+        self.assertEqual(len(exact["schedules"]), 2)
+        self.assertIsNone(exact["truncated"])
+        self.assertEqual(len(short["schedules"]), 1)
+        self.assertEqual(short["truncated"], "max_results")
+
+    def test_impossible_request_returns_no_schedules(self):
+        """Two courses at the same single time have no solution"""
+        # Arrange
+        course_sections = {
+            "ENG 110": [section("ENG110A", "MW", "09:00AM", "10:20AM")],
+            "THR 103": [section("THR103A", "W", "10:00AM", "11:00AM")],
+        }
+
+        # Act
+        result = find_schedules(course_sections)
+
+        # Assert
+        self.assertEqual(result["schedules"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
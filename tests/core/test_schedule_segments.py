@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+import unittest
+import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import arrow
+from api import create_app
+from core.calendar_model import SemesterCalendar
+from core.schedule_generator import (
+    ScheduleSegment, merge_segment_meetings, schedule, schedule_segments, sorted_classes
+)
+
+D = datetime.date
+
+
+class TestScheduleSegments(unittest.TestCase):
+
+    def setUp(self):
+        self.first_days = [arrow.get('2025-09-01')]
+        self.last_days = [arrow.get('2025-10-31')]
+        self.no_classes = [arrow.get('2025-10-13'), arrow.get('2025-10-14')]
+        self.events = [
+            {'name': 'Labor Day', 'date': arrow.get('2025-09-01'), 'date_range': [], 'type': 'holiday'},
+            {'name': 'Fall Break', 'date': None,
+             'date_range': [arrow.get('2025-10-13'), arrow.get('2025-10-14')], 'type': 'break'},
+            {'name': 'Mid-term Grades Due', 'date': arrow.get('2025-10-20'), 'date_range': [], 'type': 'academic'},
+        ]
+        self.calendar = SemesterCalendar.from_registrar_table(
+            self.first_days, self.last_days, self.no_classes, self.events
+        )
+
+    def test_merge_orders_and_groups_days(self):
+        """Segments merge into one date-ordered stream; shared days list every segment"""
+        # Arrange
+        segments = [
+            ScheduleSegment(('Monday', 'Wednesday'), None, None, 'Lecture'),
+            ScheduleSegment(('Monday',), D(2025, 9, 8), D(2025, 9, 15), 'Lab'),
+        ]
+
+        # Act
+        meetings = list(merge_segment_meetings(segments, D(2025, 9, 1), D(2025, 9, 15)))
+
+        # Assert
+        self.assertEqual(meetings, [
+            (D(2025, 9, 1), [0]), (D(2025, 9, 3), [0]), (D(2025, 9, 8), [0, 1]),
+            (D(2025, 9, 10), [0]), (D(2025, 9, 15), [0, 1]),
+        ])
+
+    def test_segments_are_clipped_to_the_semester(self):
+        """Half-semester segments never run past the semester's first or last day"""
+        segments = [ScheduleSegment(('Friday',), D(2025, 10, 20), D(2025, 12, 31), None)]
+
+        days = [day for day, _ in merge_segment_meetings(segments, D(2025, 9, 1), D(2025, 10, 31))]
+
+        self.assertEqual(days, [D(2025, 10, 24), D(2025, 10, 31)])
+
+    def test_single_segment_matches_weekday_schedule(self):
+        """One full-semester segment gives the same lines as the weekday schedule"""
+        # Arrange
+        weekdays = ['Monday', 'Tuesday', 'Thursday']
+        possible_classes, no_classes = sorted_classes(weekdays, self.first_days, self.last_days, self.no_classes)
+
+        # Act
+        expected = schedule(possible_classes, no_classes, show_no=True, events=self.events)
+        actual = schedule_segments(self.calendar, [ScheduleSegment(tuple(weekdays), None, None, None)], show_no=True)
+
+        # Assert
+        self.assertEqual(actual, expected)
+
+    def test_labels_and_annotations(self):
+        """Labelled meetings keep the calendar's no-class and event notes"""
+        # Arrange
+        segments = [
+            ScheduleSegment(('Monday',), None, None, 'Lecture'),
+            ScheduleSegment(('Monday',), D(2025, 10, 1), None, 'Lab'),
+        ]
+
+        # Act
+        lines = schedule_segments(self.calendar, segments, show_no=True, fmt='YYYY-MM-DD', show_events=False)
+
+        # Assert
+        self.assertEqual(lines[0], '2025-09-01 [Lecture] - NO CLASS (Labor Day)')
+        self.assertIn('2025-10-13 [Lecture, Lab] - NO CLASS (Fall Break)', lines)
+        self.assertIn('2025-10-20 [Lecture, Lab]', lines)
+
+
+class TestGenerateScheduleSegments(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app('testing').test_client()
+
+    def test_segments_request(self):
+        """The endpoint accepts several meeting patterns"""
+        # Act
+        response = self.client.post('/api/generate-schedule', json={
+            'semester_year': '25_FA',
+            'date_format': '2016-01-12',
+            'segments': [
+                {'weekdays': ['Monday', 'Wednesday'], 'label': 'Lecture'},
+                {'weekdays': ['Thursday'], 'start': '2025-10-01', 'end': '2025-10-31', 'label': 'Lab'}
+            ]
+        })
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        labs = [line for line in data['schedule'] if '[Lab]' in line]
+        self.assertEqual(len(labs), 5)
+        self.assertTrue(all(line.startswith('2025-10-') for line in labs))
+        self.assertEqual(data['schedule'], sorted(data['schedule']))
+        self.assertEqual(data['weekdays'], ['Monday', 'Wednesday', 'Thursday'])
+
+    def test_invalid_segment_is_rejected(self):
+        """Segments with impossible dates fail validation"""
+        response = self.client.post('/api/generate-schedule', json={
+            'semester_year': '25_FA',
+            'segments': [{'weekdays': ['Monday'], 'start': '2025-10-31', 'end': '2025-10-01'}]
+        })
+
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.search_index import SearchIndex, stem, analyze
+from core.data_loader import DepartmentDataLoader
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Create department and program overview files"""
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'departments'))
+        self.write_department('THR', {
+            "name": "Theater Arts",
+            "mission_statement": "Preparing students for careers in professional theatre.",
+            "courses": [
+                {"number": "101", "title": "Introduction to Acting", "description": "Basic acting techniques and scene study."},
+                {"number": "220", "title": "Stage Lighting", "description": "Design and operation of lighting for the stage."}
+            ]
+        })
+        self.write_department('ACC', {
+            "name": "Accounting",
+            "mission_statement": "Accounting principles for business.",
+            "courses": [
+                {"number": "111", "title": "Financial Accounting", "description": "Preparation of financial statements."}
+            ]
+        })
+        self.programs_path = os.path.join(self.temp_dir, 'program_overviews.json')
+        with open(self.programs_path, 'w') as f:
+            json.dump({"Nursing": {"url": "https://example.edu/nursing/", "overview": "Clinical nursing practice."}}, f)
+
+        self.index = SearchIndex(DepartmentDataLoader(self.temp_dir), self.programs_path).build()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def write_department(self, code, data):
+        path = os.path.join(self.temp_dir, 'departments', f"{code}.json")
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        # Make sure mtime-based change detection sees a new signature
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_stemming_groups_word_forms(self):
+        """Different forms of a word share a stem"""
+        self.assertEqual(stem("accounting"), stem("accounts"))
+        self.assertEqual(analyze("The Lighting"), ["light"])
+
+    def test_indexes_courses_departments_and_programs(self):
+        """Every source is indexed"""
+        self.assertEqual(len(self.index), 6)
+
+    def test_search_ranks_title_matches_first(self):
+        """Title matches outrank description matches"""
+        # Act
+        results = self.index.search("acting", prefix=False)
+
+        # Assert
+        self.assertEqual(results[0]['id'], 'course:THR 101')
+
+    def test_search_matches_stemmed_terms(self):
+        """Queries match stemmed forms in descriptions"""
+        results = self.index.search("statement", prefix=False)
+        self.assertEqual([r['id'] for r in results], ['course:ACC 111'])
+
+    def test_prefix_matching_for_typeahead(self):
+        """The last token is matched as a prefix"""
+        results = self.index.search("nurs")
+        self.assertEqual(results[0]['id'], 'program:Nursing')
+
+    def test_type_filter(self):
+        """Results can be limited to a document type"""
+        results = self.index.search("accounting", doc_type='department')
+        self.assertEqual([r['id'] for r in results], ['department:ACC'])
+
+    def test_refresh_reindexes_only_changed_department(self):
+        """Changing one department file re-indexes only that department"""
+        # Arrange
+        self.write_department('ACC', {
+            "name": "Accounting",
+            "mission_statement": "Auditing and taxation.",
+            "courses": []
+        })
+
+        # Act
+        changed = self.index.refresh(force=True)
+
+        # Assert
+        self.assertEqual(changed, ['department:ACC'])
+        self.assertEqual(self.index.search("statements", prefix=False), [])
+        self.assertEqual(self.index.search("auditing")[0]['id'], 'department:ACC')
+
+    def test_search_during_reindexing(self):
+        """Queries running while another thread re-indexes see whole documents"""
+        # Arrange
+        errors = []
+        stop = threading.Event()
+
+        def reindex():
+            while not stop.is_set():
+                for number in range(50):
+                    self.index.add_document(f"course:THR {number}", "Stage Lighting", "Stage work.", type='course')
+                for number in range(50):
+                    self.index.remove_document(f"course:THR {number}")
+
+        worker = threading.Thread(target=reindex)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        worker.start()
+
+        # Act
+        try:
+            for _ in range(1000):
+                try:
+                    self.index.search("stage li")
+                except Exception as e:
+                    errors.append(e)
+        finally:
+            stop.set()
+            worker.join()
+            sys.setswitchinterval(interval)
+
+        # Assert
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
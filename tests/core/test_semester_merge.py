@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.semester_merge import merge_sections, PRESERVE, SCRAPE
+
+
+class TestMergeSections(unittest.TestCase):
+
+    def setUp(self):
+        self.existing = [
+            {"number": "THR103A", "name": "Intro", "days": "MW", "availability": "10",
+             "description": "Hand written", "room": "Leary 101"},
+            {"number": "THR999", "name": "Special Topics"}
+        ]
+        self.scraped = [
+            {"number": "THR103A", "name": "Intro", "days": "TTH", "availability": "8"},
+            {"number": "THR220A", "name": "Lighting", "days": "F", "availability": "12"}
+        ]
+
+    def test_report_lists_added_removed_changed(self):
+        """Report captures each kind of difference"""
+        # Act
+        _, report = merge_sections(self.existing, self.scraped)
+
+        # Assert
+        self.assertEqual(report.added, ['THR220A'])
+        self.assertEqual(report.removed, ['THR999'])
+        self.assertEqual(report.changed, {'THR103A': {'days': ['MW', 'TTH'], 'availability': ['10', '8']}})
+
+    def test_scraped_fields_replace_and_manual_fields_survive(self):
+        """Schedule fields come from the scrape; other stored fields are kept"""
+        # Act
+        merged, _ = merge_sections(self.existing, self.scraped)
+
+        # Assert
+        section = merged[0]
+        self.assertEqual(section['days'], 'TTH')
+        self.assertEqual(section['description'], 'Hand written')
+        self.assertEqual(section['room'], 'Leary 101')
+        self.assertEqual([row['number'] for row in merged], ['THR103A', 'THR220A', 'THR999'])
+
+    def test_policy_override_preserves_manual_edit(self):
+        """A field switched to PRESERVE keeps the stored value"""
+        # Act
+        merged, report = merge_sections(self.existing, self.scraped, policies={'days': PRESERVE})
+
+        # Assert
+        self.assertEqual(merged[0]['days'], 'MW')
+        self.assertNotIn('days', report.changed['THR103A'])
+
+    def test_policy_override_scrapes_manual_field(self):
+        """A field switched to SCRAPE takes the scraped value"""
+        scraped = [{"number": "THR103A", "description": "From catalog"}]
+        merged, _ = merge_sections(self.existing, scraped, policies={'description': SCRAPE})
+        self.assertEqual(merged[0]['description'], 'From catalog')
+
+    def test_drop_missing(self):
+        """keep_missing=False leaves out sections absent from the scrape"""
+        merged, report = merge_sections(self.existing, self.scraped, keep_missing=False)
+        self.assertEqual([row['number'] for row in merged], ['THR103A', 'THR220A'])
+        self.assertEqual(report.removed, ['THR999'])
+
+    def test_identical_scrape_has_no_changes(self):
+        """Re-merging the same rows reports no additions or changes"""
+        # Arrange
+        merged, _ = merge_sections(self.existing, self.scraped)
+
+        # Act
+        _, report = merge_sections(merged, self.scraped)
+
+        # Assert
+        self.assertEqual(report.added, [])
+        self.assertEqual(report.changed, {})
+        self.assertEqual(report.unchanged, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
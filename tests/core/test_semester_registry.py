@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.semester_registry import SemesterRegistry, get_semester_registry
+from api.services.course_service import CourseService
+
+
+class TestSemesterRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.temp_dir, 'data')
+        self.calendars_dir = os.path.join(self.temp_dir, 'calendars')
+        for semester in ('25_FA', '24_FA', '25_SP'):
+            os.makedirs(os.path.join(self.data_dir, 'semesters', semester))
+        os.makedirs(self.calendars_dir)
+        for filename in ('spring_2026.json', 'fall_2025.json', 'active_semester.json'):
+            self.write_calendar(filename, {'available_semesters': ['fall_2025']})
+        self.registry = SemesterRegistry(self.data_dir, self.calendars_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_calendar(self, filename, data):
+        with open(os.path.join(self.calendars_dir, filename), 'w') as f:
+            json.dump(data, f)
+
+    def test_listings(self):
+        """Semester folders sort chronologically; calendars exclude the active config"""
+        self.assertEqual(self.registry.semester_codes(), ['24_FA', '25_SP', '25_FA'])
+        self.assertEqual(self.registry.calendar_files(), ['fall_2025.json', 'spring_2026.json'])
+        self.assertEqual(self.registry.active_config(), {'available_semesters': ['fall_2025']})
+
+    def test_unchanged_directories_are_not_listed_again(self):
+        """Repeated lookups only stat the directory"""
+        # Arrange
+        self.registry.semester_codes()
+
+        # Act
+        with patch('core.semester_registry.os.scandir') as mock_scandir:
+            codes = self.registry.semester_codes()
+
+        # Assert
+        mock_scandir.assert_not_called()
+        self.assertEqual(codes, ['24_FA', '25_SP', '25_FA'])
+
+    def test_new_entries_are_picked_up(self):
+        """Adding a semester folder or calendar file shows up on the next lookup"""
+        # Arrange
+        self.registry.semester_codes()
+        self.registry.calendar_files()
+
+        # Act
+        os.makedirs(os.path.join(self.data_dir, 'semesters', '26_SP'))
+        self.write_calendar('fall_2026.json', {})
+
+        # Assert
+        self.assertEqual(self.registry.semester_codes()[-1], '26_SP')
+        self.assertIn('fall_2026.json', self.registry.calendar_files())
+
+    def test_missing_directories_are_empty(self):
+        """A registry over missing directories lists nothing"""
+        registry = SemesterRegistry(os.path.join(self.temp_dir, 'nope'), os.path.join(self.temp_dir, 'none'))
+
+        self.assertEqual(registry.semester_codes(), [])
+        self.assertEqual(registry.calendar_files(), [])
+        self.assertIsNone(registry.active_config())
+
+    def test_services_share_one_registry(self):
+        """Callers with the same directories read from the same registry"""
+        # Act
+        registry = get_semester_registry(self.data_dir)
+        semesters = CourseService(None, self.data_dir).get_available_semesters()
+
+        # Assert
+        self.assertIs(registry, get_semester_registry(self.data_dir + os.sep))
+        self.assertEqual(semesters, ['24_FA', '25_FA', '25_SP'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+import unittest
+import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from pdf.date_tokens import (
+    KEYWORD, MONTH_DAY, RANGE, SEMESTER, YEAR, token_dates, tokenize, tokenize_line
+)
+from pdf.semester_parser import column_keywords
+
+
+class TestDateTokenizer(unittest.TestCase):
+
+    def test_token_kinds_and_positions(self):
+        """One scan yields typed tokens with their offsets in the line"""
+        # Arrange
+        line = 'FALL 2025 Summer Conferral Date Fri, Aug 22 2025 Oct 13-14 Fall Break'
+
+        # Act
+        tokens = tokenize_line(line)
+
+        # Assert
+        self.assertEqual([token.kind for token in tokens], [SEMESTER, MONTH_DAY, YEAR, RANGE, KEYWORD])
+        self.assertEqual((tokens[0].name, tokens[0].year), ('fall', 2025))
+        self.assertEqual((tokens[1].month, tokens[1].day), (8, 22))
+        self.assertEqual(line[tokens[3].start:tokens[3].end], 'Oct 13-14')
+        self.assertEqual(tokens[4].name, 'break')
+
+    def test_cross_month_range_and_explicit_year(self):
+        """Ranges may span months and carry their own year"""
+        # Act
+        spanning, dated = tokenize_line('April 28-May 2 November 28-29, 2024')
+
+        # Assert
+        self.assertEqual(token_dates(spanning, 2025)[-1], datetime.date(2025, 5, 2))
+        self.assertEqual(len(token_dates(spanning, 2025)), 5)
+        self.assertEqual(token_dates(dated), [datetime.date(2024, 11, 28), datetime.date(2024, 11, 29)])
+
+    def test_words_that_start_like_months_are_ignored(self):
+        """Only month names followed by a day become dates"""
+        tokens = tokenize_line('Marketing 3 Decent 5 may 2025')
+
+        self.assertEqual([token.kind for token in tokens], [YEAR])
+
+    def test_invalid_day_has_no_dates(self):
+        """A day past the end of the month yields no dates"""
+        token, = tokenize_line('February 30')
+
+        self.assertEqual(token_dates(token, 2025), [])
+
+    def test_document_tokens_are_shared(self):
+        """Tokenizing the same text twice reuses the first scan"""
+        text = 'August 26\nClasses Begin'
+
+        self.assertIs(tokenize(text), tokenize(text))
+        self.assertEqual(len(tokenize(text)[0].dates), 1)
+
+    def test_label_line_keywords_follow_columns(self):
+        """Keywords on the label line are assigned to the date above them"""
+        # Arrange
+        lines = tokenize('November 27-29 March 10-14\nThanksgiving Break Final Examinations')
+
+        # Act
+        dates, keywords = column_keywords(lines[0], lines[1])
+
+        # Assert
+        self.assertEqual([token.text for token in dates], ['November 27-29', 'March 10-14'])
+        self.assertEqual(keywords, [{'break'}, {'exam'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+import unittest
+import datetime
+import os
+import re
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from pdf.pdf_extractor import PDFExtractionCache
+from pdf.layout import analyze_document, month_number
+from pdf.semester_parser import extract_semester_dates_from_layout
+from pdf.event_parser import extract_semester_events_from_layout
+
+CALENDAR_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'niagara', '2025-2026-academic-calendar.pdf')
+
+
+class TestCalendarLayout(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.layout = analyze_document(PDFExtractionCache().extract(CALENDAR_PDF))
+
+    def test_month_number(self):
+        """Full and abbreviated month names resolve, other words do not"""
+        self.assertEqual(month_number('October'), 10)
+        self.assertEqual(month_number('Oct.'), 10)
+        self.assertIsNone(month_number('Mon'))
+        self.assertIsNone(month_number('Ma'))
+
+    def test_semester_columns_found(self):
+        """Fall and spring columns are identified from their headings"""
+        self.assertEqual(self.layout.columns(), ['fall_2025', 'spring_2026'])
+
+    def test_date_range_row(self):
+        """A ranged date keeps its label and the weekday line under it"""
+        # Act
+        entries = self.layout.find('fall', 2025, 'Fall Break')
+
+        # Assert
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].label, "Indigenous People's Day/Fall Break")
+        self.assertEqual(entries[0].weekday, 'Mon-Tues')
+        self.assertEqual(entries[0].dates(), [datetime.date(2025, 10, 13), datetime.date(2025, 10, 14)])
+
+    def test_wrapped_label_not_merged_into_weekday(self):
+        """A label continuation sharing the weekday line stays in the label"""
+        # Act
+        entries = self.layout.find('fall', 2025, 'Restricted Drop Add Ends')
+
+        # Assert
+        self.assertEqual(entries[0].label, 'Restricted Drop Add Ends/Last Day to Drop without a W')
+        self.assertEqual(entries[0].weekday, 'Friday')
+
+    def test_labels_are_not_dates(self):
+        """No label is a bare date or year from a neighbouring column"""
+        for entry in self.layout.entries:
+            self.assertTrue(entry.label)
+            self.assertNotRegex(entry.label, r'^([A-Za-z]+ \d{1,2}|\d{4})$')
+
+    def test_semester_dates_from_layout(self):
+        """First day, last day and no-class dates come from the fall column"""
+        # Act
+        first_days, last_days, no_classes = extract_semester_dates_from_layout(self.layout, 'fall', 2025)
+
+        # Assert
+        self.assertEqual(first_days[0].date(), datetime.date(2025, 8, 25))
+        self.assertEqual(last_days[0].date(), datetime.date(2025, 12, 11))
+        self.assertIn(datetime.date(2025, 10, 13), [day.date() for day in no_classes])
+
+    def test_missing_column_returns_none(self):
+        """Parsers report a missing column so callers fall back to text parsing"""
+        self.assertIsNone(extract_semester_dates_from_layout(self.layout, 'summer', 2026))
+        self.assertIsNone(extract_semester_events_from_layout(self.layout, 'summer', 2026))
+
+    def test_events_have_no_garbage_names(self):
+        """Event names are labels, never date fragments"""
+        # Act
+        events = extract_semester_events_from_layout(self.layout, 'spring', 2026)
+
+        # Assert
+        self.assertTrue(events)
+        self.assertFalse([e for e in events if re.match(r'^([A-Za-z]+ \d{1,2}|\d{4})$', e['name'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+import pdfplumber
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from pdf.pdf_extractor import PDFExtractionCache, extract_pages, extract_text_until
+
+CALENDAR_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            'niagara', '2025-2026-academic-calendar.pdf')
+
+
+def write_text_pdf(path, page_texts):
+    """Write a minimal PDF with one line of Helvetica text per page"""
+    count = len(page_texts)
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [%s] /Count %d >>' % (' '.join(f'{4 + 2 * i} 0 R' for i in range(count)), count),
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>')
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+    data = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f'{number} 0 obj\n{body}\nendobj\n'.encode()
+    xref = len(data)
+    data += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    data += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode()
+    data += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+class TestPDFExtractionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = PDFExtractionCache(os.path.join(self.temp_dir, '.pdf_cache'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_text_matches_page_by_page_extraction(self):
+        """Cached text is identical to joining pdfplumber page texts"""
+        # Arrange
+        with pdfplumber.open(CALENDAR_PDF) as pdf:
+            expected = "".join(page.extract_text() + "\n" for page in pdf.pages if page.extract_text())
+
+        # Act
+        document = self.cache.extract(CALENDAR_PDF)
+
+        # Assert
+        self.assertEqual(document.text, expected)
+        self.assertTrue(document.pages[0].words)
+
+    def test_same_content_is_extracted_once(self):
+        """A copy of the same PDF under another name reuses the extraction"""
+        # Arrange
+        copy_path = os.path.join(self.temp_dir, 'copy.pdf')
+        shutil.copy(CALENDAR_PDF, copy_path)
+        self.cache.extract(CALENDAR_PDF)
+
+        # Act
+        with patch('pdf.pdf_extractor.pdfplumber.open') as mock_open:
+            document = self.cache.extract(copy_path)
+
+        # Assert
+        mock_open.assert_not_called()
+        self.assertTrue(document.text)
+
+    def test_disk_cache_survives_new_instance(self):
+        """A new cache over the same directory loads pages without pdfplumber"""
+        # Arrange
+        first = self.cache.extract(CALENDAR_PDF)
+
+        # Act
+        with patch('pdf.pdf_extractor.pdfplumber.open') as mock_open:
+            second = PDFExtractionCache(self.cache.cache_dir).extract(CALENDAR_PDF)
+
+        # Assert
+        mock_open.assert_not_called()
+        self.assertEqual(second.text, first.text)
+        self.assertEqual(second.pages[0].words, first.pages[0].words)
+
+
+class TestParallelExtraction(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_path = os.path.join(self.temp_dir, 'calendar.pdf')
+        self.page_texts = ['August 25 Classes Begin', 'October 13 Fall Break',
+                           'December 12 Last Day', 'January 20 Spring Classes Begin', 'May 8 Commencement']
+        write_text_pdf(self.pdf_path, self.page_texts)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_process_pool_keeps_page_order(self):
+        """Pages split across workers come back in document order"""
+        # Act
+        pages = extract_pages(self.pdf_path, processes=2)
+
+        # Assert
+        self.assertEqual([page.number for page in pages], [1, 2, 3, 4, 5])
+        self.assertEqual([page.text for page in pages], self.page_texts)
+        self.assertEqual([page.words for page in pages], [page.words for page in extract_pages(self.pdf_path)])
+
+    def test_lazy_extraction_stops_early(self):
+        """Only the pages needed to satisfy the caller are read"""
+        # Act
+        text = extract_text_until(self.pdf_path, lambda text: 'Last Day' in text, PDFExtractionCache())
+
+        # Assert
+        self.assertIn('December 12', text)
+        self.assertNotIn('January 20', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+"""
+Tests for concurrent course description scraping
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from utilities.http_transport import FetchResult
+from utilities.scrape_descriptions import CourseDescriptionScraper, parse_department_html
+
+CATALOG_PAGE = '''
+<html><body>
+<div class="courseblock">{dept} 101 - Introduction to the Field. A survey of core ideas and methods in the discipline.</div>
+<div class="courseblock">{dept} 205 - Intermediate Studies. Builds on the introduction with applied projects.</div>
+</body></html>
+'''
+
+
+class FakeTransport:
+    """Serves catalog pages from memory and records requested URLs"""
+
+    max_workers = 3
+
+    def __init__(self, failing=(), empty=()):
+        self.failing = set(failing)
+        self.empty = set(empty)
+        self.requested = []
+        self.committed = []
+        self.lock = threading.Lock()
+
+    def get(self, url, commit=True):
+        with self.lock:
+            self.requested.append(url)
+        dept = url.rstrip('/').rsplit('/', 1)[-1].upper()
+        if dept in self.failing:
+            raise requests.ConnectionError(f"unreachable: {url}")
+        return FetchResult(url, 200, '' if dept in self.empty else CATALOG_PAGE.format(dept=dept))
+
+    def commit(self, result):
+        with self.lock:
+            self.committed.append(result.url.rstrip('/').rsplit('/', 1)[-1].upper())
+
+
+class TestCourseDescriptionScraper(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'departments'))
+        for code in ('THR', 'ACC', 'ENG'):
+            self.write_department(code, f"https://catalog.example.edu/courses-az/{code.lower()}/")
+        self.write_department('NOU', None)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def write_department(self, code, url):
+        with open(os.path.join(self.temp_dir, 'departments', f"{code}.json"), 'w') as f:
+            json.dump({"name": f"{code} Department", "course_descriptions_url": url, "courses": []}, f)
+
+    def load_courses(self, code):
+        with open(os.path.join(self.temp_dir, 'departments', f"{code}.json")) as f:
+            return [course['number'] for course in json.load(f)['courses']]
+
+    def test_parse_department_html(self):
+        """Top-level parse function returns courses for the department"""
+        courses = parse_department_html(CATALOG_PAGE.format(dept='THR'), 'THR')
+        self.assertEqual([course.number for course in courses], ['101', '205'])
+
+    def test_scrape_all_departments_inline_parsing(self):
+        """Every department with a URL is fetched once and saved"""
+        # Arrange
+        transport = FakeTransport()
+        scraper = CourseDescriptionScraper(self.temp_dir, transport=transport)
+
+        # Act
+        with patch('builtins.print'):
+            scraper.scrape_all_departments(parse_processes=0)
+
+        # Assert
+        self.assertEqual(len(transport.requested), 3)
+        for code in ('THR', 'ACC', 'ENG'):
+            self.assertEqual(self.load_courses(code), ['101', '205'])
+        self.assertEqual(self.load_courses('NOU'), [])
+
+    def test_scrape_all_departments_process_pool(self):
+        """Parsing in a process pool gives the same result"""
+        # Arrange
+        scraper = CourseDescriptionScraper(self.temp_dir, transport=FakeTransport())
+
+        # Act
+        with patch('builtins.print'):
+            scraper.scrape_all_departments(workers=2, parse_processes=1)
+
+        # Assert
+        self.assertEqual(self.load_courses('ACC'), ['101', '205'])
+
+    def test_fetch_errors_do_not_stop_other_departments(self):
+        """A failing department is reported and the rest still complete"""
+        # Arrange
+        scraper = CourseDescriptionScraper(self.temp_dir, transport=FakeTransport(failing={'ACC'}))
+
+        # Act
+        with patch('builtins.print') as mock_print:
+            scraper.scrape_all_departments(parse_processes=0)
+
+        # Assert
+        self.assertEqual(self.load_courses('ACC'), [])
+        self.assertEqual(self.load_courses('THR'), ['101', '205'])
+        mock_print.assert_any_call("Scraping complete! Successfully processed 2/4 departments")
+
+    def test_saved_departments_keep_stored_mission_statement(self):
+        """Overview text borrowed at load time is never written into department files"""
+        # Arrange
+        with open(os.path.join(self.temp_dir, 'program_overviews.json'), 'w') as f:
+            json.dump({"THR Department": {"url": "https://example.edu/thr/", "overview": "Derived overview."}}, f)
+        scraper = CourseDescriptionScraper(self.temp_dir, transport=FakeTransport())
+
+        # Act
+        with patch('builtins.print'):
+            scraper.scrape_department_courses('THR')
+
+        # Assert
+        with open(os.path.join(self.temp_dir, 'departments', 'THR.json')) as f:
+            saved = json.load(f)
+        self.assertEqual(self.load_courses('THR'), ['101', '205'])
+        self.assertFalse(saved.get('mission_statement'))
+        self.assertEqual(scraper.data_loader.load_department('THR').mission_statement, 'Derived overview.')
+
+    def test_pages_are_cached_only_after_saving(self):
+        """A catalog page that yields nothing is not cached, so the next run retries it"""
+        # Arrange
+        transport = FakeTransport(empty={'ENG'})
+        scraper = CourseDescriptionScraper(self.temp_dir, transport=transport)
+
+        # Act
+        with patch('builtins.print'):
+            scraper.scrape_all_departments(parse_processes=0)
+
+        # Assert
+        self.assertCountEqual(transport.committed, ['THR', 'ACC'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+
+"""
+Tests for the on-disk HTTP cache and conditional fetching
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from utilities.http_cache import HTTPCache
+from utilities.http_transport import ScrapeTransport
+from utilities.course_scraper import CourseScraperCLI
+
+COURSE_ROW = (
+    '<tr class="available"><td>ACC101A</td><td>Intro</td><td>In Person</td><td>MWF</td>'
+    '<td>9:00AM</td><td>9:50AM</td><td></td><td>Open</td><td>3</td></tr>'
+)
+
+
+class ConditionalHandler(BaseHTTPRequestHandler):
+    """Serves server.body; answers 304 when If-None-Match matches and ETags are on"""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get('If-None-Match')))
+        etag = f'"{len(server.body)}-{server.version}"'
+        if server.use_etag and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = server.body.encode()
+        self.send_response(200)
+        if server.use_etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestConditionalFetching(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ConditionalHandler)
+        self.server.requests = []
+        self.server.body = f'<table>{COURSE_ROW}</table>'
+        self.server.version = 1
+        self.server.use_etag = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = HTTPCache(os.path.join(self.temp_dir, '.http_cache'))
+        self.transport = ScrapeTransport(rate_limit=0, backoff_factor=0, cache=self.cache)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_first_fetch_populates_cache(self):
+        """A first fetch is a full download stored with its ETag"""
+        # Act
+        result = self.transport.get(f"{self.base}/page")
+
+        # Assert
+        self.assertFalse(result.unchanged)
+        self.assertEqual(self.cache.get(f"{self.base}/page").etag, '"%d-1"' % len(self.server.body))
+
+    def test_uncommitted_fetch_is_not_cached(self):
+        """With commit=False a body counts as seen only after commit()"""
+        # Arrange
+        url = f"{self.base}/page"
+        first = self.transport.get(url, commit=False)
+
+        # Act
+        retried = self.transport.get(url, commit=False)
+        self.transport.commit(retried)
+        third = self.transport.get(url)
+
+        # Assert
+        self.assertFalse(first.unchanged)
+        self.assertFalse(retried.unchanged)
+        self.assertTrue(third.unchanged)
+
+    def test_second_fetch_is_conditional(self):
+        """The cached ETag is sent and a 304 returns the cached body"""
+        # Arrange
+        first = self.transport.get(f"{self.base}/page")
+
+        # Act
+        second = self.transport.get(f"{self.base}/page")
+
+        # Assert
+        self.assertIsNotNone(self.server.requests[1][1])
+        self.assertTrue(second.not_modified)
+        self.assertTrue(second.unchanged)
+        self.assertEqual(second.text, first.text)
+
+    def test_unchanged_body_without_validators(self):
+        """Without ETags an identical body is still detected by hash"""
+        # Arrange
+        self.server.use_etag = False
+        self.transport.get(f"{self.base}/page")
+
+        # Act
+        result = self.transport.get(f"{self.base}/page")
+
+        # Assert
+        self.assertFalse(result.not_modified)
+        self.assertTrue(result.unchanged)
+
+    def test_changed_body(self):
+        """A new body is reported as changed and replaces the cache"""
+        # Arrange
+        self.transport.get(f"{self.base}/page")
+        self.server.body = '<table></table>'
+        self.server.version = 2
+
+        # Act
+        result = self.transport.get(f"{self.base}/page")
+
+        # Assert
+        self.assertFalse(result.unchanged)
+        self.assertEqual(self.cache.get(f"{self.base}/page").body, '<table></table>')
+
+    def test_corrupt_body_is_a_miss(self):
+        """A body that no longer matches its recorded hash is ignored"""
+        # Arrange
+        self.transport.get(f"{self.base}/page")
+        for name in os.listdir(self.cache.cache_dir):
+            if name.endswith('.body'):
+                with open(os.path.join(self.cache.cache_dir, name), 'w') as f:
+                    f.write('truncated')
+
+        # Act & Assert
+        self.assertIsNone(self.cache.get(f"{self.base}/page"))
+
+    def test_crlf_body_round_trips(self):
+        """Bodies with CRLF line endings are returned unchanged, not treated as corrupt"""
+        # Arrange
+        body = '<table>\r\n<tr><td>ACC101A</td></tr>\r\n</table>'
+        entry = self.cache.put(f"{self.base}/crlf", body, {'ETag': '"1"'})
+
+        # Act
+        self.cache.touch(entry)
+        cached = self.cache.get(f"{self.base}/crlf")
+
+        # Assert
+        self.assertEqual(cached.body, body)
+        self.assertEqual(cached.etag, '"1"')
+        self.assertFalse(any(name.endswith('.tmp') for name in os.listdir(self.cache.cache_dir)))
+
+    def test_course_scraper_skips_unchanged_semester(self):
+        """A second scrape of unchanged pages does not rewrite the output"""
+        # Arrange
+        scraper = CourseScraperCLI(transport=self.transport)
+        output_dir = os.path.join(self.temp_dir, 'out')
+        with patch.object(CourseScraperCLI, 'BASE_URL', f"{self.base}/index.php"), patch('builtins.print'):
+            scraper.scrape_courses('25/FA', ug=True, output_dir=output_dir)
+
+            # Act
+            with patch.object(CourseScraperCLI, 'save_semester_department') as mock_save:
+                scraper.scrape_courses('25/FA', ug=True, output_dir=output_dir)
+
+        # Assert
+        mock_save.assert_not_called()
+        self.assertTrue(os.path.exists(os.path.join(output_dir, 'semesters', '25_FA', 'ACC.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
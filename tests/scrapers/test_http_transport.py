@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+"""
+Tests for the scraping HTTP transport against a local stub server
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from utilities.http_transport import ScrapeTransport, TokenBucket
+from utilities.course_scraper import CourseScraperCLI
+
+COURSE_ROW = (
+    '<tr class="available"><td>{code}</td><td>Intro</td><td>In Person</td><td>MWF</td>'
+    '<td>9:00AM</td><td>9:50AM</td><td></td><td>Open</td><td>3</td></tr>'
+)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves course pages; /flaky fails until the third request"""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            flaky_count = server.hits.count('/flaky')
+        try:
+            time.sleep(server.delay)
+            if self.path == '/flaky' and flaky_count < 3:
+                self.send_response(503)
+                self.send_header('Retry-After', '0')
+                self.end_headers()
+                return
+            if self.path == '/missing':
+                self.send_response(404)
+                self.end_headers()
+                return
+            code = 'ACC101A' if 'ug=1' in self.path else 'ACC501A'
+            body = f'<table>{COURSE_ROW.format(code=code)}</table>'.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestScrapeTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.hits = []
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.delay = 0.05
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.transport = ScrapeTransport(max_workers=3, backoff_factor=0, rate_limit=0)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get_returns_page(self):
+        """A single fetch returns status and body"""
+        # Act
+        result = self.transport.get(f"{self.base}/index.php?ug=1")
+
+        # Assert
+        self.assertEqual(result.status_code, 200)
+        self.assertIn('ACC101A', result.text)
+
+    def test_retries_transient_errors(self):
+        """503 responses are retried until the server recovers"""
+        # Act
+        result = self.transport.get(f"{self.base}/flaky")
+
+        # Assert
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(self.server.hits.count('/flaky'), 3)
+
+    def test_fetch_many_bounds_parallelism(self):
+        """fetch_many runs requests concurrently but never above max_workers"""
+        # Arrange
+        urls = [f"{self.base}/page{i}" for i in range(8)]
+
+        # Act
+        results = self.transport.fetch_many(urls)
+
+        # Assert
+        self.assertEqual(len(results), 8)
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 3)
+
+    def test_fetch_many_reports_errors_per_url(self):
+        """A failing URL does not abort the others"""
+        # Act
+        results = self.transport.fetch_many([f"{self.base}/missing", f"{self.base}/ok"])
+
+        # Assert
+        self.assertIsInstance(results[f"{self.base}/missing"], Exception)
+        self.assertEqual(results[f"{self.base}/ok"].status_code, 200)
+
+    def test_scraper_fetches_ug_and_grad_for_several_semesters(self):
+        """CourseScraperCLI fetches every page through the transport and saves each semester"""
+        # Arrange
+        scraper = CourseScraperCLI(transport=self.transport)
+
+        # Act
+        with patch.object(CourseScraperCLI, 'BASE_URL', f"{self.base}/index.php"), \
+                tempfile.TemporaryDirectory() as output_dir, patch('builtins.print'):
+            scraper.scrape_semesters(['25/SU', '25/FA'], ug=True, grad=True, output_dir=output_dir)
+            saved = sorted(os.listdir(os.path.join(output_dir, 'semesters')))
+
+        # Assert
+        self.assertEqual(len(self.server.hits), 4)
+        self.assertEqual(saved, ['25_FA', '25_SU'])
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_waits_when_empty(self):
+        """Acquiring past the burst sleeps for the refill time"""
+        # Arrange
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, burst=1, clock=lambda: now[0], sleep=sleep)
+
+        # Act
+        bucket.acquire()
+        bucket.acquire()
+
+        # Assert
+        self.assertEqual(sleeps, [0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
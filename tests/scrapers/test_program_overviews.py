@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+import requests
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from utilities.http_transport import FetchResult
+from utilities.scrape_program_overviews import OverviewCheckpoint, checkpoint_path, scrape_program_overviews
+from utilities.map_program_overviews import update_department_mission_statements
+
+
+def program_page(text):
+    return f'<html><body><h2>Program Overview</h2><p>{text}</p><h2>Next</h2></body></html>'
+
+
+class FakeTransport:
+    """Serves canned pages; urls in failing raise a connection error"""
+
+    def __init__(self, pages, failing=()):
+        self.pages = pages
+        self.failing = set(failing)
+        self.fetched = []
+
+    def iter_fetch(self, urls, max_workers=None):
+        for url in urls:
+            self.fetched.append(url)
+            if url in self.failing:
+                yield url, requests.ConnectionError('boom')
+            else:
+                yield url, FetchResult(url, 200, self.pages[url])
+
+
+class TestProgramOverviewScraper(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.programs = [
+            {'name': 'Accounting', 'url': 'https://www.niagara.edu/programs/accounting/'},
+            {'name': 'Theatre', 'url': 'https://www.niagara.edu/programs/theatre/'},
+        ]
+        self.pages = {
+            self.programs[0]['url']: program_page('Count things.'),
+            self.programs[1]['url']: program_page('Act things.'),
+        }
+        self.checkpoint = OverviewCheckpoint(checkpoint_path(os.path.join(self.temp_dir, 'program_overviews.json')))
+
+    def tearDown(self):
+        self.checkpoint.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_checkpoint_is_not_a_json_file(self):
+        """The checkpoint must not be picked up as department data"""
+        self.assertFalse(self.checkpoint.path.endswith('.json'))
+
+    def test_interrupted_run_resumes_remaining_urls(self):
+        """A second run only fetches pages the first run did not finish"""
+        # Arrange
+        with patch('builtins.print'):
+            scrape_program_overviews(self.programs, FakeTransport(self.pages, failing=[self.programs[1]['url']]),
+                                     checkpoint=self.checkpoint)
+        self.checkpoint.close()
+        transport = FakeTransport(self.pages)
+
+        # Act
+        with patch('builtins.print'):
+            overviews, changed = scrape_program_overviews(self.programs, transport, checkpoint=self.checkpoint)
+
+        # Assert
+        self.assertEqual(transport.fetched, [self.programs[1]['url']])
+        self.assertEqual(list(overviews), ['Accounting', 'Theatre'])
+        self.assertEqual(overviews['Theatre']['overview'], 'Act things.')
+        self.assertEqual(changed, 2)
+
+    def test_failed_fetch_keeps_previous_overview(self):
+        """A page that cannot be fetched keeps last run's overview"""
+        # Arrange
+        previous = {'Theatre': {'url': self.programs[1]['url'], 'overview': 'Old text'}}
+
+        # Act
+        with patch('builtins.print'):
+            overviews, _ = scrape_program_overviews(
+                self.programs, FakeTransport(self.pages, failing=[self.programs[1]['url']]), previous)
+
+        # Assert
+        self.assertEqual(overviews['Theatre']['overview'], 'Old text')
+
+
+class TestMapProgramOverviews(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for code, mission in (('EDU', None), ('THR', 'Existing')):
+            with open(os.path.join(self.temp_dir, f'{code}.json'), 'w') as f:
+                json.dump({'code': code, 'mission_statement': mission}, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_each_department_written_once(self):
+        """Several programs mapping to one department produce one write"""
+        # Arrange
+        overviews = {
+            'Special Education': {'overview': 'First'},
+            'Childhood and Middle Childhood Education': {'overview': 'Second'},
+            'Theatre Studies and Fine Arts': {'overview': 'Ignored'},
+        }
+
+        # Act
+        with patch('builtins.print'), \
+             patch('core.file_writer.AtomicWriter.write_json', autospec=True, return_value=True) as mock_write:
+            updated = update_department_mission_statements(overviews, self.temp_dir)
+
+        # Assert
+        self.assertEqual(updated, 1)
+        mock_write.assert_called_once()
+        self.assertEqual(mock_write.call_args.args[2]['mission_statement'], 'First')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+"""
+Tests for the streaming table row extractor backends
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from utilities.row_extractor import iter_table_rows, etree
+from utilities.course_scraper import CourseScraperCLI
+from utilities.benchmark_row_parsing import parse_with_beautifulsoup, synthesize_snapshot
+
+PAGE = '''
+<html><body>
+<table>
+  <tr><th>Course</th><th>Name</th></tr>
+  <tr class="available"><td>THR103A</td><td>Intro to <b>Theatre</b> &amp; Film</td><td>LEC</td>
+      <td>TTH</td><td>12:00PM</td><td>01:20PM</td><td>H*LA</td><td>27</td><td>3.00</td></tr>
+  <tr class="unavailable extra"><td>ACC101A<td>Accounting<td>LEC<td>MWF<td>9:00AM<td>9:50AM<td><td>0<td>3.00
+  <tr class="other"><td>IGNORED</td></tr>
+</table>
+</body></html>
+'''
+
+BACKENDS = ['html.parser'] + (['lxml'] if etree is not None else [])
+
+
+class TestRowExtractor(unittest.TestCase):
+
+    def test_rows_and_classes(self):
+        """Every backend yields each row with its classes and cell text"""
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                # Act
+                rows = list(iter_table_rows(PAGE, backend=backend))
+
+                # Assert
+                self.assertEqual(len(rows), 4)
+                self.assertEqual(rows[0].cells, [])
+                self.assertEqual(rows[1].cells[1], 'Intro to Theatre & Film')
+                self.assertTrue(rows[2].has_class(('unavailable',)))
+                self.assertEqual(rows[2].cells[0], 'ACC101A')
+                self.assertEqual(len(rows[2].cells), 9)
+
+    def test_header_cells(self):
+        """th cells are included when requested"""
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                rows = list(iter_table_rows(PAGE, cell_tags=('td', 'th'), backend=backend))
+                self.assertEqual(rows[0].cells, ['Course', 'Name'])
+
+    def test_unknown_backend(self):
+        """An unknown backend name is rejected"""
+        with self.assertRaises(ValueError):
+            iter_table_rows(PAGE, backend='regex')
+
+    def test_course_data_matches_beautifulsoup(self):
+        """parse_course_data agrees with the original BeautifulSoup parser on well-formed rows"""
+        # Arrange
+        html = synthesize_snapshot(200)
+        expected = parse_with_beautifulsoup(html)
+
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                # Act
+                courses = CourseScraperCLI(parser_backend=backend).parse_course_data(html)
+
+                # Assert
+                self.assertEqual([list(course.values()) for course in courses], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -158,6 +158,23 @@ class TestCourseScheduleScraper(unittest.TestCase):
         self.assertIn('THR103A', course_numbers)
         self.assertIn('THR999', course_numbers)
     
+    def test_merge_report_log_is_compacted(self):
+        """The per-run merge report log keeps only its newest runs once it passes the cap"""
+        # Arrange
+        self.scraper.MERGE_REPORT_MAX_BYTES = 1000
+        log_path = os.path.join(self.temp_dir, self.scraper.MERGE_REPORT_LOG)
+        
+        # Act
+        with patch('builtins.print'):
+            for run in range(50):
+                self.scraper.record_merge_reports(f"25_FA-{run}", {})
+        
+        # Assert
+        with open(log_path) as f:
+            semesters = [json.loads(line)['semester'] for line in f]
+        self.assertLessEqual(os.path.getsize(log_path), 1000)
+        self.assertEqual(semesters[-1], '25_FA-49')
+    
     @patch('utilities.scrape_descriptions.requests.get')
     def test_scrape_semester_schedule_success(self, mock_get):
         """Test successful semester schedule scraping"""
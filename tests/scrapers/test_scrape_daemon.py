@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+"""
+Tests for the incremental scraping daemon
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from utilities.course_scraper import CourseScraperCLI
+from utilities.http_transport import FetchResult
+from utilities.scrape_daemon import ScrapeDaemon, row_hash
+
+
+def listing(rows):
+    return '<table>' + ''.join(
+        f'<tr class="available"><td>{code}</td><td>Name</td><td>LEC</td><td>MWF</td>'
+        f'<td>9:00AM</td><td>9:50AM</td><td></td><td>{seats}</td><td>3</td></tr>'
+        for code, seats in rows
+    ) + '</table>'
+
+
+class FakeTransport:
+    """Serves the current page and flags bodies identical to the last committed fetch"""
+
+    max_workers = 2
+
+    def __init__(self):
+        self.page = ''
+        self.last = {}
+        self.session = MagicMock()
+
+    def fetch_many(self, urls, commit=True):
+        results = {}
+        for url in urls:
+            results[url] = FetchResult(url, 200, self.page, unchanged=self.last.get(url) == self.page)
+            if commit:
+                self.commit(results[url])
+        return results
+
+    def commit(self, result):
+        self.last[result.url] = result.text
+
+
+class TestScrapeDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.transport = FakeTransport()
+        self.now = [1000]
+        self.daemon = ScrapeDaemon(
+            self.temp_dir, ['25/FA'], ug=True, grad=False,
+            scraper=CourseScraperCLI(transport=self.transport),
+            api_url='http://127.0.0.1:5000', api_token='secret', clock=lambda: self.now[0]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def run_cycle(self, rows):
+        self.transport.page = listing(rows)
+        self.now[0] += 60
+        with patch('builtins.print'):
+            return self.daemon.run_once()
+
+    def test_first_run_writes_everything(self):
+        """All departments are new on the first run"""
+        report = self.run_cycle([('ACC101A', '10'), ('THR103A', '5')])
+        self.assertEqual(report, {'25/FA': ['ACC', 'THR']})
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'semesters', '25_FA', 'THR.json')))
+
+    def test_unchanged_page_does_no_work(self):
+        """An identical page is skipped before parsing"""
+        # Arrange
+        self.run_cycle([('ACC101A', '10')])
+
+        # Act
+        with patch.object(CourseScraperCLI, 'parse_course_data') as mock_parse:
+            report = self.run_cycle([('ACC101A', '10')])
+
+        # Assert
+        mock_parse.assert_not_called()
+        self.assertEqual(report, {'25/FA': []})
+
+    def test_availability_change_affects_only_its_department(self):
+        """A seat change is logged and only its department is reloaded"""
+        # Arrange
+        self.run_cycle([('ACC101A', '10'), ('THR103A', '5')])
+        self.transport.session.post.reset_mock()
+
+        # Act
+        report = self.run_cycle([('ACC101A', '10'), ('THR103A', '4')])
+
+        # Assert
+        self.assertEqual(report, {'25/FA': ['THR']})
+        self.transport.session.post.assert_called_once()
+        self.assertEqual(self.transport.session.post.call_args.kwargs['json'],
+                         {'semester': '25_FA', 'departments': ['THR']})
+        self.assertEqual(self.transport.session.post.call_args.kwargs['headers'], {'X-Admin-Token': 'secret'})
+        series = self.daemon.availability_log('25/FA').series()
+        self.assertEqual(series['THR103A'], [(1060, '5'), (1120, '4')])
+        self.assertEqual(series['ACC101A'], [(1060, '10')])
+
+    def test_failed_write_logs_nothing_and_retries(self):
+        """A failed write is logged nowhere, does not stop the cycle and is retried"""
+        # Arrange
+        self.run_cycle([('ACC101A', '10')])
+        thr_file = os.path.join(self.temp_dir, 'semesters', '25_FA', 'THR.json')
+
+        # Act
+        with patch.object(CourseScraperCLI, 'write_semester_rows', side_effect=OSError('disk full')):
+            failed = self.run_cycle([('ACC101A', '10'), ('THR103A', '4')])
+        series_after_failure = self.daemon.availability_log('25/FA').series()
+        retried = self.run_cycle([('ACC101A', '10'), ('THR103A', '4')])
+
+        # Assert
+        self.assertEqual(failed, {})
+        self.assertNotIn('THR103A', series_after_failure)
+        self.assertEqual(retried, {'25/FA': ['THR']})
+        self.assertTrue(os.path.exists(thr_file))
+        self.assertEqual(self.daemon.availability_log('25/FA').series()['THR103A'], [(1180, '4')])
+
+    def test_failed_write_is_retried_when_page_reads_unchanged(self):
+        """A page reported unchanged (e.g. 304) after a failed write is still written"""
+        # Arrange
+        self.run_cycle([('ACC101A', '10')])
+        with patch.object(CourseScraperCLI, 'write_semester_rows', side_effect=OSError('disk full')):
+            self.run_cycle([('ACC101A', '10'), ('THR103A', '4')])
+        self.transport.last = {url: self.transport.page for url in self.transport.last}
+
+        # Act
+        report = self.run_cycle([('ACC101A', '10'), ('THR103A', '4')])
+
+        # Assert
+        self.assertEqual(report, {'25/FA': ['THR']})
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'semesters', '25_FA', 'THR.json')))
+
+    def test_state_survives_restart(self):
+        """A new daemon resumes from persisted row hashes"""
+        # Arrange
+        self.run_cycle([('ACC101A', '10')])
+        self.daemon = ScrapeDaemon(self.temp_dir, ['25/FA'], ug=True, grad=False,
+                                   scraper=CourseScraperCLI(transport=self.transport))
+        self.transport.last = {}
+
+        # Act
+        report = self.run_cycle([('ACC101A', '10')])
+
+        # Assert
+        self.assertEqual(report, {'25/FA': []})
+
+    def test_row_hash_covers_availability(self):
+        """Row hashes differ when only availability differs"""
+        row = {'number': 'ACC101A', 'availability': '10'}
+        self.assertNotEqual(row_hash(row), row_hash(dict(row, availability='9')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+"""
+Tests for streaming semester department grouping and writes
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.offering import Offering
+from utilities.course_scraper import CourseScraperCLI, SemesterDepartmentWriter
+
+
+def listing(codes):
+    """Listing page with one available row per code"""
+    rows = ''.join(
+        f'<tr class="available"><td>{code}</td><td>Name</td><td>LEC</td><td>MWF</td>'
+        f'<td>9:00AM</td><td>9:50AM</td><td></td><td>Open</td><td>3</td></tr>'
+        for code in codes
+    )
+    return f'<table>{rows}</table>'
+
+
+def read_files(directory):
+    contents = {}
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name)) as f:
+            contents[name] = f.read()
+    return contents
+
+
+class TestStreamingPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.scraper = CourseScraperCLI()
+        self.pages = {
+            ('25/FA', 'ug'): listing(['ACC101A', 'ACC101B', 'ACC205A', 'BIO110A', 'THR103A']),
+            ('25/FA', 'grad'): listing(['ACC501A', 'EDU600A', 'THR503A'])
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_in_memory_grouping(self):
+        """Streamed files are identical to grouping everything first"""
+        # Arrange
+        rows = (self.scraper.parse_course_data(self.pages[('25/FA', 'ug')])
+                + self.scraper.parse_course_data(self.pages[('25/FA', 'grad')]))
+        departments = self.scraper.create_semester_departments(self.scraper.parse_offerings_from_courses(rows))
+        self.scraper.save_semester_departments(departments, os.path.join(self.temp_dir, 'expected'), '25/FA')
+
+        # Act
+        with patch('builtins.print'):
+            self.scraper.process_semester_pages('25/FA', self.pages, os.path.join(self.temp_dir, 'streamed'))
+
+        # Assert
+        expected = read_files(os.path.join(self.temp_dir, 'expected', 'semesters', '25_FA'))
+        streamed = read_files(os.path.join(self.temp_dir, 'streamed', 'semesters', '25_FA'))
+        self.assertEqual(sorted(streamed), ['ACC.json', 'BIO.json', 'EDU.json', 'THR.json'])
+        self.assertEqual(streamed, expected)
+
+    def test_department_written_when_stream_moves_on(self):
+        """A department is saved before later departments are read"""
+        # Arrange
+        saved = []
+        writer = SemesterDepartmentWriter(self.temp_dir, lambda directory, code, dept: saved.append(code))
+
+        # Act
+        writer.add(Offering('ACC101A'))
+        writer.add(Offering('ACC102A'))
+        saved_before_bio = list(saved)
+        writer.add(Offering('BIO110A'))
+
+        # Assert
+        self.assertEqual(saved_before_bio, [])
+        self.assertEqual(saved, ['ACC'])
+
+    def test_unsorted_stream_extends_written_file(self):
+        """A department that reappears is read back and rewritten complete"""
+        # Arrange
+        writer = SemesterDepartmentWriter(self.temp_dir, self.scraper.save_semester_department)
+
+        # Act
+        for code in ['ACC101A', 'BIO110A', 'ACC205A', 'ACC101B']:
+            writer.add(Offering(code))
+        writer.close()
+
+        # Assert
+        departments = self.scraper.create_semester_departments(
+            [Offering(code) for code in ['ACC101A', 'ACC205A', 'ACC101B']])
+        with open(os.path.join(self.temp_dir, 'ACC.json')) as f:
+            self.assertEqual(f.read(), departments['ACC'].to_json())
+
+
+if __name__ == '__main__':
+    unittest.main()
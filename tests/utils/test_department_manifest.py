@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.department_manifest import DepartmentManifest, DepartmentManifestEntry
+from core.data_loader import DepartmentDataLoader
+
+
+class TestDepartmentManifest(unittest.TestCase):
+
+    def setUp(self):
+        """Create department files in both locations"""
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'departments'))
+        self.write('departments/THR.json', {
+            "name": "Theater Arts",
+            "mission_statement": "Excellence in theater",
+            "courses": [{"number": "101"}, {"number": "102"}]
+        })
+        self.write('departments/ACC.json', {"name": "Accounting", "courses": []})
+        self.write('MATH.json', {"name": "Mathematics", "courses": [{"number": "101"}]})
+        self.manifest = DepartmentManifest(self.temp_dir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, relative_path, data):
+        path = os.path.join(self.temp_dir, relative_path)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_summaries_include_counts_and_hash(self):
+        """Entries hold name, course count and content hash"""
+        # Act
+        entry = self.manifest.get('THR')
+
+        # Assert
+        self.assertEqual(entry.name, 'Theater Arts')
+        self.assertEqual(entry.course_count, 2)
+        self.assertEqual(len(entry.content_hash), 64)
+
+    def test_codes_cover_both_locations(self):
+        """Legacy location files are listed after the departments folder"""
+        self.assertCountEqual(self.manifest.codes(), ['THR', 'ACC', 'MATH'])
+
+    def test_exists(self):
+        """Existence checks use the cached listing"""
+        self.assertTrue(self.manifest.exists('ACC'))
+        self.assertFalse(self.manifest.exists('ZZZ'))
+
+    def test_unchanged_files_are_not_reread(self):
+        """A second pass does not open any file"""
+        # Arrange
+        self.manifest.all_entries()
+
+        # Act
+        with patch.object(DepartmentManifestEntry, 'from_file') as mock_from_file:
+            entries = self.manifest.all_entries()
+
+        # Assert
+        mock_from_file.assert_not_called()
+        self.assertEqual(len(entries), 3)
+
+    def test_changed_file_is_reread(self):
+        """Editing a file updates its entry"""
+        # Arrange
+        old_hash = self.manifest.get('ACC').content_hash
+        self.write('departments/ACC.json', {"name": "Accounting", "courses": [{"number": "111"}]})
+
+        # Act
+        entry = self.manifest.get('ACC')
+
+        # Assert
+        self.assertEqual(entry.course_count, 1)
+        self.assertNotEqual(entry.content_hash, old_hash)
+
+    def test_data_loader_summaries(self):
+        """Data loader exposes manifest summaries"""
+        loader = DepartmentDataLoader(self.temp_dir)
+        summary = loader.get_department_summary('MATH')
+        self.assertEqual(summary['name'], 'Mathematics')
+        self.assertEqual(summary['course_count'], 1)
+        self.assertTrue(loader.department_exists('THR'))
+
+
+if __name__ == '__main__':
+    unittest.main()
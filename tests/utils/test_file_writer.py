@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from core.file_writer import AtomicWriter, read_change_manifest, write_atomic
+
+
+class TestAtomicWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.manifest = os.path.join(self.temp_dir, '.changes.jsonl')
+        self.writer = AtomicWriter(manifest_path=self.manifest)
+        self.path = os.path.join(self.temp_dir, 'semesters', '25_FA', 'THR.json')
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_creates_file_and_records_change(self):
+        """A new file is written and logged as created"""
+        # Act
+        written = self.writer.write_json(self.path, [{"number": "THR101A"}])
+
+        # Assert
+        self.assertTrue(written)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), [{"number": "THR101A"}])
+        records, _ = read_change_manifest(self.manifest)
+        self.assertEqual([r['action'] for r in records], ['created'])
+
+    def test_unchanged_content_is_not_rewritten(self):
+        """Identical content skips the write and the manifest"""
+        # Arrange
+        self.writer.write_json(self.path, {"a": 1})
+        mtime = os.stat(self.path).st_mtime_ns
+
+        # Act
+        with patch('core.file_writer.write_atomic') as mock_write:
+            written = self.writer.write_json(self.path, {"a": 1})
+
+        # Assert
+        self.assertFalse(written)
+        mock_write.assert_not_called()
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+        self.assertEqual(len(read_change_manifest(self.manifest)[0]), 1)
+
+    def test_changed_content_records_previous_hash(self):
+        """An update records both hashes"""
+        # Arrange
+        self.writer.write_json(self.path, {"a": 1})
+
+        # Act
+        self.writer.write_json(self.path, {"a": 2})
+
+        # Assert
+        records, _ = read_change_manifest(self.manifest)
+        self.assertEqual(records[1]['action'], 'updated')
+        self.assertEqual(records[1]['previous_hash'], records[0]['content_hash'])
+
+    def test_failed_write_keeps_original(self):
+        """A failure before the rename leaves the old file and no temp files"""
+        # Arrange
+        write_atomic(self.path, 'original')
+
+        # Act
+        with patch('core.file_writer.os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, 'replacement')
+
+        # Assert
+        with open(self.path) as f:
+            self.assertEqual(f.read(), 'original')
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['THR.json'])
+
+    def test_manifest_offsets_resume(self):
+        """Reading from a returned offset yields only newer records"""
+        # Arrange
+        self.writer.write_text(self.path, 'one')
+        _, offset = read_change_manifest(self.manifest)
+        self.writer.write_text(self.path, 'two')
+
+        # Act
+        records, _ = read_change_manifest(self.manifest, offset)
+
+        # Assert
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['action'], 'updated')
+
+    def test_manifest_is_compacted(self):
+        """The manifest keeps only its newest records once it outgrows the cap"""
+        # Arrange
+        writer = AtomicWriter(manifest_path=self.manifest, max_manifest_bytes=2000)
+        _, stale_offset = read_change_manifest(self.manifest)
+
+        # Act
+        for number in range(100):
+            writer.write_text(self.path, f'version {number}')
+            if number == 5:
+                _, stale_offset = read_change_manifest(self.manifest)
+        records, _ = read_change_manifest(self.manifest)
+        resumed, _ = read_change_manifest(self.manifest, stale_offset)
+
+        # Assert
+        self.assertLessEqual(os.path.getsize(self.manifest), 2000)
+        self.assertLess(len(records), 100)
+        self.assertEqual(records[-1]['content_hash'], writer.changes[-1]['content_hash'])
+        self.assertTrue(all('path' in record for record in resumed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""
+Benchmark academic calendar PDF extraction modes
+
+Compares the original serial page loop with process-pool extraction,
+lazy first-page extraction and a warm extraction cache.
+
+    python utilities/benchmark_pdf_extraction.py
+    python utilities/benchmark_pdf_extraction.py --pdf niagara/2025-2026-academic-calendar.pdf --processes 2,4
+"""
+
+import argparse
+import os
+import sys
+
+import pdfplumber
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pdf.pdf_extractor import PDFExtractionCache, extract_pages, iter_pages, page_count
+from utilities.benchmark_row_parsing import time_call
+
+DEFAULT_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'niagara', '2025-2026-academic-calendar.pdf')
+
+
+def extract_with_loop(pdf_path):
+    """The original extract_text_from_pdf implementation"""
+    text = ""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+    return text
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Benchmark PDF extraction modes')
+    parser.add_argument('--pdf', default=DEFAULT_PDF, help='Calendar PDF (default: niagara/2025-2026-academic-calendar.pdf)')
+    parser.add_argument('--processes', default='2,4', help='Comma-separated pool sizes to try (default: 2,4)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per mode; the best is reported (default: 3)')
+    args = parser.parse_args(args)
+
+    pages = page_count(args.pdf)
+    print(f"{os.path.basename(args.pdf)}: {pages} page(s), {os.path.getsize(args.pdf) / 1024:.0f} KiB")
+
+    seconds, _ = time_call(lambda: extract_with_loop(args.pdf), args.repeat)
+    print(f"  {'text loop':<16} {seconds * 1000:8.1f} ms")
+
+    elapsed, _ = time_call(lambda: extract_pages(args.pdf), args.repeat)
+    print(f"  {'serial+words':<16} {elapsed * 1000:8.1f} ms  {seconds / elapsed:5.1f}x")
+
+    for processes in (int(p) for p in args.processes.split(',') if p.strip()):
+        elapsed, _ = time_call(lambda: extract_pages(args.pdf, processes=processes), args.repeat)
+        note = '' if pages > 1 else '  (single page: runs serially)'
+        print(f"  {f'{processes} processes':<16} {elapsed * 1000:8.1f} ms  {seconds / elapsed:5.1f}x{note}")
+
+    elapsed, _ = time_call(lambda: next(iter_pages(args.pdf, PDFExtractionCache())), args.repeat)
+    print(f"  {'lazy first page':<16} {elapsed * 1000:8.1f} ms  {seconds / elapsed:5.1f}x")
+
+    cache = PDFExtractionCache()
+    cache.extract(args.pdf)
+    elapsed, _ = time_call(lambda: cache.extract(args.pdf), args.repeat)
+    print(f"  {'warm cache':<16} {elapsed * 1000:8.3f} ms  {seconds / elapsed:5.0f}x")
+
+
+if __name__ == '__main__':
+    main()
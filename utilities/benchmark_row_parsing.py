@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""
+Benchmark course listing parsers on a saved snapshot of the courses page
+
+Compares the original BeautifulSoup find_all approach with the row
+extractor backends. Without --snapshot a listing page of --rows synthetic
+rows is generated; --fetch SEMESTER downloads and saves a real snapshot.
+
+    python utilities/benchmark_row_parsing.py --fetch 25/FA --snapshot /tmp/courses.html
+    python utilities/benchmark_row_parsing.py --snapshot /tmp/courses.html
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utilities.course_scraper import CourseScraperCLI
+from utilities.row_extractor import BACKENDS, etree
+
+ROW_TEMPLATE = (
+    '<tr class="{status}"><td>{dept}{number}{section}</td><td>Course Title {number}</td>'
+    '<td>In Person</td><td>MWF</td><td>09:00AM</td><td>09:50AM</td><td>H*LA</td>'
+    '<td>{seats}</td><td>3.00</td></tr>\n'
+)
+
+
+def synthesize_snapshot(rows):
+    """Build a listing page shaped like the live one"""
+    departments = ['ACC', 'BIO', 'CHE', 'ENG', 'HIS', 'MAT', 'PHI', 'PSY', 'THR']
+    body = []
+    for i in range(rows):
+        body.append(ROW_TEMPLATE.format(
+            status='available' if i % 3 else 'unavailable',
+            dept=departments[i % len(departments)],
+            number=100 + (i // len(departments)) % 400,
+            section='ABCD'[i % 4],
+            seats=i % 30
+        ))
+    return ('<html><body><table><tr><th>Course</th><th>Name</th></tr>\n'
+            + ''.join(body) + '</table></body></html>')
+
+
+def parse_with_beautifulsoup(html):
+    """The original parse_course_data implementation"""
+    soup = BeautifulSoup(html, 'html.parser')
+    courses = []
+    for row in soup.find_all('tr', class_=['available', 'unavailable']):
+        tds = row.find_all('td')
+        if len(tds) >= 9:
+            courses.append([td.get_text().strip() for td in tds[:9]])
+    return courses
+
+
+def time_call(func, repeat):
+    """Best wall time of repeat runs, and the last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Benchmark course listing row parsers')
+    parser.add_argument('--snapshot', help='Saved courses page HTML')
+    parser.add_argument('--fetch', metavar='SEMESTER', help='Download this semester (e.g. 25/FA) into --snapshot first')
+    parser.add_argument('--rows', type=int, default=5000, help='Synthetic rows when no snapshot is given (default: 5000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per parser; the best is reported (default: 3)')
+    args = parser.parse_args(args)
+
+    if args.fetch:
+        if not args.snapshot:
+            parser.error('--fetch requires --snapshot')
+        html = CourseScraperCLI().fetch_course_page(args.fetch, ug=True)
+        with open(args.snapshot, 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"Saved snapshot of {args.fetch} to {args.snapshot}")
+    elif args.snapshot:
+        with open(args.snapshot, 'r', encoding='utf-8') as f:
+            html = f.read()
+    else:
+        html = synthesize_snapshot(args.rows)
+
+    print(f"Page size: {len(html) / 1024:.0f} KiB")
+    seconds, baseline = time_call(lambda: parse_with_beautifulsoup(html), args.repeat)
+    print(f"  {'beautifulsoup':<14} {seconds * 1000:8.1f} ms  {len(baseline)} rows")
+
+    for backend in BACKENDS:
+        if backend == 'lxml' and etree is None:
+            print(f"  {backend:<14} skipped (lxml not installed)")
+            continue
+        scraper = CourseScraperCLI(parser_backend=backend)
+        elapsed, rows = time_call(lambda: scraper.parse_course_data(html), args.repeat)
+        print(f"  {backend:<14} {elapsed * 1000:8.1f} ms  {len(rows)} rows  {seconds / elapsed:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,8 +4,7 @@
 Course scraper CLI for Niagara University course details
 """
 
-import requests
-from bs4 import BeautifulSoup
+import heapq
 import os
 import json
 import sys
@@ -14,6 +13,13 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.offering import Offering
 from core.department import Department
+from core.course import Course
+from core.file_writer import AtomicWriter
+from utilities.http_transport import ScrapeTransport
+from utilities.row_extractor import iter_table_rows
+
+
+DAY_NAMES = {'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday', 'R': 'Thursday', 'F': 'Friday', 'S': 'Saturday', 'U': 'Sunday'}
 
 
 class CourseScraperCLI:
@@ -21,6 +27,19 @@ class CourseScraperCLI:
     
     BASE_URL = "https://apps.niagara.edu/courses/index.php"
     
+    def __init__(self, transport=None, force=False, parser_backend=None, writer=None):
+        """Use the given ScrapeTransport, or a pooled default one
+        
+        Unless force is set, a semester whose pages are unchanged since the
+        transport's cached copy (and whose output exists) is not re-parsed.
+        parser_backend selects the row extractor ('lxml' or 'html.parser').
+        writer is the AtomicWriter used for output files.
+        """
+        self.transport = transport or ScrapeTransport()
+        self.force = force
+        self.parser_backend = parser_backend
+        self.writer = writer or AtomicWriter()
+    
     def build_query_url(self, semester=None, undergraduate=None):
         """Build query URL with optional parameters"""
         url = self.BASE_URL
@@ -44,91 +63,107 @@ class CourseScraperCLI:
         else:
             url = self.build_query_url(semester=semester, undergraduate=False)
         
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.text
+        return self.transport.get(url).text
+    
+    def fetch_course_pages(self, semesters, ug=False, grad=False):
+        """Fetch UG and/or grad pages for several semesters concurrently
+        
+        Returns a dict of (semester, 'ug' | 'grad') -> HTML content. Raises the
+        first fetch error encountered so a partial scrape is never saved.
+        """
+        results = self.fetch_course_results(semesters, ug=ug, grad=grad)
+        return {key: result.text for key, result in results.items()}
+    
+    def fetch_course_results(self, semesters, ug=False, grad=False, commit=True):
+        """Like fetch_course_pages, but returns the FetchResult for each page
+        
+        With commit=False new page bodies are not cached until commit_results()
+        is called after their output has been written.
+        """
+        requested = {}
+        for semester in semesters:
+            if ug:
+                requested[(semester, 'ug')] = self.build_query_url(semester=semester, undergraduate=True)
+            if grad:
+                requested[(semester, 'grad')] = self.build_query_url(semester=semester, undergraduate=False)
+        
+        results = self.transport.fetch_many(requested.values(), commit=commit)
+        fetched = {}
+        for key, url in requested.items():
+            result = results[url]
+            if isinstance(result, Exception):
+                raise result
+            fetched[key] = result
+        return fetched
+    
+    def commit_results(self, results, semester=None):
+        """Cache the page bodies of results (only semester's, if given) fetched with commit=False"""
+        for (sem, _), result in results.items():
+            if semester is None or sem == semester:
+                self.transport.commit(result)
+    
+    def semester_unchanged(self, semester, results, output_dir):
+        """True if every fetched page for semester is unchanged and its output exists"""
+        semester_results = [result for (sem, _), result in results.items() if sem == semester]
+        semester_dir = os.path.join(output_dir, 'semesters', semester.replace('/', '_'))
+        return (not self.force and bool(semester_results)
+                and all(result.unchanged for result in semester_results)
+                and os.path.isdir(semester_dir))
     
     def parse_course_data(self, html_content):
         """Parse course data from HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        courses = []
-        
-        for row in soup.find_all('tr', class_=['available', 'unavailable']):
-            tds = row.find_all('td')
+        return list(self.iter_course_data(html_content))
+    
+    def iter_course_data(self, html_content):
+        """Yield course rows from HTML content without building a DOM"""
+        for row in iter_table_rows(html_content, backend=self.parser_backend):
+            if not row.has_class(('available', 'unavailable')):
+                continue
+            tds = [cell.strip() for cell in row.cells]
             if len(tds) >= 9:
-                course = {
-                    'number': tds[0].get_text().strip(),
-                    'name': tds[1].get_text().strip(),
-                    'delivery_type': tds[2].get_text().strip() if len(tds) > 2 else None,
-                    'days': tds[3].get_text().strip() if len(tds) > 3 else None,
-                    'start_time': tds[4].get_text().strip() if len(tds) > 4 else None,
-                    'end_time': tds[5].get_text().strip() if len(tds) > 5 else None,
-                    'designation': tds[6].get_text().strip() if len(tds) > 6 else None,
-                    'availability': tds[7].get_text().strip() if len(tds) > 7 else None,
-                    'credits': tds[8].get_text().strip() if len(tds) > 8 else None
+                yield {
+                    'number': tds[0],
+                    'name': tds[1],
+                    'delivery_type': tds[2],
+                    'days': tds[3],
+                    'start_time': tds[4],
+                    'end_time': tds[5],
+                    'designation': tds[6],
+                    'availability': tds[7],
+                    'credits': tds[8]
                 }
-                courses.append(course)
-        
-        return courses
     
     def parse_offerings_from_courses(self, courses):
         """Convert course data to Offering objects"""
-        offerings = []
-        
+        return [self.offering_from_course(course) for course in courses]
+    
+    def iter_offerings(self, courses):
+        """Lazily convert course rows to Offering objects"""
         for course in courses:
-            # Convert meeting days to list
-            meeting_days = []
-            if course.get('days'):
-                days_str = course['days']
-                # Parse days like "MWF" into ["Monday", "Wednesday", "Friday"]
-                day_map = {'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday', 'R': 'Thursday', 'F': 'Friday', 'S': 'Saturday', 'U': 'Sunday'}
-                for char in days_str:
-                    if char in day_map:
-                        meeting_days.append(day_map[char])
-            
-            offering = Offering(
-                code=course['number'],
-                delivery_type=course.get('delivery_type'),
-                designation=course.get('designation'),
-                credits=float(course['credits']) if course.get('credits') else None,
-                meeting_days=meeting_days
-            )
-            offerings.append(offering)
+            yield self.offering_from_course(course)
+    
+    def offering_from_course(self, course):
+        """Convert one course row to an Offering"""
+        # Convert meeting days to list
+        meeting_days = []
+        if course.get('days'):
+            # Parse days like "MWF" into ["Monday", "Wednesday", "Friday"]
+            meeting_days = [DAY_NAMES[char] for char in course['days'] if char in DAY_NAMES]
         
-        return offerings
+        return Offering(
+            code=course['number'],
+            delivery_type=course.get('delivery_type'),
+            designation=course.get('designation'),
+            credits=float(course['credits']) if course.get('credits') else None,
+            meeting_days=meeting_days
+        )
     
     def create_semester_departments(self, offerings):
         """Create Department objects with Course+Offering structure"""
-        from core.course import Course
-
-        
-        dept_dict = {}
-        
+        grouper = DepartmentGrouper()
         for offering in offerings:
-            dept_code = offering.department
-            course_number = offering.number
-            
-            # Initialize department if needed
-            if dept_code not in dept_dict:
-                dept_dict[dept_code] = Department(name=f"{dept_code} Department")
-            
-            # Find or create course
-            course = None
-            for existing_course in dept_dict[dept_code].courses:
-                if existing_course.number == course_number:
-                    course = existing_course
-                    break
-            
-            if course is None:
-                # Create new course with empty offerings list
-                course = Course(number=course_number, title=f"{dept_code} {course_number}")
-                course.offerings = []  # Add offerings attribute
-                dept_dict[dept_code].courses.append(course)
-            
-            # Add offering to course
-            course.offerings.append(offering)
-        
-        return dept_dict
+            grouper.add(offering)
+        return grouper.departments
     
     def organize_courses_by_department(self, courses):
         """Organize courses by department prefix (legacy method)"""
@@ -157,57 +192,193 @@ class CourseScraperCLI:
             
             # For minimal implementation, just write the courses to JSON
             # In full implementation, this would integrate with existing Course/Department objects
-            with open(file_path, 'w') as f:
-                json.dump(courses, f, indent=2)
+            self.writer.write_json(file_path, courses, indent=2)
+    
+    def semester_directory(self, output_dir, semester):
+        """Directory holding a semester's department files"""
+        return os.path.join(output_dir, 'semesters', semester.replace('/', '_'))
     
     def save_semester_departments(self, departments, output_dir, semester):
         """Save Department objects to JSON files using object serialization"""
         # Create semester-specific directory under semesters/
-        semester_dir = os.path.join(output_dir, 'semesters', semester.replace('/', '_'))
+        semester_dir = self.semester_directory(output_dir, semester)
         os.makedirs(semester_dir, exist_ok=True)
         
         for dept_code, department in departments.items():
-            file_path = os.path.join(semester_dir, f"{dept_code}.json")
-            
-            # Use Department's to_json method for proper serialization
-            with open(file_path, 'w') as f:
-                f.write(department.to_json())
+            self.save_semester_department(semester_dir, dept_code, department)
+    
+    def save_semester_department(self, semester_dir, dept_code, department):
+        """Write one department file atomically; returns False if it was unchanged"""
+        file_path = os.path.join(semester_dir, f"{dept_code}.json")
+        
+        # Use Department's to_json method for proper serialization
+        return self.writer.write_text(file_path, department.to_json())
     
     def scrape_courses(self, semester, ug=False, grad=False, output_dir='/data'):
         """Scrape courses with specified parameters"""
-        all_courses = []
+        self.scrape_semesters([semester], ug=ug, grad=grad, output_dir=output_dir)
+    
+    def scrape_semesters(self, semesters, ug=False, grad=False, output_dir='/data'):
+        """Scrape several semesters, fetching every page concurrently up front"""
+        if ug or grad:
+            print(f"Fetching course pages for {', '.join(semesters)}...")
+        results = self.fetch_course_results(semesters, ug=ug, grad=grad, commit=False)
+        pages = {key: result.text for key, result in results.items()}
+        for semester in semesters:
+            if self.semester_unchanged(semester, results, output_dir):
+                print(f"Course pages for {semester} unchanged since last scrape, skipping")
+            else:
+                self.process_semester_pages(semester, pages, output_dir)
+            # Only pages whose department files were written count as seen
+            self.commit_results(results, semester)
+    
+    def process_semester_pages(self, semester, pages, output_dir):
+        """Stream fetched pages for one semester into its department files
         
-        # Scrape undergraduate courses if requested
-        if ug:
-            print(f"Scraping undergraduate courses for {semester}...")
-            ug_html = self.fetch_course_page(semester, ug=True)
-            ug_courses = self.parse_course_data(ug_html)
-            all_courses.extend(ug_courses)
-            print(f"Found {len(ug_courses)} undergraduate courses")
-        
-        # Scrape graduate courses if requested
-        if grad:
-            print(f"Scraping graduate courses for {semester}...")
-            grad_html = self.fetch_course_page(semester, ug=False)
-            grad_courses = self.parse_course_data(grad_html)
-            all_courses.extend(grad_courses)
-            print(f"Found {len(grad_courses)} graduate courses")
-        
-        # Organize and save courses using object model
-        if all_courses:
-            # Convert to Offering objects
-            offerings = self.parse_offerings_from_courses(all_courses)
-            
-            # Create Department objects
-            departments = self.create_semester_departments(offerings)
-            
-            # Save using object serialization
-            self.save_semester_departments(departments, output_dir, semester)
-            
-            semester_dir = os.path.join(output_dir, 'semesters', semester.replace('/', '_'))
-            print(f"Successfully scraped {len(all_courses)} total courses")
-            print(f"Created {len(offerings)} course offerings")
-            print(f"Organized into {len(departments)} departments")
+        Rows are parsed lazily, merged across the UG and grad pages in
+        department order and grouped with dict indexes. Each department file
+        is written as soon as the stream moves past that department, so only
+        one department is held in memory at a time.
+        """
+        level_rows = {}
+        for level in ('ug', 'grad'):
+            html = pages.get((semester, level))
+            if html is not None:
+                level_rows[level] = self.iter_course_data(html)
+        return self.write_semester_rows(semester, level_rows, output_dir)
+    
+    def write_semester_rows(self, semester, level_rows, output_dir):
+        """Group course rows ({'ug' | 'grad': rows}) into department files
+        
+        Returns the set of department codes whose files were written.
+        """
+        counts = {}
+        streams = []
+        for level, rows in level_rows.items():
+            counts[level] = 0
+            streams.append(self._count_rows(self.iter_offerings(rows), counts, level))
+        
+        semester_dir = self.semester_directory(output_dir, semester)
+        unchanged_before = self.writer.unchanged
+        changed = set()
+        
+        def save(directory, dept_code, department):
+            if self.save_semester_department(directory, dept_code, department):
+                changed.add(dept_code)
+        
+        writer = SemesterDepartmentWriter(semester_dir, save)
+        for offering in heapq.merge(*streams, key=lambda offering: offering.department or ''):
+            writer.add(offering)
+        writer.close()
+        
+        for level, label in (('ug', 'undergraduate'), ('grad', 'graduate')):
+            if level in counts:
+                print(f"Found {counts[level]} {label} courses for {semester}")
+        
+        total = sum(counts.values())
+        if total:
+            print(f"Successfully scraped {total} total courses")
+            print(f"Created {total} course offerings")
+            print(f"Organized into {len(writer.written)} departments "
+                  f"({self.writer.unchanged - unchanged_before} files already up to date)")
             print(f"JSON files saved to: {semester_dir}")
         else:
-            print("No courses found or no course types selected")
\ No newline at end of file
+            print("No courses found or no course types selected")
+        return changed
+    
+    def _count_rows(self, items, counts, key):
+        for item in items:
+            counts[key] += 1
+            yield item
+
+
+class DepartmentGrouper:
+    """Groups offerings into Department/Course objects with dict lookups"""
+    
+    def __init__(self):
+        self.departments = {}
+        self._courses = {}  # dept_code -> {course_number: Course}
+    
+    def add(self, offering):
+        """Add an offering under its department and course"""
+        dept_code = offering.department
+        course_number = offering.number
+        
+        # Initialize department if needed
+        if dept_code not in self.departments:
+            self.departments[dept_code] = Department(name=f"{dept_code} Department")
+            self._courses[dept_code] = {}
+        
+        courses = self._courses[dept_code]
+        course = courses.get(course_number)
+        if course is None:
+            # Create new course with empty offerings list
+            course = Course(number=course_number, title=f"{dept_code} {course_number}")
+            course.offerings = []
+            self.departments[dept_code].courses.append(course)
+            courses[course_number] = course
+        
+        # Add offering to course
+        course.offerings.append(offering)
+    
+    def adopt(self, dept_code, department):
+        """Resume grouping into an existing department"""
+        self.departments[dept_code] = department
+        self._courses[dept_code] = {}
+        for course in department.courses:
+            if not hasattr(course, 'offerings'):
+                course.offerings = []
+            self._courses[dept_code][course.number] = course
+    
+    def pop(self, dept_code):
+        """Remove and return a finished department"""
+        del self._courses[dept_code]
+        return self.departments.pop(dept_code)
+
+
+class SemesterDepartmentWriter:
+    """Writes each department file as soon as the offering stream leaves it
+    
+    Offerings are expected in department order. If a department shows up
+    again after it was written, its file is read back and extended, so
+    unsorted input still produces complete files.
+    """
+    
+    def __init__(self, semester_dir, save):
+        self.semester_dir = semester_dir
+        self.save = save
+        self.grouper = DepartmentGrouper()
+        self.current = None
+        self.written = set()
+        os.makedirs(semester_dir, exist_ok=True)
+    
+    def add(self, offering):
+        dept_code = offering.department
+        if dept_code != self.current:
+            self.flush()
+            self.current = dept_code
+            if dept_code in self.written:
+                self.grouper.adopt(dept_code, self._reload(dept_code))
+        self.grouper.add(offering)
+    
+    def flush(self):
+        """Write the department currently being grouped"""
+        if self.current in self.grouper.departments:
+            self.save(self.semester_dir, self.current, self.grouper.pop(self.current))
+            self.written.add(self.current)
+    
+    def close(self):
+        self.flush()
+        self.current = None
+    
+    def _reload(self, dept_code):
+        with open(os.path.join(self.semester_dir, f"{dept_code}.json"), 'r') as f:
+            data = json.load(f)
+        return Department(
+            name=data.get('name'),
+            mission_statement=data.get('mission_statement'),
+            office=data.get('office'),
+            course_listing_url=data.get('course_listing_url'),
+            course_descriptions_url=data.get('course_descriptions_url'),
+            courses=[Course.from_dict(course) for course in data.get('courses', [])]
+        )
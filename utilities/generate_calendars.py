@@ -7,6 +7,7 @@ Run this before deployment to convert PDFs to JSON format.
 Usage:
     python generate_calendars.py
     python generate_calendars.py --input-dir ./custom_pdfs --output-dir ./custom_calendars
+    python generate_calendars.py --input-dir ./archive --workers 4 --force
 """
 
 import argparse
@@ -15,82 +16,14 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 from scheduler import generate_calendar_json
+from calendar_json.provenance import CalendarIndex
 
 def check_tbd_items(output_dir):
-    """Check generated JSON files for TBD items and report them"""
-    tbd_items = []
-    
+    """Report TBD items of the generated JSON files from the maintained calendar index"""
     if not os.path.exists(output_dir):
-        return tbd_items
-    
-    import json
-    json_files = [f for f in os.listdir(output_dir) if f.endswith('.json')]
-    
-    for json_file in json_files:
-        json_path = os.path.join(output_dir, json_file)
-        try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-            
-            file_tbds = []
-            
-            # Check for parsing errors
-            if 'error' in data:
-                file_tbds.append({
-                    'field': 'parsing_error',
-                    'location': 'root',
-                    'suggestion': f'Fix PDF parsing error: {data["error"]}'
-                })
-            
-            # Check each semester
-            for semester_key, semester_data in data.get('semesters', {}).items():
-                if semester_data.get('first_day') == 'TBD':
-                    file_tbds.append({
-                        'field': 'first_day',
-                        'location': semester_key,
-                        'suggestion': 'Set first day of classes in YYYY-MM-DD format'
-                    })
-                
-                if semester_data.get('last_day') == 'TBD':
-                    file_tbds.append({
-                        'field': 'last_day', 
-                        'location': semester_key,
-                        'suggestion': 'Set last day of classes in YYYY-MM-DD format'
-                    })
-                
-                # Check events for TBD dates
-                for event in semester_data.get('events', []):
-                    if event.get('date') == 'TBD':
-                        file_tbds.append({
-                            'field': 'event_date',
-                            'location': f"{semester_key}/events",
-                            'suggestion': f'Set date for event "{event.get("name", "Unknown")}"'
-                        })
-                    
-                    if event.get('date_range') and 'TBD' in str(event.get('date_range')):
-                        file_tbds.append({
-                            'field': 'event_date_range',
-                            'location': f"{semester_key}/events", 
-                            'suggestion': f'Set date range for event "{event.get("name", "Unknown")}"'
-                        })
-            
-            if file_tbds:
-                tbd_items.append({
-                    'file': json_file,
-                    'items': file_tbds
-                })
-                
-        except Exception as e:
-            tbd_items.append({
-                'file': json_file,
-                'items': [{
-                    'field': 'file_error',
-                    'location': 'file',
-                    'suggestion': f'Fix JSON file error: {e}'
-                }]
-            })
+        return []
     
-    return tbd_items
+    return CalendarIndex(output_dir).tbd_report()
 
 def write_tbd_report(tbd_items, output_dir, preservation_notes=None):
     """Write TBD items and preservation notes to a report file"""
@@ -160,6 +93,17 @@ def main():
     parser.add_argument('--no-tbd-report',
                        action='store_true', 
                        help='Skip TBD item reporting')
+    parser.add_argument('--processes',
+                       type=int,
+                       default=None,
+                       help='Split pages of multi-page PDFs across this many processes')
+    parser.add_argument('--workers',
+                       type=int,
+                       default=None,
+                       help='Parse this many PDFs at once in a process pool')
+    parser.add_argument('--force',
+                       action='store_true',
+                       help='Regenerate PDFs whose content hash matches existing outputs')
     
     args = parser.parse_args()
     
@@ -173,7 +117,10 @@ def main():
     
     try:
         from scheduler import generate_calendar_json
-        generate_calendar_json(args.input_dir, args.output_dir)
+        if args.processes:
+            from pdf.pdf_extractor import EXTRACTION_CACHE
+            EXTRACTION_CACHE.processes = args.processes
+        generate_calendar_json(args.input_dir, args.output_dir, workers=args.workers, force=args.force)
         
         # Get preservation notes if any
         preservation_notes = getattr(generate_calendar_json, '_preservation_notes', [])
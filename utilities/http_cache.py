@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""
+On-disk HTTP cache for the scrapers
+
+Stores each response body next to a small metadata file holding its ETag,
+Last-Modified and SHA-256 so the next fetch can be conditional. Entries
+are keyed by a hash of the URL; files use .body/.meta suffixes so they are
+never mistaken for department or semester JSON.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+DEFAULT_CACHE_DIRNAME = '.http_cache'
+
+
+def body_hash(text):
+    """SHA-256 of a response body"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class CacheEntry:
+    """Cached response for one URL"""
+
+    def __init__(self, url, body, etag=None, last_modified=None, content_hash=None, fetched_at=None):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash or body_hash(body)
+        self.fetched_at = fetched_at
+
+    def to_dict(self):
+        """Serialize metadata (without the body) to dictionary"""
+        return {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_hash": self.content_hash,
+            "fetched_at": self.fetched_at
+        }
+
+
+class HTTPCache:
+    """Directory of cached response bodies and their validators"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.body', base + '.meta'
+
+    def get(self, url):
+        """Return the CacheEntry for url, or None if missing or unreadable"""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            # newline='' keeps CRLF bodies byte-for-byte, so their hash still matches
+            with open(body_path, 'r', encoding='utf-8', newline='') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or meta.get('content_hash') != body_hash(body):
+            return None
+        return CacheEntry(url, body, meta.get('etag'), meta.get('last_modified'),
+                          meta.get('content_hash'), meta.get('fetched_at'))
+
+    def conditional_headers(self, entry):
+        """If-None-Match / If-Modified-Since headers for a cached entry"""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def put(self, url, body, headers):
+        """Store a response body with its validators; returns the new CacheEntry"""
+        entry = CacheEntry(url, body, headers.get('ETag'), headers.get('Last-Modified'),
+                           fetched_at=time.time())
+        os.makedirs(self.cache_dir, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        # Body first, then metadata: a crash in between leaves a hash mismatch, not a stale match
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps(entry.to_dict()))
+        return entry
+
+    def touch(self, entry):
+        """Record that a cached entry was revalidated"""
+        entry.fetched_at = time.time()
+        _, meta_path = self._paths(entry.url)
+        self._write(meta_path, json.dumps(entry.to_dict()))
+
+    def _write(self, path, content):
+        # Temp file then rename, so readers never see a half-written file
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        os.replace(temp_path, path)
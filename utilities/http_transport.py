@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+
+"""
+Shared HTTP transport for the scrapers
+
+Wraps a pooled requests.Session with timeouts, retry with exponential
+backoff, a per-host token-bucket rate limit and bounded concurrent fetching.
+With an HTTPCache attached, requests are conditional and results report
+whether the page changed since the last run. Callers that derive files from
+a page fetch it with commit=False and commit() the result once those files
+are written, so a failed run never leaves the page looking unchanged.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utilities.http_cache import body_hash
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `burst` saved"""
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = self._clock()
+                self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self._sleep(wait)
+
+
+class FetchResult:
+    """Outcome of a single fetch
+
+    not_modified is True when the server answered 304 and text came from the
+    cache; unchanged is True when the body matches the cached copy either way.
+    pending_headers holds the response headers of a body fetched with
+    commit=False until ScrapeTransport.commit() caches it.
+    """
+
+    def __init__(self, url, status_code, text, headers=None, not_modified=False, unchanged=False):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.not_modified = not_modified
+        self.unchanged = unchanged
+        self.pending_headers = None
+
+
+class ScrapeTransport:
+    """Pooled HTTP client with retries, per-host rate limiting and bounded parallelism"""
+
+    def __init__(self, max_workers=4, timeout=(5, 30), retries=3, backoff_factor=0.5,
+                 rate_limit=2.0, burst=2, session=None, user_agent=None, cache=None):
+        """
+        Args:
+            max_workers: Maximum concurrent requests in fetch_many
+            timeout: requests timeout (connect, read) in seconds
+            retries: Retries after the first attempt for connection errors and 429/5xx
+            backoff_factor: Base delay in seconds; attempt n waits backoff_factor * 2**n
+            rate_limit: Requests per second allowed per host (0 disables)
+            burst: Requests per host allowed back to back before throttling
+            session: Optional requests.Session to use instead of creating one
+            user_agent: Optional User-Agent header
+            cache: Optional HTTPCache for conditional requests
+        """
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.session = session or self._create_session(user_agent)
+        self.cache = cache
+        self._limiters = {}
+        self._limiters_lock = threading.Lock()
+
+    def _create_session(self, user_agent):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if user_agent:
+            session.headers['User-Agent'] = user_agent
+        return session
+
+    def _limiter(self, url):
+        host = urlsplit(url).netloc
+        with self._limiters_lock:
+            if host not in self._limiters:
+                self._limiters[host] = TokenBucket(self.rate_limit, self.burst)
+            return self._limiters[host]
+
+    def _backoff(self, attempt, response=None):
+        delay = self.backoff_factor * (2 ** attempt)
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        time.sleep(delay)
+
+    def request(self, url, headers=None):
+        """
+        GET a URL with rate limiting and retries
+
+        Returns:
+            requests.Response for the final attempt
+
+        Raises:
+            requests.RequestException: If every attempt fails
+        """
+        limiter = self._limiter(url)
+        for attempt in range(self.retries + 1):
+            limiter.acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+                self._backoff(attempt)
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                self._backoff(attempt, response)
+                continue
+            return response
+
+    def get(self, url, commit=True):
+        """
+        Fetch a URL and return a FetchResult, raising for HTTP errors
+
+        Args:
+            url: URL to fetch
+            commit: Cache a new body right away; with False the body is only
+                cached by a later commit(result)
+        """
+        if self.cache is None:
+            response = self.request(url)
+            response.raise_for_status()
+            return FetchResult(url, response.status_code, response.text, dict(response.headers))
+
+        cached = self.cache.get(url)
+        response = self.request(url, headers=self.cache.conditional_headers(cached))
+        if response.status_code == 304 and cached is not None:
+            self.cache.touch(cached)
+            return FetchResult(url, 304, cached.body, dict(response.headers), not_modified=True, unchanged=True)
+
+        response.raise_for_status()
+        text = response.text
+        unchanged = cached is not None and cached.content_hash == body_hash(text)
+        result = FetchResult(url, response.status_code, text, dict(response.headers), unchanged=unchanged)
+        result.pending_headers = dict(response.headers)
+        if commit:
+            self.commit(result)
+        return result
+
+    def commit(self, result):
+        """Cache the body of a result fetched with commit=False (no-op otherwise)"""
+        if self.cache is not None and result.pending_headers is not None:
+            self.cache.put(result.url, result.text, result.pending_headers)
+            result.pending_headers = None
+
+    def fetch_many(self, urls, commit=True):
+        """
+        Fetch several URLs concurrently with at most max_workers in flight
+
+        commit is passed to get() for each URL.
+
+        Returns:
+            Dict of url -> FetchResult, or the exception raised for that url
+        """
+        urls = list(dict.fromkeys(urls))
+        results = dict(self.iter_fetch(urls, commit=commit))
+        return {url: results[url] for url in urls}
+
+    def iter_fetch(self, urls, max_workers=None, commit=True):
+        """
+        Fetch several URLs concurrently, yielding each as soon as it completes
+
+        commit is passed to get() for each URL.
+
+        Yields:
+            (url, FetchResult or the exception raised for that url)
+        """
+        urls = list(dict.fromkeys(urls))
+
+        def fetch(url):
+            try:
+                return url, self.get(url, commit=commit)
+            except requests.RequestException as e:
+                return url, e
+
+        workers = min(max_workers or self.max_workers, max(len(urls), 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch, url) for url in urls]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
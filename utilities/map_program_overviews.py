@@ -2,173 +2,82 @@
 
 """
 Map program overviews to department mission statements
+
+DepartmentDataLoader already fills missing mission statements from
+program_overviews.json when departments are loaded (see
+core.program_mapping). This script writes those statements into the
+department files so they survive without the overviews file.
 """
 
 import json
 import os
-import re
+import sys
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.file_writer import AtomicWriter
+from core.department_manifest import DepartmentManifest
+from core.program_mapping import PROGRAM_DEPARTMENTS, ProgramMatcher, department_overviews
+
+PROGRAM_OVERVIEWS_FILE = 'data/program_overviews.json'
 
-def load_program_overviews():
+def load_program_overviews(path=PROGRAM_OVERVIEWS_FILE):
     """Load program overviews from JSON file"""
-    with open('data/program_overviews.json', 'r') as f:
+    with open(path, 'r') as f:
         return json.load(f)
 
 def create_program_to_department_mapping():
     """Create mapping between program names and department codes"""
-    mapping = {
-        # Accounting programs
-        'Accounting': 'ACC',
-        '3+1 Accounting Program': 'ACC',
-        'Master of Science in Accounting': 'ACC',
-        
-        # Business programs
-        'Finance': 'FIN',
-        'Management': 'MGT',
-        'Marketing': 'MKG',
-        'Master of Business Administration': 'BUS',
-        'Marketing Food and Consumer Packaged Goods': 'MKG',
-        'Supply Chain Management': 'BUS',
-        'Food Industry Management': 'MHR',
-        
-        # Biology/Science programs
-        'Biology and Biotechnology': 'BIO',
-        'Chemistry and Biochemistry': 'CHE',
-        'Environmental Science': 'ENV',
-        'Mathematics': 'MAT',
-        'Actuarial Science': 'MAT',
-        'Pre-Health Professions': 'BIO',
-        
-        # Computer Science
-        'Computer and Information Sciences': 'CIS',
-        'M.S. Information Security and Digital Forensics Online (ISDF)': 'CIS',
-        
-        # Education programs
-        'Adolescence Education (Grades 7-12)': 'EDU',
-        'Childhood and Middle Childhood Education': 'EDU',
-        'Early Childhood and Childhood Education': 'EDU',
-        'Middle Childhood and Adolescence Education': 'EDU',
-        'Special Education': 'EDU',
-        'Master of Science in Elementary and Secondary Education Online': 'EDU',
-        'Master of Science in Special Education Online': 'EDU',
-        'Master of Science in Literacy and English Language Learners Online': 'EDU',
-        'Master of Science in Theatre Education Online': 'THR',
-        'Teaching English to Speakers of Other Languages': 'ESL',
-        
-        # Liberal Arts programs
-        'English': 'ENG',
-        'History': 'HIS',
-        'Philosophy': 'PHI',
-        'Political Science': 'POL',
-        'Psychology': 'PSY',
-        'Sociology': 'SOC',
-        'Religious Studies': 'REL',
-        'French': 'FRE',
-        'Spanish': 'SPA',
-        'Modern and Classical Languages': 'FRE',  # Could also be SPA, LAT, etc.
-        
-        # Communication and Media
-        'Communication and Media Studies': 'CMS',
-        'Social Media, Digital Marketing, and Artificial Intelligence': 'CMS',
-        
-        # Criminal Justice
-        'Criminology and Criminal Justice': 'CRJ',
-        'M.S. Criminal Justice Administration': 'CRJ',
-        
-        # Nursing
-        'Nursing': 'NUR',
-        'ASDBS Nursing': 'NUR',
-        'Nursing RPN to BS': 'NUR',
-        'RN to BS Completion Program': 'NUR',
-        'Family Nurse Practitioner': 'NUR',
-        'Master of Science in Nursing Education': 'NUR',
-        
-        # Theatre
-        'Theatre Studies and Fine Arts': 'THR',
-        
-        # Economics
-        'Economics': 'ECO',
-        
-        # Fine Arts
-        'Art History with Museum Studies': 'FAA',
-        
-        # Hotel/Tourism Management
-        'Hotel and Restaurant Management': 'MHR',
-        'Tourism and Event Management': 'TRM',
-        'Sport and Recreation Management': 'SPM',
-        'Master of Science in Sports Management': 'SPM',
-        
-        # Social Work
-        'Social Work': 'SWK',
-        
-        # Gerontology
-        'Gerontology': 'GRN',
-        
-        # International Studies
-        'International Studies': 'INT',
-        
-        # Liberal Arts
-        'Liberal Arts': 'LAM',
-        'General Studies': 'LAM',
-        
-        # Pre-professional
-        'Pre-Law': 'POL',  # Often housed in political science
-        
-        # Psychology/Counseling
-        'Clinical Mental Health Counseling': 'PSY',
-        'Master of Science in School Psychology': 'PSY',
-        
-        # Minor programs - map to related departments
-        'American Sign Language and Deaf Studies (Minor)': 'ASL',
-        'Africana/Black Studies (Minor)': 'SOC',  # Often in sociology
-        'Film Studies (Minor)': 'CMS',  # Often in communication
-        'Women\'s Studies (Minor)': 'SOC',  # Often in sociology
-    }
-    
-    return mapping
-
-def update_department_mission_statements():
-    """Update department JSON files with mission statements from program overviews"""
-    program_overviews = load_program_overviews()
-    mapping = create_program_to_department_mapping()
-    
-    departments_dir = 'data/departments'
+    return dict(PROGRAM_DEPARTMENTS)
+
+def update_department_mission_statements(program_overviews=None, data_dir='data', writer=None):
+    """Update department JSON files with mission statements from program overviews
+
+    All programs are matched in one pass and each department file is read
+    and written at most once, however many programs map to it.
+    """
+    if program_overviews is None:
+        program_overviews = load_program_overviews(os.path.join(data_dir, os.path.basename(PROGRAM_OVERVIEWS_FILE)))
+
+    manifest = DepartmentManifest(data_dir)
+    department_names = {entry.code: entry.name for entry in manifest.all_entries() if entry.name}
+    matcher = ProgramMatcher(department_names, create_program_to_department_mapping())
+    chosen = department_overviews(program_overviews, matcher)
+    writer = writer or AtomicWriter()
     updated_count = 0
-    
-    for program_name, program_data in program_overviews.items():
-        if program_name in mapping:
-            dept_code = mapping[program_name]
-            dept_file = os.path.join(departments_dir, f"{dept_code}.json")
-            
-            if os.path.exists(dept_file):
-                # Read department data
-                with open(dept_file, 'r') as f:
-                    dept_data = json.load(f)
-                
-                # Update mission statement if it's currently null/empty
-                if not dept_data.get('mission_statement'):
-                    dept_data['mission_statement'] = program_data['overview']
-                    
-                    # Write updated data
-                    with open(dept_file, 'w') as f:
-                        json.dump(dept_data, f, indent=4)
-                    
-                    print(f"Updated {dept_code} with mission statement from '{program_name}'")
-                    updated_count += 1
-                else:
-                    print(f"Skipped {dept_code} - mission statement already exists")
-            else:
-                print(f"Department file not found: {dept_file}")
-        else:
+
+    for dept_code, (match, overview) in chosen.items():
+        entry = manifest.get(dept_code)
+        if entry is None:
+            print(f"Department file not found: {dept_code}.json")
+            continue
+
+        # Update mission statement if it's currently null/empty
+        if entry.mission_statement:
+            print(f"Skipped {dept_code} - mission statement already exists")
+            continue
+
+        with open(entry.path, 'r') as f:
+            dept_data = json.load(f)
+        dept_data['mission_statement'] = overview
+        writer.write_json(entry.path, dept_data, indent=4)
+        print(f"Updated {dept_code} with mission statement from '{match.program}' ({match.method} match)")
+        updated_count += 1
+
+    matches = matcher.match_all(program_overviews)
+    for program_name in program_overviews:
+        if program_name not in matches:
             print(f"No mapping found for program: {program_name}")
-    
+
     print(f"\nUpdated {updated_count} department mission statements")
+    return updated_count
 
 def main():
-    if not os.path.exists('data/program_overviews.json'):
+    if not os.path.exists(PROGRAM_OVERVIEWS_FILE):
         print("data/program_overviews.json not found. Run scrape_program_overviews.py first.")
         return
-    
+
     update_department_mission_statements()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+"""
+Fast table row extraction for the course listing pages
+
+The listing page is one very large table, so building a full BeautifulSoup
+tree just to read every <tr> is the slowest step of a scrape. Two backends
+yield TableRow objects without a DOM:
+
+    lxml         iterparse over <tr> end events, clearing each row after use
+    html.parser  a streaming HTMLParser that emits rows as they close
+
+lxml is used when installed; html.parser needs only the standard library.
+"""
+
+from html.parser import HTMLParser
+from io import BytesIO
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - depends on environment
+    etree = None
+
+BACKENDS = ('lxml', 'html.parser')
+
+
+class TableRow:
+    """One <tr>: its classes and the text of each cell"""
+
+    __slots__ = ('classes', 'cells')
+
+    def __init__(self, classes, cells):
+        self.classes = classes
+        self.cells = cells
+
+    def has_class(self, names):
+        """True if the row carries any of the given classes"""
+        return any(name in self.classes for name in names)
+
+
+def default_backend():
+    """'lxml' if it is importable, otherwise 'html.parser'"""
+    return 'lxml' if etree is not None else 'html.parser'
+
+
+def iter_table_rows(html, cell_tags=('td',), backend=None):
+    """
+    Yield a TableRow for every <tr> in html
+
+    Args:
+        html: Page content as str or bytes
+        cell_tags: Tags treated as cells, in document order
+        backend: 'lxml', 'html.parser' or None for the default
+
+    Raises:
+        ValueError: If the backend is unknown or lxml is not installed
+    """
+    backend = backend or default_backend()
+    if backend == 'lxml':
+        if etree is None:
+            raise ValueError("lxml backend requested but lxml is not installed")
+        return _iter_rows_lxml(html, cell_tags)
+    if backend == 'html.parser':
+        return _iter_rows_html_parser(html, cell_tags)
+    raise ValueError(f"Unknown row extractor backend: {backend}")
+
+
+def _iter_rows_lxml(html, cell_tags):
+    data = html.encode('utf-8') if isinstance(html, str) else html
+    for _, element in etree.iterparse(BytesIO(data), events=('end',), tag='tr', html=True,
+                                      encoding='utf-8', recover=True):
+        cells = [''.join(cell.itertext()) for cell in element.iter(*cell_tags)]
+        yield TableRow(element.get('class', '').split(), cells)
+        # Free the finished row and anything before it
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+class _RowParser(HTMLParser):
+    """Collects rows into a list that the caller drains between feeds"""
+
+    def __init__(self, cell_tags):
+        super().__init__(convert_charrefs=True)
+        self.cell_tags = set(cell_tags)
+        self.rows = []
+        self._classes = None
+        self._cells = None
+        self._text = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self._close_row()
+            classes = dict(attrs).get('class') or ''
+            self._classes = classes.split()
+            self._cells = []
+        elif tag in self.cell_tags and self._cells is not None:
+            self._close_cell()
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if tag in self.cell_tags:
+            self._close_cell()
+        elif tag in ('tr', 'table', 'tbody', 'thead', 'tfoot'):
+            self._close_row()
+
+    def handle_data(self, data):
+        if self._text is not None:
+            self._text.append(data)
+
+    def _close_cell(self):
+        if self._text is not None:
+            self._cells.append(''.join(self._text))
+            self._text = None
+
+    def _close_row(self):
+        if self._cells is not None:
+            self._close_cell()
+            self.rows.append(TableRow(self._classes, self._cells))
+            self._classes = None
+            self._cells = None
+
+    def close(self):
+        super().close()
+        self._close_row()
+
+
+def _iter_rows_html_parser(html, cell_tags, chunk_size=65536):
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    parser = _RowParser(cell_tags)
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        if parser.rows:
+            rows, parser.rows = parser.rows, []
+            yield from rows
+    parser.close()
+    yield from parser.rows
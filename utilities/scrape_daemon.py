@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+
+"""
+Long-running scraper that keeps configured semesters up to date
+
+Every interval the daemon fetches each semester's listing pages through the
+cached transport, hashes every row and compares the hashes with the last
+run. Only when rows changed are department files rewritten, seat
+availability changes appended to a per-semester log, and the API asked to
+reload the affected departments.
+
+    python utilities/scrape_daemon.py --semesters 25/FA,25/SU --ug --grad \\
+        --output-dir data --interval 900 --api-url http://127.0.0.1:5000
+
+The reload call sends the API's admin token (--api-token, or the
+ADMIN_TOKEN environment variable).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import requests
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.file_writer import AtomicWriter, CHANGE_MANIFEST_NAME
+from core.offering import Offering
+from utilities.course_scraper import CourseScraperCLI
+from utilities.http_cache import HTTPCache, DEFAULT_CACHE_DIRNAME
+from utilities.http_transport import ScrapeTransport
+
+AVAILABILITY_DIRNAME = 'availability'
+ROW_FIELDS = ('number', 'name', 'delivery_type', 'days', 'start_time', 'end_time',
+              'designation', 'availability', 'credits')
+
+
+def row_hash(row):
+    """Short, stable hash of a listing row"""
+    joined = '\x1f'.join(row.get(field) or '' for field in ROW_FIELDS)
+    return hashlib.blake2b(joined.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def semester_key(semester):
+    """Directory-style semester code ('25/FA' -> '25_FA')"""
+    return semester.replace('/', '_')
+
+
+class AvailabilityLog:
+    """Append-only seat availability time series for one semester
+
+    Each line is '<unix seconds>\\t<section>\\t<availability>' and is only
+    written when a section's availability differs from its previous value.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def append(self, timestamp, changes):
+        """Append (section, availability) pairs observed at timestamp"""
+        if not changes:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'a') as f:
+            for section, availability in changes:
+                f.write(f"{int(timestamp)}\t{section}\t{availability}\n")
+
+    def series(self, section=None):
+        """Read the log as {section: [(timestamp, availability), ...]}"""
+        result = {}
+        try:
+            with open(self.path, 'r') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split('\t')
+                    if len(parts) != 3 or (section and parts[1] != section):
+                        continue
+                    result.setdefault(parts[1], []).append((int(parts[0]), parts[2]))
+        except OSError:
+            pass
+        return result
+
+
+class RowHashState:
+    """Last seen row hash and availability per section, persisted between runs"""
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = {}  # section -> [hash, availability]
+        try:
+            with open(path, 'r') as f:
+                self.rows = json.load(f)
+        except (OSError, ValueError):
+            self.rows = {}
+
+    def diff(self, rows):
+        """
+        Compare a full listing against the stored state and adopt it
+
+        Returns:
+            (changed_sections, removed_sections, availability_changes)
+        """
+        changed = []
+        availability_changes = []
+        current = {}
+        for row in rows:
+            section = row['number']
+            digest = row_hash(row)
+            availability = row.get('availability') or ''
+            current[section] = [digest, availability]
+            previous = self.rows.get(section)
+            if previous and previous[0] == digest:
+                continue
+            changed.append(section)
+            if not previous or previous[1] != availability:
+                availability_changes.append((section, availability))
+        removed = [section for section in self.rows if section not in current]
+        self.rows = current
+        return changed, removed, availability_changes
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        AtomicWriter().write_text(self.path, json.dumps(self.rows))
+
+
+class ScrapeDaemon:
+    """Periodically refreshes semesters and reports what changed"""
+
+    def __init__(self, output_dir, semesters, ug=True, grad=True, scraper=None,
+                 api_url=None, api_token=None, interval=900, clock=time.time, sleep=time.sleep):
+        self.output_dir = output_dir
+        self.semesters = semesters
+        self.ug = ug
+        self.grad = grad
+        self.scraper = scraper or CourseScraperCLI()
+        self.api_url = api_url.rstrip('/') if api_url else None
+        self.api_token = api_token
+        self.interval = interval
+        self._clock = clock
+        self._sleep = sleep
+        self._states = {}
+        # Semesters whose last write failed; their pages are re-parsed even if unchanged
+        self._failed = set()
+
+    def availability_log(self, semester):
+        return AvailabilityLog(os.path.join(self.output_dir, AVAILABILITY_DIRNAME, f"{semester_key(semester)}.tsv"))
+
+    def _state(self, semester):
+        if semester not in self._states:
+            path = os.path.join(self.output_dir, AVAILABILITY_DIRNAME, f".{semester_key(semester)}.hashes")
+            self._states[semester] = RowHashState(path)
+        return self._states[semester]
+
+    def refresh_semester(self, semester):
+        """
+        Fetch, diff and write one semester
+
+        Returns:
+            Sorted list of department codes whose files changed
+        """
+        # Pages are cached only once their rows are written, so "unchanged" means saved
+        results = self.scraper.fetch_course_results([semester], ug=self.ug, grad=self.grad, commit=False)
+        semester_dir = self.scraper.semester_directory(self.output_dir, semester)
+        if (semester not in self._failed and all(result.unchanged for result in results.values())
+                and os.path.isdir(semester_dir)):
+            return []
+
+        level_rows = {level: self.scraper.parse_course_data(result.text)
+                      for (_, level), result in results.items()}
+        all_rows = [row for rows in level_rows.values() for row in rows]
+
+        state = self._state(semester)
+        changed, removed, availability_changes = state.diff(all_rows)
+        if not changed and not removed and os.path.isdir(semester_dir):
+            self._failed.discard(semester)
+            self.scraper.commit_results(results)
+            return []
+
+        try:
+            written = self.scraper.write_semester_rows(semester, level_rows, self.output_dir)
+            state.save()
+        except Exception:
+            # diff() already adopted the new rows; reload the saved state so the next run retries
+            del self._states[semester]
+            self._failed.add(semester)
+            raise
+        self._failed.discard(semester)
+        self.scraper.commit_results(results)
+        # Logged last: a failed write leaves no availability line for data never saved
+        self.availability_log(semester).append(self._clock(), availability_changes)
+
+        affected = {Offering(section).department for section in changed + removed} | written
+        return sorted(code for code in affected if code)
+
+    def run_once(self):
+        """Refresh every semester once; returns {semester: affected departments}"""
+        report = {}
+        for semester in self.semesters:
+            try:
+                affected = self.refresh_semester(semester)
+            except requests.RequestException as e:
+                print(f"Error fetching {semester}: {e}")
+                continue
+            except Exception as e:
+                # A failed parse or write must not stop the other semesters (or later cycles)
+                print(f"Error refreshing {semester}: {e}")
+                continue
+            report[semester] = affected
+            if affected:
+                print(f"{semester}: {len(affected)} departments changed ({', '.join(affected)})")
+                self.notify(semester, affected)
+            else:
+                print(f"{semester}: no changes")
+        return report
+
+    def notify(self, semester, departments):
+        """Ask the API to reload indexes for the affected departments"""
+        if not self.api_url:
+            return False
+        try:
+            response = self.scraper.transport.session.post(
+                f"{self.api_url}/api/admin/reload",
+                json={'semester': semester_key(semester), 'departments': departments},
+                headers={'X-Admin-Token': self.api_token or ''},
+                timeout=10
+            )
+            response.raise_for_status()
+            return True
+        except requests.RequestException as e:
+            print(f"Could not notify API at {self.api_url}: {e}")
+            return False
+
+    def run(self, iterations=None):
+        """Refresh forever (or for iterations cycles), sleeping interval between cycles"""
+        cycle = 0
+        while iterations is None or cycle < iterations:
+            started = self._clock()
+            self.run_once()
+            cycle += 1
+            if iterations is None or cycle < iterations:
+                self._sleep(max(0, self.interval - (self._clock() - started)))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Keep semester offerings up to date')
+    parser.add_argument('--semesters', required=True, help='Comma-separated semester codes (e.g., 25/SU,25/FA)')
+    parser.add_argument('--ug', action='store_true', help='Include undergraduate courses')
+    parser.add_argument('--grad', action='store_true', help='Include graduate courses')
+    parser.add_argument('--output-dir', default='data', help='Data directory (default: data)')
+    parser.add_argument('--interval', type=float, default=900, help='Seconds between refreshes (default: 900)')
+    parser.add_argument('--api-url', help='API base URL to notify after changes (e.g., http://127.0.0.1:5000)')
+    parser.add_argument('--api-token', default=os.environ.get('ADMIN_TOKEN'),
+                        help="The API's ADMIN_TOKEN (default: $ADMIN_TOKEN)")
+    parser.add_argument('--once', action='store_true', help='Refresh once and exit')
+    parser.add_argument('--rate-limit', type=float, default=2.0,
+                        help='Requests per second allowed per host (default: 2.0)')
+    args = parser.parse_args(args)
+
+    semesters = [s.strip() for s in args.semesters.split(',') if s.strip()]
+    transport = ScrapeTransport(rate_limit=args.rate_limit,
+                                cache=HTTPCache(os.path.join(args.output_dir, DEFAULT_CACHE_DIRNAME)))
+    writer = AtomicWriter(manifest_path=os.path.join(args.output_dir, CHANGE_MANIFEST_NAME))
+    daemon = ScrapeDaemon(
+        args.output_dir, semesters,
+        ug=args.ug or not args.grad, grad=args.grad or not args.ug,
+        scraper=CourseScraperCLI(transport=transport, writer=writer),
+        api_url=args.api_url, api_token=args.api_token, interval=args.interval
+    )
+    daemon.run(iterations=1 if args.once else None)
+
+
+if __name__ == '__main__':
+    main()
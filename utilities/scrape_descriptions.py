@@ -8,10 +8,12 @@ Populates department JSON files with detailed course descriptions
 import argparse
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import json
 import os
 import re
 import sys
+import time
 
 # Add parent directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,53 +21,22 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.data_loader import DepartmentDataLoader
 from core.course import Course
 from core.department import Department
+from core.file_writer import AtomicWriter, CHANGE_MANIFEST_NAME, append_json_line
+from core.semester_merge import merge_sections
+from core.semester_registry import get_semester_registry
+from utilities.http_cache import HTTPCache, DEFAULT_CACHE_DIRNAME
+from utilities.http_transport import FetchResult, ScrapeTransport
+from utilities.row_extractor import BACKENDS, iter_table_rows
 
-class CourseDescriptionScraper:
-    """Scraper for course descriptions from catalog URLs"""
-    
-    def __init__(self, data_dir):
-        self.data_dir = data_dir
-        self.data_loader = DepartmentDataLoader(data_dir)
-    
-    def scrape_department_courses(self, dept_code):
-        """Scrape course descriptions for a specific department"""
-        print(f"Scraping courses for department: {dept_code}")
-        
-        # Load department data
-        dept = self.data_loader.load_department(dept_code)
-        if not dept:
-            print(f"Department {dept_code} not found")
-            return False
-            
-        if not dept.course_descriptions_url:
-            print(f"No course descriptions URL found for {dept_code}")
-            return False
-        
-        print(f"Fetching from: {dept.course_descriptions_url}")
-        
-        try:
-            response = requests.get(dept.course_descriptions_url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            courses_found = self.parse_course_descriptions(soup, dept_code)
-            
-            if courses_found:
-                # Update department with new courses
-                dept.courses.extend(courses_found)
-                self.save_department(dept, dept_code)
-                print(f"Successfully added {len(courses_found)} courses to {dept_code}")
-                return True
-            else:
-                print(f"No courses found for {dept_code}")
-                return False
-                
-        except requests.RequestException as e:
-            print(f"Error fetching {dept.course_descriptions_url}: {e}")
-            return False
-        except Exception as e:
-            print(f"Error parsing course descriptions for {dept_code}: {e}")
-            return False
+
+def parse_department_html(html, dept_code):
+    """Parse a catalog page into Course objects (top level so process pools can pickle it)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return CourseDescriptionParser().parse_course_descriptions(soup, dept_code)
+
+
+class CourseDescriptionParser:
+    """Stateless parsing of catalog HTML into Course objects"""
     
     def parse_course_descriptions(self, soup, dept_code):
         """Parse course descriptions from catalog HTML"""
@@ -166,39 +137,180 @@ class CourseDescriptionScraper:
                     )
         
         return None
+
+
+class CourseDescriptionScraper(CourseDescriptionParser):
+    """Scraper for course descriptions from catalog URLs"""
+    
+    def __init__(self, data_dir, transport=None, force=False, writer=None):
+        self.data_dir = data_dir
+        self.data_loader = DepartmentDataLoader(data_dir)
+        self.transport = transport or ScrapeTransport()
+        self.force = force
+        self.writer = writer or AtomicWriter()
+    
+    def scrape_department_courses(self, dept_code):
+        """Scrape course descriptions for a specific department"""
+        print(f"Scraping courses for department: {dept_code}")
+        
+        dept = self.load_scrapable_department(dept_code)
+        if not dept:
+            return False
+        
+        print(f"Fetching from: {dept.course_descriptions_url}")
+        
+        try:
+            result = self.transport.get(dept.course_descriptions_url, commit=False)
+            if self.page_unchanged(result, dept_code):
+                return True
+            courses_found = parse_department_html(result.text, dept_code)
+            return self.store_courses(dept, dept_code, courses_found, result)
+                
+        except requests.RequestException as e:
+            print(f"Error fetching {dept.course_descriptions_url}: {e}")
+            return False
+        except Exception as e:
+            print(f"Error parsing course descriptions for {dept_code}: {e}")
+            return False
+    
+    def load_scrapable_department(self, dept_code):
+        """Load a department, or None if it is missing or has no catalog URL"""
+        # Raw file contents: the department is saved back, so no derived mission statement
+        dept = self.data_loader.load_department(dept_code, enrich=False)
+        if not dept:
+            print(f"Department {dept_code} not found")
+            return None
+            
+        if not dept.course_descriptions_url:
+            print(f"No course descriptions URL found for {dept_code}")
+            return None
+        
+        return dept
+    
+    def page_unchanged(self, result, dept_code):
+        """True (and reported) if a catalog page matches the cached copy"""
+        if result.unchanged and not self.force:
+            print(f"Catalog page for {dept_code} unchanged since last scrape, skipping")
+            return True
+        return False
+    
+    def store_courses(self, dept, dept_code, courses_found, result=None):
+        """Add parsed courses to a department and save it
+        
+        The catalog page (result) is cached only once the department is saved,
+        so a page that failed to parse or store is scraped again next run.
+        """
+        if courses_found:
+            # Update department with new courses
+            dept.courses.extend(courses_found)
+            self.save_department(dept, dept_code)
+            if result is not None:
+                self.transport.commit(result)
+            print(f"Successfully added {len(courses_found)} courses to {dept_code}")
+            return True
+        else:
+            print(f"No courses found for {dept_code}")
+            return False
     
     def save_department(self, dept, dept_code):
         """Save updated department data to JSON file"""
         dept_file = os.path.join(self.data_dir, 'departments', f"{dept_code}.json")
         
-        with open(dept_file, 'w') as f:
-            f.write(dept.to_json())
+        return self.writer.write_text(dept_file, dept.to_json())
     
-    def scrape_all_departments(self):
-        """Scrape course descriptions for all departments"""
+    def scrape_all_departments(self, workers=None, parse_processes=None):
+        """Scrape course descriptions for all departments concurrently
+        
+        Catalog pages are fetched on a thread pool of `workers` threads (default:
+        the transport's max_workers) under the transport's per-host rate limit.
+        Each page is handed to a process pool for parsing as soon as it arrives,
+        so parsing overlaps with fetches still in flight. parse_processes=0
+        parses in this process instead.
+        """
         departments = self.data_loader.get_all_departments()
         successful = 0
+        unchanged = 0
         
         print(f"Starting course description scraping for {len(departments)} departments...")
         
+        pending = {}
         for dept_code in departments:
-            print(f"\n{'='*50}")
-            if self.scrape_department_courses(dept_code):
-                successful += 1
+            dept = self.load_scrapable_department(dept_code)
+            if dept:
+                pending[dept_code] = dept
+        
+        parse_pool = ProcessPoolExecutor(max_workers=parse_processes) if parse_processes != 0 else None
+        try:
+            with ThreadPoolExecutor(max_workers=workers or self.transport.max_workers) as fetch_pool:
+                fetches = {
+                    fetch_pool.submit(self.transport.get, dept.course_descriptions_url, commit=False): dept_code
+                    for dept_code, dept in pending.items()
+                }
+                parses = {}
+                results = {}
+                for future in as_completed(fetches):
+                    dept_code = fetches[future]
+                    try:
+                        result = future.result()
+                    except requests.RequestException as e:
+                        print(f"Error fetching {pending[dept_code].course_descriptions_url}: {e}")
+                        continue
+                    
+                    html = result.text
+                    results[dept_code] = result
+                    if self.page_unchanged(result, dept_code):
+                        successful += 1
+                        unchanged += 1
+                    elif parse_pool:
+                        parses[parse_pool.submit(parse_department_html, html, dept_code)] = dept_code
+                    elif self._store_parsed(pending[dept_code], dept_code,
+                                            lambda: parse_department_html(html, dept_code), result):
+                        successful += 1
             
-            # Be respectful with requests
-            import time
-            time.sleep(1)
+            for future in as_completed(parses):
+                dept_code = parses[future]
+                if self._store_parsed(pending[dept_code], dept_code, future.result, results[dept_code]):
+                    successful += 1
+        finally:
+            if parse_pool:
+                parse_pool.shutdown()
         
         print(f"\n{'='*50}")
         print(f"Scraping complete! Successfully processed {successful}/{len(departments)} departments")
+        if unchanged:
+            print(f"{unchanged} departments were unchanged and skipped")
+    
+    def _store_parsed(self, dept, dept_code, get_courses, result=None):
+        try:
+            return self.store_courses(dept, dept_code, get_courses(), result)
+        except Exception as e:
+            print(f"Error parsing course descriptions for {dept_code}: {e}")
+            return False
 
 class CourseScheduleScraper:
     """Scraper for course schedule information from course listing"""
     
-    def __init__(self, data_dir):
+    # One JSON line per scrape run; not .json so data directory scans skip it.
+    # Compacted to its newest runs once it passes MERGE_REPORT_MAX_BYTES
+    MERGE_REPORT_LOG = '.merge_reports.jsonl'
+    MERGE_REPORT_MAX_BYTES = 1024 * 1024
+    
+    def __init__(self, data_dir, transport=None, force=False, parser_backend=None, writer=None):
         self.data_dir = data_dir
         self.base_url = "https://apps.niagara.edu/courses/index.php"
+        self.transport = transport
+        self.force = force
+        self.parser_backend = parser_backend
+        self.writer = writer or AtomicWriter()
+        self.last_merge_report = None
+    
+    def fetch_page(self, url):
+        """Fetch a page through the transport, or a plain GET when none is configured"""
+        if self.transport:
+            return self.transport.get(url, commit=False)
+        response = requests.get(url)
+        response.raise_for_status()
+        return FetchResult(url, response.status_code, response.text)
     
     def scrape_semester_schedule(self, semester):
         """Scrape schedule data for a specific semester"""
@@ -208,14 +320,18 @@ class CourseScheduleScraper:
         print(f"Fetching from: {url}")
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
+            result = self.fetch_page(url)
+            semester_dir = os.path.join(self.data_dir, 'semesters', semester)
+            if result.unchanged and not self.force and os.path.isdir(semester_dir):
+                print(f"Schedule page for {semester} unchanged since last scrape, skipping")
+                return True
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            courses = self.parse_schedule_data(soup)
+            courses = self.parse_schedule_data(result.text)
             
             if courses:
                 self.save_schedule_data(semester, courses)
+                if self.transport:
+                    self.transport.commit(result)
                 print(f"Successfully scraped {len(courses)} course sections for {semester}")
                 return True
             else:
@@ -229,15 +345,21 @@ class CourseScheduleScraper:
             print(f"Error parsing schedule for {semester}: {e}")
             return False
     
-    def parse_schedule_data(self, soup):
-        """Parse course schedule from HTML table"""
+    def parse_schedule_data(self, page):
+        """Parse course schedule from HTML table
+        
+        page may be raw HTML, which is read with the streaming row extractor,
+        or an already-built BeautifulSoup tree.
+        """
         courses_by_dept = {}
         
         # Look for table rows containing course data
-        rows = soup.find_all('tr')
+        if isinstance(page, (str, bytes)):
+            rows = (row.cells for row in iter_table_rows(page, cell_tags=('td', 'th'), backend=self.parser_backend))
+        else:
+            rows = (row.find_all(['td', 'th']) for row in page.find_all('tr'))
         
-        for row in rows:
-            cells = row.find_all(['td', 'th'])
+        for cells in rows:
             if len(cells) >= 8:  # Expected number of columns
                 course_data = self.extract_course_schedule(cells)
                 if course_data:
@@ -255,15 +377,17 @@ class CourseScheduleScraper:
             if len(cells) < 8:
                 return None
             
-            course_code = cells[0].get_text(strip=True)
-            course_name = cells[1].get_text(strip=True)
-            delivery_type = cells[2].get_text(strip=True)
-            days = cells[3].get_text(strip=True)
-            start_time = cells[4].get_text(strip=True)
-            end_time = cells[5].get_text(strip=True)
-            designation = cells[6].get_text(strip=True)
-            availability = cells[7].get_text(strip=True)
-            credits = cells[8].get_text(strip=True) if len(cells) > 8 else "3.00"
+            # Cells are BeautifulSoup tags or plain strings from the row extractor
+            texts = [cell.strip() if isinstance(cell, str) else cell.get_text(strip=True) for cell in cells[:9]]
+            course_code = texts[0]
+            course_name = texts[1]
+            delivery_type = texts[2]
+            days = texts[3]
+            start_time = texts[4]
+            end_time = texts[5]
+            designation = texts[6]
+            availability = texts[7]
+            credits = texts[8] if len(texts) > 8 else "3.00"
             
             # Parse department and course number
             match = re.match(r'^([A-Z]+)(\d+[A-Z]*)$', course_code)
@@ -297,6 +421,7 @@ class CourseScheduleScraper:
         """Save schedule data to semester JSON files"""
         semester_dir = os.path.join(self.data_dir, 'semesters', semester)
         os.makedirs(semester_dir, exist_ok=True)
+        reports = {}
         
         for dept_code, courses in courses_by_dept.items():
             dept_file = os.path.join(semester_dir, f"{dept_code}.json")
@@ -312,40 +437,36 @@ class CourseScheduleScraper:
             
             # Merge with new schedule data
             updated_courses = self.merge_course_data(existing_data, courses)
+            reports[dept_code] = self.last_merge_report
             
             # Save updated data
-            with open(dept_file, 'w') as f:
-                json.dump(updated_courses, f, indent=2)
-    
-    def merge_course_data(self, existing_courses, schedule_courses):
-        """Merge existing course data with new schedule information"""
-        # Create lookup for existing courses
-        existing_lookup = {course.get('number', ''): course for course in existing_courses}
-        
-        merged = []
+            self.writer.write_json(dept_file, updated_courses, indent=2)
         
-        # Add schedule courses with enhanced data
-        for schedule_course in schedule_courses:
-            course_number = schedule_course['number']
-            
-            # Start with schedule data
-            merged_course = schedule_course.copy()
-            
-            # Enhance with existing data if available
-            if course_number in existing_lookup:
-                existing = existing_lookup[course_number]
-                # Keep existing description and other data, but use schedule data for times
-                if 'description' in existing:
-                    merged_course['description'] = existing['description']
-            
-            merged.append(merged_course)
+        self.record_merge_reports(semester, reports)
+        return reports
+    
+    def record_merge_reports(self, semester, reports):
+        """Print a summary and append the per-department diff to the report log"""
+        added = sum(len(report.added) for report in reports.values())
+        removed = sum(len(report.removed) for report in reports.values())
+        changed = sum(len(report.changed) for report in reports.values())
+        print(f"{semester}: {added} sections added, {removed} removed, {changed} changed")
         
-        # Add any existing courses not found in schedule
-        for existing_course in existing_courses:
-            existing_number = existing_course.get('number', '')
-            if not any(sc['number'] == existing_number for sc in schedule_courses):
-                merged.append(existing_course)
+        entry = {
+            "semester": semester,
+            "time": time.time(),
+            "departments": {dept: report.to_dict() for dept, report in reports.items() if report.has_changes}
+        }
+        append_json_line(os.path.join(self.data_dir, self.MERGE_REPORT_LOG), entry, self.MERGE_REPORT_MAX_BYTES)
+    
+    def merge_course_data(self, existing_courses, schedule_courses):
+        """Merge existing course data with new schedule information
         
+        Schedule fields come from the scrape; descriptions and other stored
+        fields are kept. The added/removed/changed report is left on
+        self.last_merge_report.
+        """
+        merged, self.last_merge_report = merge_sections(existing_courses, schedule_courses)
         return merged
 
 def list_departments(data_dir):
@@ -377,20 +498,19 @@ def list_semesters(data_dir):
         return
     
     semesters = []
-    for folder in os.listdir(semesters_dir):
-        if os.path.isdir(os.path.join(semesters_dir, folder)):
-            # Convert folder name like "25_FA" to readable format
-            if '_' in folder:
-                year_part, season_part = folder.split('_', 1)
-                season_map = {
-                    'FA': 'Fall', 'SP': 'Spring', 'SU': 'Summer', 'WI': 'Winter'
-                }
-                full_season = season_map.get(season_part, season_part)
-                full_year = f"20{year_part}" if len(year_part) == 2 else year_part
-                display = f"{full_season} {full_year}"
-            else:
-                display = folder
-            semesters.append((folder, display))
+    for folder in get_semester_registry(data_dir).semester_codes():
+        # Convert folder name like "25_FA" to readable format
+        if '_' in folder:
+            year_part, season_part = folder.split('_', 1)
+            season_map = {
+                'FA': 'Fall', 'SP': 'Spring', 'SU': 'Summer', 'WI': 'Winter'
+            }
+            full_season = season_map.get(season_part, season_part)
+            full_year = f"20{year_part}" if len(year_part) == 2 else year_part
+            display = f"{full_season} {full_year}"
+        else:
+            display = folder
+        semesters.append((folder, display))
     
     semesters.sort(key=lambda x: x[0])
     
@@ -493,7 +613,8 @@ TIPS:
 • Run descriptions first, then schedules to get complete data
 • Use --stats to monitor progress and data completeness
 • Schedule scraping requires active semester to be available online
-• Process is respectful with 1-second delays between requests
+• Requests are rate limited per host (--rate-limit, default 2/sec)
+• Pages are cached in ./data/.http_cache; unchanged pages are skipped (--force to rewrite)
 
 Need more help? Run: python scrape_descriptions.py --help
     """)
@@ -545,6 +666,20 @@ Output:
     parser.add_argument('--output-dir', '-o', metavar='DIR',
                        default='./data',
                        help='Directory containing data files (default: ./data)')
+    parser.add_argument('--workers', '-w', type=int, default=4,
+                       help='Concurrent catalog fetches when scraping all departments (default: 4)')
+    parser.add_argument('--rate-limit', type=float, default=2.0,
+                       help='Requests per second allowed per host, 0 to disable (default: 2.0)')
+    parser.add_argument('--parse-processes', type=int, default=None,
+                       help='Processes used to parse catalog pages, 0 to parse inline (default: CPU count)')
+    parser.add_argument('--cache-dir', metavar='DIR',
+                       help='HTTP cache directory (default: <output-dir>/.http_cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always download pages in full instead of sending conditional requests')
+    parser.add_argument('--force', action='store_true',
+                       help='Re-parse and rewrite output even if pages are unchanged')
+    parser.add_argument('--parser-backend', choices=BACKENDS,
+                       help='Row extractor for schedule pages (default: lxml if installed, else html.parser)')
     
     # Information options
     parser.add_argument('--list-departments', action='store_true',
@@ -586,9 +721,16 @@ Output:
             parser.print_help()
             return
     
+    cache = None
+    if not args.no_cache:
+        cache = HTTPCache(args.cache_dir or os.path.join(args.output_dir, DEFAULT_CACHE_DIRNAME))
+    transport = ScrapeTransport(max_workers=args.workers, rate_limit=args.rate_limit, cache=cache)
+    writer = AtomicWriter(manifest_path=os.path.join(args.output_dir, CHANGE_MANIFEST_NAME))
+    
     if args.schedules:
         # Use schedule scraper
-        schedule_scraper = CourseScheduleScraper(args.output_dir)
+        schedule_scraper = CourseScheduleScraper(args.output_dir, transport=transport, force=args.force,
+                                                 parser_backend=args.parser_backend, writer=writer)
         
         if args.semester:
             schedule_scraper.scrape_semester_schedule(args.semester)
@@ -606,12 +748,12 @@ Output:
                 print(f"\nSchedule scraping complete! Successfully processed {successful}/{total} semesters")
     else:
         # Use existing description scraper
-        scraper = CourseDescriptionScraper(args.output_dir)
+        scraper = CourseDescriptionScraper(args.output_dir, transport=transport, force=args.force, writer=writer)
         
         if args.department:
             scraper.scrape_department_courses(args.department.upper())
         else:
-            scraper.scrape_all_departments()
+            scraper.scrape_all_departments(workers=args.workers, parse_processes=args.parse_processes)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
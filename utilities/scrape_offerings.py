@@ -5,17 +5,33 @@ CLI tool for scraping course offerings from Niagara University
 """
 
 import argparse
+import os
 from utilities.course_scraper import CourseScraperCLI
+from core.file_writer import AtomicWriter, CHANGE_MANIFEST_NAME
+from utilities.http_cache import HTTPCache, DEFAULT_CACHE_DIRNAME
+from utilities.http_transport import ScrapeTransport
+from utilities.row_extractor import BACKENDS
 
 
 def parse_args(args=None):
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Scrape course offerings from Niagara University')
     
-    parser.add_argument('--semester', required=True, help='Semester code (e.g., 25/FA)')
+    parser.add_argument('--semester', required=True,
+                        help='Semester code (e.g., 25/FA), or several separated by commas (e.g., 25/SU,25/FA)')
     parser.add_argument('--ug', action='store_true', help='Include undergraduate courses')
     parser.add_argument('--grad', action='store_true', help='Include graduate courses')
     parser.add_argument('--output-dir', default='/data', help='Directory to save JSON files (default: /data)')
+    parser.add_argument('--workers', type=int, default=4, help='Maximum concurrent requests (default: 4)')
+    parser.add_argument('--rate-limit', type=float, default=2.0,
+                        help='Requests per second allowed per host, 0 to disable (default: 2.0)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Read timeout in seconds (default: 30)')
+    parser.add_argument('--retries', type=int, default=3, help='Retries for failed requests (default: 3)')
+    parser.add_argument('--cache-dir', help='HTTP cache directory (default: <output-dir>/.http_cache)')
+    parser.add_argument('--no-cache', action='store_true', help='Always download pages in full')
+    parser.add_argument('--force', action='store_true', help='Re-parse and rewrite output even if pages are unchanged')
+    parser.add_argument('--parser-backend', choices=BACKENDS,
+                        help='Row extractor (default: lxml if installed, else html.parser)')
     
     if args is None:
         return parser.parse_args()
@@ -27,13 +43,35 @@ def main(args=None):
     """Main CLI function"""
     parsed_args = parse_args(args)
     
-    scraper = CourseScraperCLI()
-    scraper.scrape_courses(
-        semester=parsed_args.semester,
-        ug=parsed_args.ug,
-        grad=parsed_args.grad,
-        output_dir=parsed_args.output_dir
+    cache = None
+    if not parsed_args.no_cache:
+        cache = HTTPCache(parsed_args.cache_dir or os.path.join(parsed_args.output_dir, DEFAULT_CACHE_DIRNAME))
+    transport = ScrapeTransport(
+        max_workers=parsed_args.workers,
+        timeout=(5, parsed_args.timeout),
+        retries=parsed_args.retries,
+        rate_limit=parsed_args.rate_limit,
+        cache=cache
     )
+    writer = AtomicWriter(manifest_path=os.path.join(parsed_args.output_dir, CHANGE_MANIFEST_NAME))
+    scraper = CourseScraperCLI(transport=transport, force=parsed_args.force,
+                               parser_backend=parsed_args.parser_backend, writer=writer)
+    semesters = [s.strip() for s in parsed_args.semester.split(',') if s.strip()]
+    
+    if len(semesters) == 1:
+        scraper.scrape_courses(
+            semester=semesters[0],
+            ug=parsed_args.ug,
+            grad=parsed_args.grad,
+            output_dir=parsed_args.output_dir
+        )
+    else:
+        scraper.scrape_semesters(
+            semesters,
+            ug=parsed_args.ug,
+            grad=parsed_args.grad,
+            output_dir=parsed_args.output_dir
+        )
 
 
 if __name__ == '__main__':
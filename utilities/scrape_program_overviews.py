@@ -4,18 +4,25 @@
 Scrape program overviews from Niagara University programs pages
 """
 
+import argparse
 import requests
 from bs4 import BeautifulSoup
 import json
-import time
 import os
+import sys
 
-def get_program_links(base_url):
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.file_writer import AtomicWriter, CHANGE_MANIFEST_NAME
+from utilities.http_cache import HTTPCache, DEFAULT_CACHE_DIRNAME
+from utilities.http_transport import ScrapeTransport
+
+def get_program_links(base_url, transport=None):
     """Scrape all program links from the programs page"""
-    response = requests.get(base_url)
-    response.raise_for_status()
+    transport = transport or ScrapeTransport()
+    html = transport.get(base_url).text
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
     program_links = []
     
     # Find all program links - adjust selector based on page structure
@@ -45,79 +52,209 @@ def get_program_links(base_url):
     
     return unique_programs
 
-def extract_program_overview(program_url):
+def extract_program_overview(program_url, transport=None):
     """Extract Program Overview content from a program page"""
+    transport = transport or ScrapeTransport()
     try:
-        response = requests.get(program_url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find H2 tag with "Program Overview"
-        overview_heading = soup.find('h2', string='Program Overview')
-        if not overview_heading:
-            # Try case-insensitive search
-            overview_heading = soup.find('h2', string=lambda text: text and 'program overview' in text.lower())
-        
-        if not overview_heading:
-            return None
-        
-        # Extract text following the heading
-        overview_text = []
-        current_element = overview_heading.find_next_sibling()
-        
-        while current_element:
-            # Stop at next heading
-            if current_element.name and current_element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                break
-                
-            # Extract text from paragraphs
-            if current_element.name == 'p':
-                text = current_element.get_text().strip()
-                # Skip paragraphs starting with "Credits"
-                if text and not text.lower().startswith('credits'):
-                    overview_text.append(text)
-            
-            current_element = current_element.find_next_sibling()
-        
-        return '\n\n'.join(overview_text) if overview_text else None
-        
+        return parse_program_overview(transport.get(program_url).text)
     except requests.RequestException as e:
         print(f"Error fetching {program_url}: {e}")
         return None
 
-def main():
-    base_url = "https://www.niagara.edu/programs/"
-    output_file = "data/program_overviews.json"
+def parse_program_overview(html):
+    """Extract Program Overview text from program page HTML"""
+    soup = BeautifulSoup(html, 'html.parser')
     
-    print("Fetching program links...")
-    programs = get_program_links(base_url)
-    print(f"Found {len(programs)} programs")
+    # Find H2 tag with "Program Overview"
+    overview_heading = soup.find('h2', string='Program Overview')
+    if not overview_heading:
+        # Try case-insensitive search
+        overview_heading = soup.find('h2', string=lambda text: text and 'program overview' in text.lower())
     
-    program_overviews = {}
+    if not overview_heading:
+        return None
+    
+    # Extract text following the heading
+    overview_text = []
+    current_element = overview_heading.find_next_sibling()
+    
+    while current_element:
+        # Stop at next heading
+        if current_element.name and current_element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            break
+            
+        # Extract text from paragraphs
+        if current_element.name == 'p':
+            text = current_element.get_text().strip()
+            # Skip paragraphs starting with "Credits"
+            if text and not text.lower().startswith('credits'):
+                overview_text.append(text)
+        
+        current_element = current_element.find_next_sibling()
+    
+    return '\n\n'.join(overview_text) if overview_text else None
+
+def load_previous_overviews(output_file):
+    """Load the previous run's output, or an empty dict"""
+    try:
+        with open(output_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def checkpoint_path(output_file):
+    """Checkpoint kept next to the output ('data/.program_overviews.checkpoint')"""
+    directory, name = os.path.split(output_file)
+    return os.path.join(directory, f".{os.path.splitext(name)[0]}.checkpoint")
+
+class OverviewCheckpoint:
+    """Append-only record of program pages finished in the current run
+    
+    One JSON line per completed page is flushed as soon as it is parsed, so
+    an interrupted run keeps everything fetched so far and resumes with the
+    remaining URLs. The file is removed once the final output is written.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+    
+    def load(self):
+        """Completed pages as {url: {'name', 'url', 'overview', 'changed'}}"""
+        completed = {}
+        try:
+            with open(self.path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line from an interrupted write
+                    completed[record['url']] = record
+        except OSError:
+            pass
+        return completed
+    
+    def record(self, entry):
+        """Durably append one completed page"""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
     
-    for i, program in enumerate(programs):
-        print(f"Processing {i+1}/{len(programs)}: {program['name']}")
+    def clear(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def scrape_program_overviews(programs, transport, previous=None, force=False, checkpoint=None, workers=None):
+    """Fetch overviews for programs, reusing previous results for unchanged pages
+    
+    Pages are fetched concurrently (at most workers, default the transport's
+    max_workers) and each result is appended to checkpoint as it completes.
+    URLs already in checkpoint are not fetched again.
+    
+    Returns (program_overviews, changed) where changed counts pages that had
+    to be parsed again. Overviews keep the order of programs.
+    """
+    previous = previous or {}
+    completed = checkpoint.load() if checkpoint else {}
+    by_url = {program['url']: program for program in programs}
+    pending = [url for url in by_url if url not in completed]
+    if completed:
+        print(f"Resuming: {len(by_url) - len(pending)} of {len(by_url)} programs already done")
+    
+    for done, (url, result) in enumerate(transport.iter_fetch(pending, max_workers=workers), 1):
+        program = by_url[url]
+        print(f"Processed {done}/{len(pending)}: {program['name']}")
+        if isinstance(result, Exception):
+            print(f"Error fetching {url}: {result}")
+            continue
         
-        overview = extract_program_overview(program['url'])
-        if overview:
-            program_overviews[program['name']] = {
-                'url': program['url'],
-                'overview': overview
-            }
-            print(f"  ✓ Found overview")
+        prior = previous.get(program['name'])
+        if result.unchanged and not force and prior and prior.get('url') == url:
+            entry = {'name': program['name'], 'url': url, 'overview': prior.get('overview'), 'changed': False}
+            print(f"  = Unchanged")
         else:
-            print(f"  - No overview found")
+            entry = {'name': program['name'], 'url': url,
+                     'overview': parse_program_overview(result.text), 'changed': True}
+            print(f"  ✓ Found overview" if entry['overview'] else f"  - No overview found")
         
-        # Be respectful with requests
-        time.sleep(0.5)
+        completed[url] = entry
+        if checkpoint:
+            checkpoint.record(entry)
+    
+    program_overviews = {}
+    changed = 0
+    for url, program in by_url.items():
+        entry = completed.get(url)
+        if not entry:
+            # Fetch failed: keep last run's overview rather than dropping it
+            if program['name'] in previous:
+                program_overviews[program['name']] = previous[program['name']]
+            continue
+        changed += entry.get('changed', True)
+        if entry.get('overview'):
+            program_overviews[program['name']] = {'url': url, 'overview': entry['overview']}
+    
+    return program_overviews, changed
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Scrape program overviews from Niagara University')
+    parser.add_argument('--output-file', default='data/program_overviews.json',
+                        help='Output JSON file (default: data/program_overviews.json)')
+    parser.add_argument('--cache-dir', help='HTTP cache directory (default: data/.http_cache)')
+    parser.add_argument('--no-cache', action='store_true', help='Always download pages in full')
+    parser.add_argument('--force', action='store_true', help='Re-parse every page and rewrite output')
+    parser.add_argument('--rate-limit', type=float, default=2.0,
+                        help='Requests per second allowed per host (default: 2.0)')
+    parser.add_argument('--workers', '-w', type=int, default=4,
+                        help='Concurrent page fetches (default: 4)')
+    parser.add_argument('--restart', action='store_true',
+                        help='Ignore the checkpoint of an interrupted run and start over')
+    args = parser.parse_args(args)
+    
+    base_url = "https://www.niagara.edu/programs/"
+    output_file = args.output_file
+    
+    cache = None
+    if not args.no_cache:
+        cache = HTTPCache(args.cache_dir or os.path.join(os.path.dirname(output_file) or '.', DEFAULT_CACHE_DIRNAME))
+    transport = ScrapeTransport(max_workers=args.workers, rate_limit=args.rate_limit, cache=cache)
+    
+    print("Fetching program links...")
+    programs = get_program_links(base_url, transport)
+    print(f"Found {len(programs)} programs")
+    
+    previous = load_previous_overviews(output_file)
+    checkpoint = OverviewCheckpoint(checkpoint_path(output_file))
+    if args.restart:
+        checkpoint.clear()
+    try:
+        program_overviews, changed = scrape_program_overviews(programs, transport, previous, args.force, checkpoint)
+    finally:
+        checkpoint.close()
+    
+    # Save results only if something changed
+    if program_overviews == previous and not args.force:
+        checkpoint.clear()
+        print(f"\nComplete! No changes; {output_file} left untouched")
+        return
     
-    # Save results
-    with open(output_file, 'w') as f:
-        json.dump(program_overviews, f, indent=2)
+    writer = AtomicWriter(manifest_path=os.path.join(os.path.dirname(output_file) or '.', CHANGE_MANIFEST_NAME))
+    writer.write_json(output_file, program_overviews, indent=2)
+    checkpoint.clear()
     
-    print(f"\nComplete! Found overviews for {len(program_overviews)} programs")
+    print(f"\nComplete! Found overviews for {len(program_overviews)} programs ({changed} pages re-parsed)")
     print(f"Results saved to {output_file}")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()